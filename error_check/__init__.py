@@ -0,0 +1,26 @@
+"""
+error_check 모듈: 확정급여채무평가 명부검증 자동화 (에러체크 파일 옮기기 + 작성요청 파일 검증)
+
+사용 예:
+    from error_check import 명부검증_실행, 평가설정
+    명부검증_실행("A사_확정급여채무평가_작성자료.xlsx", "A사 error check.xlsx",
+               평가설정("20240101", "20241231", 60))
+
+여러 고객사를 한 번에 처리할 때는 `python -m error_check manifest.csv`
+"""
+
+from .files import 명부검증오류, 파일_찾기
+from .runner import 결과_파일명, 명부검증_실행
+from .settings import 평가설정
+from .validation import 검증_수행, 검증결과_저장, 검증결과_파일명
+
+__all__ = [
+    "명부검증오류",
+    "파일_찾기",
+    "결과_파일명",
+    "명부검증_실행",
+    "평가설정",
+    "검증_수행",
+    "검증결과_저장",
+    "검증결과_파일명",
+]
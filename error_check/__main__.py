@@ -0,0 +1,9 @@
+"""python -m error_check 실행 엔트리 포인트"""
+
+import sys
+
+from .cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
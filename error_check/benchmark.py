@@ -0,0 +1,165 @@
+"""
+날짜 변환 벤치마크
+재직자 명부에 나오는 형식(yyyymmdd 숫자, serial number, 날짜 문자열, datetime, 빈 값)을 섞은 합성 열을 크기별로 만들어
+excel_날짜변환/생년월일_연도_수정을 값마다 호출하는 방식과 배열 버전의 소요 시간을 비교하고 결과가 같은지 확인
+
+사용 예:
+    python -m error_check.benchmark --sizes 10000 100000
+    python -m error_check.benchmark --sizes 100000 --distinct 500   (반복 값이 많은 명부)
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from .dates import _문자열_일수, excel_날짜변환, excel_날짜변환_배열, 생년월일_연도_수정, 생년월일_연도_수정_배열
+
+
+def parse_args(argv=None):
+    """
+    명령행 인자 파싱
+
+    Returns:
+        파싱된 인자 (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(prog="python -m error_check.benchmark",
+                                     description="날짜 변환 값 단위/배열 버전 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                        help="합성 열의 행 수 목록 (기본값: 10000 100000)")
+    parser.add_argument("--distinct", type=int, default=0,
+                        help="서로 다른 값의 수 (0이면 행마다 새 값, 기본값: 0)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="크기별 측정 반복 횟수 (가장 짧은 시간 사용, 기본값: 3)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="합성 데이터 무작위 값 시드 (기본값: 0)")
+    return parser.parse_args(argv)
+
+
+def 합성_셀값(rng: random.Random) -> Any:
+    """재직자 명부 날짜 열에 나오는 셀 값 하나 (잘못 입력된 연도와 날짜가 아닌 값 포함)"""
+    연도 = rng.choice([rng.randint(1955, 2005), 1901, 1903, 2070, rng.randint(2101, 2199)])
+    월, 일 = rng.randint(1, 12), rng.randint(1, 28)
+    종류 = rng.randrange(8)
+    if 종류 == 0:
+        return 연도 * 10000 + 월 * 100 + 일
+    if 종류 == 1:
+        return float(rng.randint(20000, 45000))
+    if 종류 == 2:
+        return f"{연도}-{월:02d}-{일:02d}"
+    if 종류 == 3:
+        return f"{연도}.{월:02d}.{일:02d}"
+    if 종류 == 4:
+        return f"{연도}{월:02d}{일:02d}"
+    if 종류 == 5:
+        return datetime(연도, 월, 일)
+    if 종류 == 6:
+        return rng.choice([None, "", "-", "미정"])
+    return f"{연도}/{월}/{일}"
+
+
+def 합성_열(행수: int, 고유값_수: int, seed: int) -> List[Any]:
+    """합성 날짜 열 (고유값_수가 0보다 크면 그 수만큼의 값을 반복)"""
+    rng = random.Random(seed)
+    if 고유값_수 <= 0:
+        return [합성_셀값(rng) for _ in range(행수)]
+    후보 = [합성_셀값(rng) for _ in range(고유값_수)]
+    return [rng.choice(후보) for _ in range(행수)]
+
+
+def _값_단위_변환(값: List[Any]) -> List[Any]:
+    결과 = []
+    for v in 값:
+        try:
+            결과.append(excel_날짜변환(v))
+        except Exception:
+            결과.append(None)
+    return 결과
+
+
+def _같은_결과(값_단위: List[Any], 배열: np.ndarray) -> bool:
+    for a, b in zip(값_단위, 배열):
+        if a is None or a != a:
+            if b == b:
+                return False
+        elif a != b:
+            return False
+    return len(값_단위) == len(배열)
+
+
+def _측정(함수: Callable[[], Any], 반복: int):
+    최소 = float("inf")
+    for _ in range(반복):
+        시작 = time.perf_counter()
+        결과 = 함수()
+        최소 = min(최소, time.perf_counter() - 시작)
+    return 결과, 최소
+
+
+def run_size(args, 행수: int) -> Dict[str, Any]:
+    """
+    합성 열 하나로 값 단위/배열 버전 측정
+
+    Returns:
+        {"행수", "변환", "연도수정"} (항목별 {"값_단위", "배열", "같음"})
+    """
+    값 = 합성_열(행수, args.distinct, args.seed)
+
+    변환_값, 변환_시간 = _측정(lambda: _값_단위_변환(값), args.repeat)
+
+    def 배열_변환():
+        _문자열_일수.cache_clear()  # 반복 측정 사이에 문자열 메모가 남지 않도록
+        return excel_날짜변환_배열(값)
+
+    변환_배열, 변환_배열_시간 = _측정(배열_변환, args.repeat)
+
+    날짜_숫자 = [v for v in 변환_값 if v is not None]
+    수정_값, 수정_시간 = _측정(lambda: [생년월일_연도_수정(v) for v in 날짜_숫자], args.repeat)
+    수정_배열, 수정_배열_시간 = _측정(lambda: 생년월일_연도_수정_배열(날짜_숫자), args.repeat)
+
+    return {
+        "행수": 행수,
+        "변환": {"값_단위": 변환_시간, "배열": 변환_배열_시간, "같음": _같은_결과(변환_값, 변환_배열)},
+        "연도수정": {"값_단위": 수정_시간, "배열": 수정_배열_시간, "같음": _같은_결과(수정_값, 수정_배열)},
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    """측정 결과를 표로 출력"""
+    header = (f"{'행 수':>10} {'항목':>8} {'값 단위(초)':>12} {'배열(초)':>10} {'배속':>8} {'결과 일치':>9}")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        for 항목 in ("변환", "연도수정"):
+            측정 = r[항목]
+            배속 = 측정["값_단위"] / 측정["배열"] if 측정["배열"] else float("inf")
+            print(f"{r['행수']:>10} {항목:>8} {측정['값_단위']:>12.3f} {측정['배열']:>10.3f} "
+                  f"{배속:>7.1f}x {'✓' if 측정['같음'] else '✗':>9}")
+
+
+def main(argv=None) -> int:
+    """크기별 벤치마크 실행 후 표 출력 (결과가 다르면 1 반환)"""
+    args = parse_args(argv)
+    고유값 = args.distinct if args.distinct > 0 else "행마다 새 값"
+    print("=" * 60)
+    print(f"날짜 변환 벤치마크 (크기: {args.sizes}, 고유값: {고유값})")
+    print("=" * 60)
+
+    results = []
+    for 행수 in args.sizes:
+        print(f"\n[{행수}행] 측정 중...")
+        results.append(run_size(args, 행수))
+
+    print("\n" + "=" * 60)
+    print_table(results)
+    if not all(r[항목]["같음"] for r in results for 항목 in ("변환", "연도수정")):
+        print("\n⚠ 배열 버전 결과가 값 단위 결과와 다릅니다")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
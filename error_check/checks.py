@@ -0,0 +1,296 @@
+"""
+재직자 명부 열 단위 검증
+검증에 쓰는 열을 한 번씩만 변환하고(날짜는 datetime64), 검증 항목별 조건을 불리언 마스크로 계산하여
+생년월일 이상값, 정년초과자 차년도 누락, 중간정산액 누락, 기준급여/당년도 차이, 임원/계약직 차년도 누락 발견 사항 생성
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .dates import excel_날짜변환_배열, serial_to_datetime_배열
+from .settings import 평가설정
+
+
+# 날짜 배열 단위 (datetime 객체의 연도 범위 1~9999를 모두 표현)
+날짜_단위 = "datetime64[us]"
+
+# 차년도 퇴직금추계액이 필수인 종업원구분 (임원 3, 계약직 4)
+차년도_필수_구분 = (3, 4)
+
+기준급여_차이_기준 = 5  # %
+
+
+def 재직자_컬럼_찾기(재직자_df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    재직자 명부 헤더에서 검증에 쓰는 컬럼 찾기 (같은 조건에 여러 컬럼이 맞으면 마지막 컬럼)
+
+    Returns:
+        {"생년월일", "기준급여", "당년도", "차년도", "종업원구분", "중간정산기준일", "중간정산액", "입사일자"}
+        → 컬럼명 (없으면 None)
+    """
+    컬럼 = dict.fromkeys(["생년월일", "기준급여", "당년도", "차년도", "종업원구분",
+                        "중간정산기준일", "중간정산액", "입사일자"])
+    for col in 재직자_df.columns:
+        col_str = str(col)
+        if "생년월일" in col_str:
+            컬럼["생년월일"] = col
+        if "기준급여" in col_str and "차" not in col_str:
+            컬럼["기준급여"] = col
+        if "당년도" in col_str and "퇴직금" in col_str:
+            컬럼["당년도"] = col
+        if "차년도" in col_str and "퇴직금" in col_str:
+            컬럼["차년도"] = col
+        if ("종업원" in col_str or "직원" in col_str) and "구분" in col_str:
+            컬럼["종업원구분"] = col
+        if "중간정산기준일" in col_str or ("중간정산" in col_str and "일" in col_str):
+            컬럼["중간정산기준일"] = col
+        if "중간정산액" in col_str:
+            컬럼["중간정산액"] = col
+        if "입사일자" in col_str:
+            컬럼["입사일자"] = col
+    return 컬럼
+
+
+def 사원번호_컬럼_찾기(df: pd.DataFrame) -> Optional[Any]:
+    """헤더에 "사원번호"가 포함된 첫 컬럼"""
+    for col in df.columns:
+        if "사원번호" in str(col):
+            return col
+    return None
+
+
+def _날짜인지(값: np.ndarray) -> np.ndarray:
+    """datetime/Timestamp 값 마스크"""
+    if 값.dtype.kind == "M":
+        return ~pd.isna(값)
+    if 값.dtype != object:
+        return np.zeros(len(값), dtype=bool)
+    return np.fromiter((isinstance(v, (datetime, pd.Timestamp)) for v in 값), dtype=bool, count=len(값))
+
+
+def 날짜_배열(값: np.ndarray, 날짜인지: np.ndarray) -> np.ndarray:
+    """
+    셀 값 배열을 datetime64 배열로 변환 (datetime은 그대로, 나머지는 Excel 날짜로 해석, 변환할 수 없으면 NaT)
+
+    Args:
+        값: 셀 값 배열
+        날짜인지: _날짜인지() 마스크
+
+    Returns:
+        날짜_단위 배열
+    """
+    if 값.dtype.kind == "M":
+        return 값.astype(날짜_단위)
+    결과 = np.full(len(값), np.datetime64("NaT"), dtype=날짜_단위)
+    if 값.dtype.kind in "iu":
+        # 모든 열이 정수인 DataFrame의 numpy 정수 값은 excel_날짜변환()이 날짜로 보지 않음
+        return 결과
+    날짜인지 = 날짜인지 & ~pd.isna(값)  # NaT 제외
+    if 날짜인지.any():
+        결과[날짜인지] = np.array(list(값[날짜인지]), dtype=날짜_단위)
+
+    나머지 = np.flatnonzero(~날짜인지)
+    날짜_숫자 = excel_날짜변환_배열(값[나머지])
+    날짜_숫자[날짜_숫자 == 0] = np.nan  # serial number 0은 날짜 없음으로 처리
+    결과[나머지] = serial_to_datetime_배열(날짜_숫자)
+    return 결과
+
+
+class 재직자_열:
+    """
+    검증에 쓰는 재직자 명부 열
+
+    원본 값은 iterrows()로 읽은 행 값과 같은 값(DataFrame.to_numpy())이므로
+    발견 사항의 사원번호, 구분 등은 행 단위 검증과 같은 형식으로 표시됩니다.
+    """
+
+    def __init__(self, 재직자_df: pd.DataFrame):
+        self._값 = 재직자_df.to_numpy()
+        self._위치 = {col: i for i, col in enumerate(재직자_df.columns)}
+        self._결측: Dict[Any, np.ndarray] = {}
+        self._날짜인지: Dict[Any, np.ndarray] = {}
+        self._날짜: Dict[Any, np.ndarray] = {}
+        self.행수 = len(재직자_df)
+
+    def 값(self, col) -> np.ndarray:
+        return self._값[:, self._위치[col]]
+
+    def 결측(self, col) -> np.ndarray:
+        if col not in self._결측:
+            self._결측[col] = np.asarray(pd.isna(self.값(col)), dtype=bool)
+        return self._결측[col]
+
+    def 날짜인지(self, col) -> np.ndarray:
+        if col not in self._날짜인지:
+            self._날짜인지[col] = _날짜인지(self.값(col))
+        return self._날짜인지[col]
+
+    def 날짜(self, col) -> np.ndarray:
+        """열을 한 번만 datetime64로 변환"""
+        if col not in self._날짜:
+            self._날짜[col] = 날짜_배열(self.값(col), self.날짜인지(col))
+        return self._날짜[col]
+
+
+def _연도(날짜: np.ndarray) -> np.ndarray:
+    return 날짜.astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def _yyyymmdd(날짜: np.ndarray) -> List[str]:
+    return [텍스트.replace("-", "") for 텍스트 in np.datetime_as_string(날짜, unit="D")]
+
+
+def _생년월일_이상(열: 재직자_열, 컬럼: Dict[str, Any], 사원번호_컬럼, 검증_결과, 검증_요약) -> None:
+    생년월일_컬럼 = 컬럼["생년월일"]
+    사원번호 = 열.값(사원번호_컬럼)
+    날짜 = 열.날짜(생년월일_컬럼)
+    대상 = ~열.결측(생년월일_컬럼) & ~열.결측(사원번호_컬럼) & 열.날짜인지(생년월일_컬럼)
+    연도 = np.where(대상, _연도(np.where(대상, 날짜, np.datetime64(0, "us"))), 0)
+    이상 = 대상 & ((연도 < 1900) | (연도 > 2100))
+    for i in np.flatnonzero(이상):
+        검증_결과.append({
+            "유형": "생년월일 이상",
+            "시트": "재직자명부",
+            "사원번호": 사원번호[i],
+            "내용": f"생년월일 연도 이상: {연도[i]}년"
+        })
+
+
+def _정년초과자(열: 재직자_열, 컬럼: Dict[str, Any], 사원번호_컬럼, 설정: 평가설정, 검증_결과, 검증_요약) -> None:
+    생년월일_컬럼, 차년도_컬럼 = 컬럼["생년월일"], 컬럼["차년도"]
+    사원번호 = 열.값(사원번호_컬럼)
+    생년월일 = 열.날짜(생년월일_컬럼)
+    대상 = ~열.결측(생년월일_컬럼) & ~열.결측(사원번호_컬럼) & ~np.isnat(생년월일)
+
+    # 평가 종료일 기준 나이 (경과 일수 // 365)
+    평가기준일 = np.datetime64(설정.평가종료일_dt, "us")
+    경과_일수 = (평가기준일 - np.where(대상, 생년월일, 평가기준일)) // np.timedelta64(1, "D")
+    나이 = 경과_일수 // 365
+    초과 = 대상 & (나이 > 설정.정년연령)
+    누락 = 초과 & 열.결측(차년도_컬럼)
+
+    검증_요약["정년초과자_목록"].extend(
+        f"사원번호 {사원번호[i]} (나이: {나이[i]}세)" for i in np.flatnonzero(초과))
+    for i in np.flatnonzero(누락):
+        검증_결과.append({
+            "유형": "차년도 퇴직금추계액 누락 (정년초과자)",
+            "시트": "재직자명부",
+            "사원번호": 사원번호[i],
+            "내용": f"정년초과자(나이: {나이[i]}세)의 차년도 퇴직금추계액이 공란입니다"
+        })
+        검증_요약["정년초과자_차년도누락"].append(f"사원번호 {사원번호[i]} (나이: {나이[i]}세)")
+
+
+def _중간정산액_누락(열: 재직자_열, 컬럼: Dict[str, Any], 사원번호_컬럼, 설정: 평가설정, 검증_결과, 검증_요약) -> None:
+    기준일_컬럼, 정산액_컬럼 = 컬럼["중간정산기준일"], 컬럼["중간정산액"]
+    사원번호 = 열.값(사원번호_컬럼)
+    중간정산일 = 열.날짜(기준일_컬럼)
+    대상 = ~열.결측(기준일_컬럼) & ~열.결측(사원번호_컬럼) & ~np.isnat(중간정산일)
+
+    # 평가년도 내에 중간정산한 경우 중간정산액 필수
+    평가기간_내 = (대상
+               & (중간정산일 >= np.datetime64(설정.평가시작일_dt, "us"))
+               & (중간정산일 <= np.datetime64(설정.평가종료일_dt, "us")))
+    정산액 = 열.값(정산액_컬럼)
+    누락 = 평가기간_내 & (열.결측(정산액_컬럼) | np.asarray(정산액 == 0, dtype=bool))
+
+    날짜_텍스트 = _yyyymmdd(중간정산일[누락])
+    for i, 날짜 in zip(np.flatnonzero(누락), 날짜_텍스트):
+        검증_결과.append({
+            "유형": "중간정산액 누락",
+            "시트": "재직자명부",
+            "사원번호": 사원번호[i],
+            "내용": f"평가년도 내 중간정산자({날짜})인데 중간정산액이 없습니다"
+        })
+        검증_요약["중간정산액누락"].append(f"사원번호 {사원번호[i]} (중간정산일: {날짜})")
+
+
+def _기준급여_차이(열: 재직자_열, 컬럼: Dict[str, Any], 사원번호_컬럼, 검증_결과, 검증_요약) -> None:
+    기준급여_컬럼, 당년도_컬럼 = 컬럼["기준급여"], 컬럼["당년도"]
+    사원번호 = 열.값(사원번호_컬럼)
+    후보 = np.flatnonzero(~열.결측(기준급여_컬럼) & ~열.결측(당년도_컬럼) & ~열.결측(사원번호_컬럼))
+    기준급여 = 열.값(기준급여_컬럼)[후보].astype(float)
+    당년도 = 열.값(당년도_컬럼)[후보].astype(float)
+
+    양수 = 기준급여 > 0
+    차이율 = np.zeros(len(후보))
+    차이율[양수] = np.abs(당년도[양수] - 기준급여[양수]) / 기준급여[양수] * 100
+    차이 = 양수 & (차이율 >= 기준급여_차이_기준)
+
+    for i, 율 in zip(후보[차이], 차이율[차이]):
+        검증_결과.append({
+            "유형": "기준급여/당년도 차이 5% 이상",
+            "시트": "재직자명부",
+            "사원번호": 사원번호[i],
+            "내용": f"차이율: {율:.2f}%"
+        })
+        검증_요약["기준급여당년도차이"].append(f"사원번호 {사원번호[i]} (차이율: {율:.2f}%)")
+
+
+def _임원_계약직_차년도_누락(열: 재직자_열, 컬럼: Dict[str, Any], 사원번호_컬럼, 검증_결과, 검증_요약) -> None:
+    구분_컬럼, 차년도_컬럼 = 컬럼["종업원구분"], 컬럼["차년도"]
+    사원번호 = 열.값(사원번호_컬럼)
+    구분 = 열.값(구분_컬럼)
+    필수_구분 = np.zeros(열.행수, dtype=bool)
+    for 값 in 차년도_필수_구분:
+        필수_구분 |= np.asarray(구분 == 값, dtype=bool)
+    누락 = ~열.결측(구분_컬럼) & ~열.결측(사원번호_컬럼) & 필수_구분 & 열.결측(차년도_컬럼)
+
+    for i in np.flatnonzero(누락):
+        검증_결과.append({
+            "유형": "차년도 퇴직금추계액 누락 (임원/계약직)",
+            "시트": "재직자명부",
+            "사원번호": 사원번호[i],
+            "내용": f"임원/계약직({구분[i]})의 차년도 퇴직금추계액이 공란입니다"
+        })
+        검증_요약["차년도누락_임원계약직"].append(f"사원번호 {사원번호[i]} (구분: {구분[i]})")
+
+
+def 재직자_검증(재직자_df: pd.DataFrame, 설정: 평가설정, 검증_결과: List[Dict[str, Any]],
+              검증_요약: Dict[str, List[str]], 로그: Callable[[str], None] = print) -> None:
+    """
+    재직자 명부 검증 (생년월일 이상값, 정년초과자 차년도 누락, 중간정산액 누락,
+    기준급여/당년도 차이 5% 이상, 임원/계약직 차년도 누락)
+
+    검증 항목 순서대로, 항목 안에서는 행 순서대로 발견 사항을 추가합니다.
+
+    Args:
+        재직자_df: 재직자 명부 DataFrame (헤더 1행)
+        설정: 평가 설정
+        검증_결과: 발견 사항을 추가할 리스트
+        검증_요약: 요약 항목별 리스트
+        로그: 진행 메시지 출력 함수
+    """
+    사원번호_컬럼 = 사원번호_컬럼_찾기(재직자_df)
+    if 사원번호_컬럼:
+        재직자_df = 재직자_df[재직자_df[사원번호_컬럼].notna()]
+    컬럼 = 재직자_컬럼_찾기(재직자_df)
+    열 = 재직자_열(재직자_df)
+
+    # 2. 생년월일 이상값 체크
+    로그("   2) 생년월일 이상값 확인...")
+    if 컬럼["생년월일"] and 사원번호_컬럼:
+        _생년월일_이상(열, 컬럼, 사원번호_컬럼, 검증_결과, 검증_요약)
+
+    # 3. 정년초과자 확인 및 차년도 퇴직금추계액 체크 (평가 종료일 기준으로 나이 계산)
+    로그("   3) 정년초과자 차년도 퇴직금추계액 확인...")
+    if 컬럼["생년월일"] and 컬럼["차년도"] and 사원번호_컬럼:
+        _정년초과자(열, 컬럼, 사원번호_컬럼, 설정, 검증_결과, 검증_요약)
+
+    # 4. 중간정산액 확인 (평가년도 내에 중간정산한 경우 중간정산액 필수)
+    로그("   4) 중간정산액 확인...")
+    if 컬럼["중간정산기준일"] and 컬럼["중간정산액"] and 사원번호_컬럼:
+        _중간정산액_누락(열, 컬럼, 사원번호_컬럼, 설정, 검증_결과, 검증_요약)
+
+    # 5. 기준급여/당년도 차이 5% 이상 체크
+    로그("   5) 기준급여/당년도 차이 5% 이상 확인...")
+    if 컬럼["기준급여"] and 컬럼["당년도"] and 사원번호_컬럼:
+        _기준급여_차이(열, 컬럼, 사원번호_컬럼, 검증_결과, 검증_요약)
+
+    # 6. 차년도 퇴직금추계액 누락 체크 (임원(3), 계약직(4))
+    로그("   6) 차년도 퇴직금추계액 누락 확인 (임원, 계약직)...")
+    if 컬럼["차년도"] and 컬럼["종업원구분"] and 사원번호_컬럼:
+        _임원_계약직_차년도_누락(열, 컬럼, 사원번호_컬럼, 검증_결과, 검증_요약)
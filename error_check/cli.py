@@ -0,0 +1,215 @@
+"""
+명부검증 일괄 실행 CLI
+고객사 목록(manifest)의 작성요청/에러체크 파일 쌍을 프로세스 풀에서 한 번에 처리
+
+manifest 형식 (CSV 헤더 또는 JSON 객체 키):
+    작성요청_파일, 에러체크_파일 (필수)
+    평가시작일, 평가종료일, 정년연령, 출력_폴더, 이름 (선택)
+
+상대 경로는 manifest 파일 위치 기준입니다.
+"""
+
+import argparse
+import csv
+import json
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .runner import 명부검증_실행
+from .settings import 평가설정
+
+
+필수_항목 = ("작성요청_파일", "에러체크_파일")
+
+
+def _빈값(값) -> bool:
+    return 값 is None or str(값).strip() == ""
+
+
+def _경로(값, 기준_폴더: Path) -> Path:
+    경로 = Path(str(값).strip()).expanduser()
+    return 경로 if 경로.is_absolute() else 기준_폴더 / 경로
+
+
+def _manifest_행_읽기(manifest_파일: Path) -> List[Dict[str, Any]]:
+    if manifest_파일.suffix.lower() == ".json":
+        with open(manifest_파일, "r", encoding="utf-8") as f:
+            내용 = json.load(f)
+        if isinstance(내용, dict):
+            내용 = 내용.get("고객사", [])
+        if not isinstance(내용, list):
+            raise ValueError("JSON manifest는 고객사 객체 목록이어야 합니다.")
+        return 내용
+    with open(manifest_파일, "r", encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def manifest_읽기(manifest_파일) -> List[Dict[str, Any]]:
+    """
+    manifest 파일을 읽어 고객사별 작업 목록 생성
+
+    Args:
+        manifest_파일: CSV 또는 JSON manifest 경로
+
+    Returns:
+        작업 목록 [{"이름", "작성요청_파일", "에러체크_파일", "설정", "출력_폴더"}, ...]
+
+    Raises:
+        ValueError: 필수 항목이 없거나 설정값이 잘못되었거나 출력 폴더가 겹칠 때
+    """
+    manifest_파일 = Path(manifest_파일)
+    기준_폴더 = manifest_파일.resolve().parent
+    기본_설정 = 평가설정()
+
+    작업_목록 = []
+    for 번호, 행 in enumerate(_manifest_행_읽기(manifest_파일), 1):
+        누락 = [항목 for 항목 in 필수_항목 if _빈값(행.get(항목))]
+        if 누락:
+            raise ValueError(f"manifest {번호}번째 고객사: {', '.join(누락)} 항목이 없습니다.")
+
+        작성요청_파일 = _경로(행["작성요청_파일"], 기준_폴더)
+        에러체크_파일 = _경로(행["에러체크_파일"], 기준_폴더)
+        try:
+            설정 = 평가설정(
+                str(행.get("평가시작일") or 기본_설정.평가시작일),
+                str(행.get("평가종료일") or 기본_설정.평가종료일),
+                int(행.get("정년연령") or 기본_설정.정년연령),
+            ).검사()
+        except ValueError as e:
+            raise ValueError(f"manifest {번호}번째 고객사 설정 오류: {e}")
+
+        출력_폴더 = 에러체크_파일.parent if _빈값(행.get("출력_폴더")) else _경로(행["출력_폴더"], 기준_폴더)
+        작업_목록.append({
+            "이름": str(행.get("이름") or "").strip() or 에러체크_파일.stem,
+            "작성요청_파일": 작성요청_파일,
+            "에러체크_파일": 에러체크_파일,
+            "설정": 설정,
+            "출력_폴더": 출력_폴더,
+        })
+
+    # 검증결과 텍스트 파일명이 고정이므로 고객사마다 출력 폴더가 달라야 함
+    사용된_폴더: Dict[Path, str] = {}
+    for 작업 in 작업_목록:
+        폴더 = 작업["출력_폴더"].resolve()
+        if 폴더 in 사용된_폴더:
+            raise ValueError(
+                f"'{사용된_폴더[폴더]}'와 '{작업['이름']}'의 출력 폴더가 같습니다: {폴더} "
+                f"(검증결과 파일이 덮어써지므로 출력_폴더를 다르게 지정하세요)")
+        사용된_폴더[폴더] = 작업["이름"]
+
+    return 작업_목록
+
+
+def 고객사_실행(작업: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    고객사 한 곳 명부검증 (프로세스 풀 워커에서 실행)
+
+    진행 메시지는 모아서 결과와 함께 반환하므로 여러 고객사의 출력이 섞이지 않습니다.
+
+    Returns:
+        {"이름", "성공", "로그", "소요시간", "결과"(성공 시), "오류"(실패 시)}
+    """
+    로그_목록: List[str] = []
+    시작 = time.perf_counter()
+    결과: Dict[str, Any] = {"이름": 작업["이름"], "로그": 로그_목록}
+    try:
+        결과["결과"] = 명부검증_실행(
+            작업["작성요청_파일"], 작업["에러체크_파일"], 작업["설정"],
+            출력_폴더=작업["출력_폴더"], 로그=로그_목록.append)
+        결과["성공"] = True
+    except Exception as e:
+        로그_목록.append(f"\n✗ 오류 발생: {e}")
+        로그_목록.append(traceback.format_exc().rstrip())
+        결과["성공"] = False
+        결과["오류"] = str(e)
+    결과["소요시간"] = time.perf_counter() - 시작
+    return 결과
+
+
+def 일괄_실행(작업_목록: List[Dict[str, Any]], workers: int = 1, quiet: bool = False) -> List[Dict[str, Any]]:
+    """
+    여러 고객사 명부검증 실행
+
+    Args:
+        작업_목록: manifest_읽기() 결과
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 순서대로 실행)
+        quiet: True면 고객사별 진행 메시지를 출력하지 않음
+
+    Returns:
+        고객사별 실행 결과 (manifest 순서)
+    """
+    def 출력(결과):
+        상태 = "완료" if 결과["성공"] else "실패"
+        print(f"\n{'=' * 80}\n[{결과['이름']}] {상태} ({결과['소요시간']:.1f}초)\n{'=' * 80}")
+        if not quiet or not 결과["성공"]:
+            for 줄 in 결과["로그"]:
+                print(줄)
+
+    결과_목록: List[Optional[Dict[str, Any]]] = [None] * len(작업_목록)
+    if workers <= 1 or len(작업_목록) <= 1:
+        for i, 작업 in enumerate(작업_목록):
+            결과_목록[i] = 고객사_실행(작업)
+            출력(결과_목록[i])
+        return 결과_목록
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(작업_목록))) as executor:
+        futures = {executor.submit(고객사_실행, 작업): i for i, 작업 in enumerate(작업_목록)}
+        for future in as_completed(futures):
+            i = futures[future]
+            결과_목록[i] = future.result()
+            출력(결과_목록[i])
+    return 결과_목록
+
+
+def 요약_출력(결과_목록: List[Dict[str, Any]], 소요시간: float) -> None:
+    """고객사별 결과 요약 출력"""
+    print("\n" + "=" * 80)
+    print("명부검증 일괄 실행 결과")
+    print("=" * 80)
+    for 결과 in 결과_목록:
+        if 결과["성공"]:
+            내용 = 결과["결과"]
+            print(f"  ✓ {결과['이름']}: 재직자 {내용['복사_완료']}명, 퇴직자 {내용['퇴직자_수']}명, "
+                  f"검증 이슈 {내용['이슈_수']}건 → {내용['결과_파일']}")
+        else:
+            print(f"  ✗ {결과['이름']}: {결과['오류']}")
+    성공 = sum(1 for 결과 in 결과_목록 if 결과["성공"])
+    print(f"\n총 {len(결과_목록)}곳 중 {성공}곳 완료, {len(결과_목록) - 성공}곳 실패 ({소요시간:.1f}초)")
+
+
+def parse_args(argv=None):
+    """
+    명령행 인자 파싱
+
+    Returns:
+        파싱된 인자 (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(prog="python -m error_check",
+                                     description="여러 고객사 명부검증 자동화 일괄 실행")
+    parser.add_argument("manifest", help="고객사 목록 파일 (.csv 또는 .json)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="동시에 처리할 고객사 수 (워커 프로세스 수, 기본값: 1)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="성공한 고객사의 단계별 진행 메시지를 출력하지 않음")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        작업_목록 = manifest_읽기(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"✗ manifest 오류: {e}")
+        return 2
+    if not 작업_목록:
+        print("✗ manifest에 고객사가 없습니다.")
+        return 2
+
+    print(f"명부검증 일괄 실행: 고객사 {len(작업_목록)}곳, 워커 {max(1, args.workers)}개")
+    시작 = time.perf_counter()
+    결과_목록 = 일괄_실행(작업_목록, workers=args.workers, quiet=args.quiet)
+    요약_출력(결과_목록, time.perf_counter() - 시작)
+    return 0 if all(결과["성공"] for 결과 in 결과_목록) else 1
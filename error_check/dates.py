@@ -0,0 +1,306 @@
+"""
+날짜 변환
+작성요청 파일의 다양한 날짜 형식을 Excel 날짜 serial number와 yyyymmdd 텍스트로 변환
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# Excel 날짜 serial number 기준일
+EXCEL_기준일 = datetime(1899, 12, 30)
+
+
+def excel_날짜변환(날짜값):
+    """다양한 날짜 형식을 Excel 날짜 serial number로 변환"""
+    if pd.isna(날짜값) or 날짜값 == "":
+        return None
+
+    # 이미 숫자인 경우
+    if isinstance(날짜값, (int, float)):
+        # Excel serial number 범위
+        if 1 < 날짜값 < 100000:
+            return 날짜값
+        # YYYYMMDD 형식
+        elif len(str(int(날짜값))) == 8:
+            날짜_str = str(int(날짜값))
+            try:
+                dt = datetime(int(날짜_str[:4]), int(날짜_str[4:6]), int(날짜_str[6:8]))
+                return (dt - EXCEL_기준일).days
+            except:
+                return None
+
+    # datetime 객체
+    if isinstance(날짜값, (datetime, pd.Timestamp)):
+        return (날짜값 - EXCEL_기준일).days
+
+    # 문자열
+    if isinstance(날짜값, str):
+        날짜값 = 날짜값.strip()
+        try:
+            dt = pd.to_datetime(날짜값)
+            return (dt - EXCEL_기준일).days
+        except:
+            return None
+
+    return None
+
+
+def serial_to_datetime(날짜_숫자) -> datetime:
+    """Excel 날짜 serial number를 날짜로 변환 (소수점 이하는 버림)"""
+    return EXCEL_기준일 + pd.Timedelta(days=int(날짜_숫자))
+
+
+def 날짜_텍스트(날짜_숫자) -> str:
+    """
+    Excel 날짜 serial number를 yyyymmdd 형식 텍스트로 변환
+    (=TEXT(셀,"yyyymmdd") 수식과 같은 결과)
+    """
+    return serial_to_datetime(날짜_숫자).strftime("%Y%m%d")
+
+
+def 생년월일_연도_수정(날짜_숫자):
+    """생년월일 Excel serial number에서 연도 추출하여 이상값 수정"""
+    if 날짜_숫자 is None:
+        return None
+
+    try:
+        dt = serial_to_datetime(날짜_숫자)
+        연도 = dt.year
+
+        # 1901 → 2001
+        if 연도 == 1901:
+            수정된_dt = dt.replace(year=2001)
+            return excel_날짜변환(수정된_dt)
+
+        # 2070 → 1970
+        if 연도 == 2070:
+            수정된_dt = dt.replace(year=1970)
+            return excel_날짜변환(수정된_dt)
+
+        # 1900~1905 → +100년
+        if 1900 <= 연도 <= 1905:
+            수정된_dt = dt.replace(year=연도 + 100)
+            return excel_날짜변환(수정된_dt)
+
+        # 2100 이후 → 1900년대로 변환
+        if 연도 > 2100:
+            수정된_dt = dt.replace(year=1900 + (연도 % 100))
+            return excel_날짜변환(수정된_dt)
+
+        return 날짜_숫자
+    except:
+        return 날짜_숫자
+
+
+def 작성기준일_변환(작성기준일_값) -> str:
+    """
+    작성기준일 셀 값을 yyyymmdd 형식 문자열로 변환
+    ("2022.12.31" → "20221231", 20221231 → "20221231", datetime → "20221231")
+    """
+    if isinstance(작성기준일_값, str):
+        # 문자열인 경우: 점(.) 제거
+        return 작성기준일_값.replace(".", "").strip()
+    if isinstance(작성기준일_값, (int, float)):
+        # 숫자인 경우: yyyyMMdd 형식의 숫자로 변환 (예: 20221231)
+        return str(int(작성기준일_값))
+
+    # datetime 객체 등: yyyymmdd 형식으로 변환
+    날짜_숫자 = excel_날짜변환(작성기준일_값)
+    if 날짜_숫자:
+        return 날짜_텍스트(날짜_숫자)
+    return str(작성기준일_값).replace(".", "").strip()
+
+
+# ============================================================================
+# 배열 버전 (열 전체를 한 번에 변환)
+# ============================================================================
+_기준일_D = np.datetime64(EXCEL_기준일, "D")
+_기준일_us = np.datetime64(EXCEL_기준일, "us")
+
+# serial_to_datetime()이 변환할 수 있는 일수 범위 (pd.Timedelta 범위)
+_최대_일수 = pd.Timedelta.max.days
+
+# 셀 값 형식 분류
+_결측, _숫자, _날짜, _문자열, _기타 = range(5)
+_형식 = {int: _숫자, float: _숫자, bool: _숫자, np.float64: _숫자,
+        datetime: _날짜, pd.Timestamp: _날짜, str: _문자열}
+
+# 구분자가 같은 yyyy-mm-dd, yyyy.mm.dd, yyyy/mm/dd, yyyymmdd 문자열
+_연월일_패턴 = r"^(\d{4})([-./]?)(\d{2})\2(\d{2})$"
+
+
+def _객체_배열(값) -> np.ndarray:
+    if isinstance(값, pd.Series):
+        return 값.to_numpy(dtype=object)
+    if not isinstance(값, np.ndarray):
+        배열 = np.empty(len(값), dtype=object)
+        배열[:] = list(값)
+        return 배열
+    배열 = 값
+    if 배열.dtype.kind == "M":
+        return pd.Series(배열).to_numpy(dtype=object)
+    return 배열.astype(object) if 배열.dtype != object else 배열
+
+
+def _연월일_일수(연월일: np.ndarray) -> np.ndarray:
+    """yyyymmdd 정수 배열 → Excel serial number (없는 날짜는 NaN)"""
+    연, 월, 일 = 연월일 // 10000, 연월일 // 100 % 100, 연월일 % 100
+    유효 = (연 >= 1) & (연 <= 9999) & (월 >= 1) & (월 <= 12) & (일 >= 1) & (일 <= 31)
+    결과 = np.full(len(연월일), np.nan)
+    if not 유효.any():
+        return 결과
+    해당_월 = ((연[유효] - 1970) * 12 + 월[유효] - 1).astype("datetime64[M]")
+    날짜 = 해당_월.astype("datetime64[D]") + (일[유효] - 1)
+    있는_날짜 = 날짜.astype("datetime64[M]") == 해당_월  # 2월 30일 등은 다음 달로 넘어감
+    일수 = (날짜 - _기준일_D).astype(np.int64).astype(float)
+    결과[np.flatnonzero(유효)[있는_날짜]] = 일수[있는_날짜]
+    return 결과
+
+
+def _숫자_일수(숫자: np.ndarray) -> np.ndarray:
+    """숫자 배열 → Excel serial number (1~100000 사이는 그대로, 8자리 정수는 yyyymmdd)"""
+    결과 = np.full(len(숫자), np.nan)
+    유한 = np.isfinite(숫자)
+    serial = 유한 & (숫자 > 1) & (숫자 < 100000)
+    결과[serial] = 숫자[serial]
+    정수 = np.trunc(np.where(유한, 숫자, 0))
+    여덟자리 = 유한 & ~serial & (정수 >= 10_000_000) & (정수 < 100_000_000)  # 음수 8자리("-1234567")는 없는 날짜
+    결과[여덟자리] = _연월일_일수(정수[여덟자리].astype(np.int64))
+    return 결과
+
+
+def _날짜_일수(날짜값: np.ndarray) -> np.ndarray:
+    """datetime/Timestamp 객체 배열 → Excel serial number (시간대가 있으면 NaN)"""
+    결과 = np.full(len(날짜값), np.nan)
+    시간대_없음 = np.fromiter((v.tzinfo is None for v in 날짜값), dtype=bool, count=len(날짜값))
+    날짜 = np.array(list(날짜값[시간대_없음]), dtype="datetime64[us]")
+    결과[시간대_없음] = (날짜 - _기준일_us) // np.timedelta64(1, "D")
+    return 결과
+
+
+@lru_cache(maxsize=65536)
+def _문자열_일수(문자열: str) -> float:
+    """excel_날짜변환()으로 문자열 하나 변환 (같은 문자열은 한 번만 해석)"""
+    return _스칼라_일수(문자열)
+
+
+def _스칼라_일수(값) -> float:
+    try:
+        날짜_숫자 = excel_날짜변환(값)
+    except Exception:
+        return np.nan
+    return np.nan if 날짜_숫자 is None else float(날짜_숫자)
+
+
+def _문자열_배열_일수(문자열: np.ndarray) -> np.ndarray:
+    """문자열 배열 → Excel serial number (날짜 형식 문자열은 한 번에, 나머지는 고유값마다 한 번씩 해석)"""
+    고유값, 위치 = np.unique(np.array([s.strip() for s in 문자열], dtype=object), return_inverse=True)
+    일수 = np.full(len(고유값), np.nan)
+
+    연월일 = pd.Series(고유값, dtype=object).str.extract(_연월일_패턴)
+    형식_일치 = 연월일[0].notna().to_numpy()
+    if 형식_일치.any():
+        부분 = 연월일[형식_일치]
+        숫자 = (부분[0].astype(np.int64) * 10000 + 부분[2].astype(np.int64) * 100
+              + 부분[3].astype(np.int64)).to_numpy()
+        일수[형식_일치] = _연월일_일수(숫자)
+
+    # 날짜 형식이 아니거나 없는 날짜(pandas가 다르게 해석할 수 있음)는 excel_날짜변환()으로
+    for i in np.flatnonzero(np.isnan(일수)):
+        일수[i] = _문자열_일수(고유값[i]) if 고유값[i] else np.nan
+    return 일수[위치]
+
+
+def excel_날짜변환_배열(값) -> np.ndarray:
+    """
+    excel_날짜변환()의 배열 버전 (셀 값 목록, Series, ndarray)
+
+    값마다 형식(결측, 숫자, 날짜, 문자열)을 분류하고 형식별로 한 번에 변환합니다.
+    같은 값은 excel_날짜변환()과 같은 serial number가 됩니다.
+    numpy 정수/날짜 배열은 파이썬 int/Timestamp 값으로 봅니다.
+
+    Returns:
+        float64 serial number 배열 (excel_날짜변환()이 None을 돌려주거나 예외가 나는 값은 NaN)
+    """
+    값 = _객체_배열(값)
+    결과 = np.full(len(값), np.nan)
+    if not len(값):
+        return 결과
+
+    형식 = np.fromiter((_형식.get(type(v), _기타) for v in 값), dtype=np.int8, count=len(값))
+    형식[np.asarray(pd.isna(값), dtype=bool)] = _결측
+
+    숫자 = 형식 == _숫자
+    if 숫자.any():
+        결과[숫자] = _숫자_일수(값[숫자].astype(float))
+    날짜 = 형식 == _날짜
+    if 날짜.any():
+        결과[날짜] = _날짜_일수(값[날짜])
+    문자열 = 형식 == _문자열
+    if 문자열.any():
+        결과[문자열] = _문자열_배열_일수(값[문자열])
+    for i in np.flatnonzero(형식 == _기타):
+        결과[i] = _스칼라_일수(값[i])
+    return 결과
+
+
+def serial_to_datetime_배열(날짜_숫자) -> np.ndarray:
+    """serial_to_datetime()의 배열 버전 (datetime64[us], NaN이나 날짜로 바꿀 수 없는 값은 NaT)"""
+    원본 = np.asarray(날짜_숫자, dtype=float)
+    결과 = np.full(len(원본), np.datetime64("NaT"), dtype="datetime64[us]")
+    일수 = np.trunc(np.where(np.isfinite(원본), 원본, 0))
+    유효 = np.isfinite(원본) & (np.abs(일수) <= _최대_일수)
+    결과[유효] = _기준일_us + 일수[유효].astype(np.int64).astype("timedelta64[D]")
+    return 결과
+
+
+def 날짜_텍스트_배열(날짜_숫자) -> np.ndarray:
+    """날짜_텍스트()의 배열 버전 (yyyymmdd 텍스트 object 배열, NaN이나 날짜로 바꿀 수 없는 값은 None)"""
+    날짜 = serial_to_datetime_배열(날짜_숫자)
+    결과 = np.full(len(날짜), None, dtype=object)
+    유효 = ~np.isnat(날짜)
+    if 유효.any():
+        # serial_to_datetime() 범위의 연도는 항상 네 자리 (yyyy-mm-dd → yyyymmdd)
+        텍스트 = np.char.replace(np.datetime_as_string(날짜[유효], unit="D"), "-", "")
+        결과[유효] = 텍스트.tolist()
+    return 결과
+
+
+def 생년월일_연도_수정_배열(날짜_숫자) -> np.ndarray:
+    """
+    생년월일_연도_수정()의 배열 버전
+
+    1901 → 2001, 2070 → 1970, 1900~1905 → +100년, 2100 이후 → 1900년대 규칙을 한 번에 적용합니다.
+    연도를 바꾸면 없는 날짜가 되거나(2월 29일) 날짜로 바꿀 수 없는 값은 그대로 둡니다.
+
+    Args:
+        날짜_숫자: Excel serial number 배열 (NaN은 값 없음)
+
+    Returns:
+        수정된 float64 serial number 배열
+    """
+    원본 = np.asarray(날짜_숫자, dtype=float)
+    결과 = 원본.copy()
+    일수 = np.trunc(np.where(np.isfinite(원본), 원본, 0))
+    대상 = np.flatnonzero(np.isfinite(원본) & (np.abs(일수) <= _최대_일수))
+    if not len(대상):
+        return 결과
+
+    날짜 = _기준일_D + 일수[대상].astype(np.int64)
+    연도 = 날짜.astype("datetime64[Y]").astype(np.int64) + 1970
+    규칙 = [연도 == 1901, 연도 == 2070, (연도 >= 1900) & (연도 <= 1905), 연도 > 2100]
+    새_연도 = np.select(규칙, [2001, 1970, 연도 + 100, 1900 + 연도 % 100], 연도)
+    수정 = np.logical_or.reduce(규칙)
+    if not 수정.any():
+        return 결과
+
+    월 = 날짜.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    일 = (날짜 - 날짜.astype("datetime64[M]")).astype(np.int64) + 1
+    새_일수 = _연월일_일수(새_연도[수정] * 10000 + 월[수정] * 100 + 일[수정])
+    바뀜 = ~np.isnan(새_일수)
+    결과[대상[수정][바뀜]] = 새_일수[바뀜]
+    return 결과
@@ -0,0 +1,108 @@
+"""
+입력 파일 탐색과 변환
+폴더에서 작성요청 파일과 error check 파일을 찾고, .xls 파일은 .xlsx로 변환
+"""
+
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+
+# 결과 파일과 임시 파일은 입력 파일 후보에서 제외
+제외_표시 = ("_자동화결과", "~$", "_temp")
+
+
+class 명부검증오류(Exception):
+    """입력 파일을 찾거나 읽을 수 없는 등 명부검증을 진행할 수 없는 오류"""
+
+
+def xls_to_xlsx(xls_파일명, 로그: Callable[[str], None] = print) -> Path:
+    """
+    .xls 파일을 .xlsx로 변환 (같은 폴더에 "_temp.xlsx" 파일 생성)
+
+    Args:
+        xls_파일명: .xls 파일 경로
+        로그: 진행 메시지 출력 함수
+
+    Returns:
+        변환된 임시 .xlsx 파일 경로
+
+    Raises:
+        명부검증오류: xlrd가 없거나 변환에 실패했을 때
+    """
+    xls_파일명 = Path(xls_파일명)
+    임시_파일명 = xls_파일명.with_name(xls_파일명.name.replace(".xls", "_temp.xlsx"))
+    로그(f"   .xls 파일 발견 → .xlsx로 변환 중...")
+    try:
+        # pandas로 .xls 파일의 모든 시트 읽기
+        excel_file = pd.ExcelFile(xls_파일명, engine="xlrd")
+        # openpyxl 엔진으로 새 .xlsx 파일 생성
+        with pd.ExcelWriter(임시_파일명, engine="openpyxl") as writer:
+            for 시트명 in excel_file.sheet_names:
+                df = pd.read_excel(xls_파일명, sheet_name=시트명, engine="xlrd")
+                df.to_excel(writer, sheet_name=시트명, index=False)
+        로그(f"   ✓ 변환 완료: {임시_파일명.name}")
+        return 임시_파일명
+    except ImportError:
+        raise 명부검증오류(".xls 파일 변환 실패: xlrd 라이브러리가 필요합니다 (pip install xlrd)")
+    except Exception as e:
+        raise 명부검증오류(f".xls 파일 변환 실패: {e}")
+
+
+def is_xls(파일명) -> bool:
+    """변환이 필요한 .xls 파일인지 여부"""
+    return Path(파일명).suffix.lower() == ".xls"
+
+
+def 엑셀_파일_목록(폴더) -> List[Path]:
+    """폴더의 입력 후보 Excel 파일 (.xlsx, .xls, 결과/임시 파일 제외)"""
+    폴더 = Path(폴더)
+    파일_목록 = sorted(폴더.glob("*.xlsx")) + sorted(폴더.glob("*.xls"))
+    return [파일 for 파일 in 파일_목록 if not any(표시 in 파일.name for 표시 in 제외_표시)]
+
+
+def _후보_선택(후보: List[Path], 종류: str, 조건: str, 로그: Callable[[str], None]) -> Path:
+    if not 후보:
+        raise 명부검증오류(f"{종류} 파일을 찾을 수 없습니다. 파일명에 '{조건}'가 포함되어 있어야 합니다.")
+    if len(후보) > 1:
+        로그(f"⚠ 여러 {종류} 파일 발견: {[파일.name for 파일 in 후보]}")
+        로그(f"   첫 번째 파일 사용: {후보[0].name}")
+    else:
+        로그(f"✓ {종류} 파일 발견: {후보[0].name}")
+    return 후보[0]
+
+
+def 파일_찾기(폴더, 로그: Callable[[str], None] = print) -> Tuple[Path, Path]:
+    """
+    폴더에서 작성요청 파일(파일명에 "확정급여채무평가")과 에러체크 파일(파일명에 "error check") 찾기
+
+    여러 개면 첫 번째 파일을 사용합니다.
+
+    Args:
+        폴더: 검색할 폴더
+        로그: 진행 메시지 출력 함수
+
+    Returns:
+        (작성요청 파일 경로, 에러체크 파일 경로) 튜플
+
+    Raises:
+        명부검증오류: 파일을 찾을 수 없을 때
+    """
+    파일_목록 = 엑셀_파일_목록(폴더)
+    작성요청 = _후보_선택([파일 for 파일 in 파일_목록 if "확정급여채무평가" in 파일.name],
+                      "작성요청", "확정급여채무평가", 로그)
+    에러체크 = _후보_선택([파일 for 파일 in 파일_목록 if "error check" in 파일.name.lower()],
+                      "에러체크", "error check", 로그)
+    return 작성요청, 에러체크
+
+
+def 임시파일_삭제(파일명: Optional[Path], 로그: Callable[[str], None] = print) -> None:
+    """변환한 임시 .xlsx 파일 삭제 (실패해도 무시)"""
+    if 파일명 is None:
+        return
+    try:
+        Path(파일명).unlink()
+        로그(f"✓ 임시 파일 삭제: {Path(파일명).name}")
+    except Exception:
+        로그(f"⚠ 임시 파일 삭제 실패 (무시): {Path(파일명).name}")
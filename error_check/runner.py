@@ -0,0 +1,149 @@
+"""
+명부검증 실행
+작성요청 파일 한 건과 에러체크 파일 한 건으로 명부검증 전 과정(설정 → 복사 → 검증 → 저장) 수행
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from openpyxl import load_workbook
+
+from .files import is_xls, xls_to_xlsx, 임시파일_삭제
+from .settings import 평가설정
+from .transfer import 데이터_행수, 작성기준일_설정, 재직자_열_읽기, 재직자_시트명, 재직자명부_복사, 퇴직자_시트명
+from .validation import (
+    False_확인_최대_열,
+    False_확인_최대_행,
+    검증_수행,
+    검증결과_저장,
+    검증결과_출력,
+    검증결과_파일명,
+    퇴직자_시트인지,
+)
+from .workbook import 통합문서_읽기
+
+
+결과_파일_접미사 = "_자동화결과.xlsx"
+
+
+def 결과_파일명(에러체크_파일) -> str:
+    """에러체크 원본 파일명으로 결과 파일명 생성 ("… error check.xlsx" → "… error check_자동화결과.xlsx")"""
+    return Path(에러체크_파일).stem + 결과_파일_접미사
+
+
+def _전체_시트인지(시트명: str) -> bool:
+    """모든 셀을 읽어야 하는 시트 (재직자 명부, 퇴직자 명부)"""
+    return 시트명 == 재직자_시트명 or 퇴직자_시트인지(시트명)
+
+
+def 명부검증_실행(작성요청_파일, 에러체크_파일, 설정: Optional[평가설정] = None,
+              출력_폴더=None, 로그: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    명부검증 자동화 실행
+
+    에러체크 파일의 error check 쉬트에 평가 설정을 입력하고, 재직자명부를 복사한 뒤
+    작성요청 파일을 검증하여 결과 파일(_자동화결과.xlsx)과 검증결과 텍스트 파일을 저장합니다.
+    원본 파일은 변경하지 않습니다.
+
+    Args:
+        작성요청_파일: 작성요청(확정급여채무평가 작성자료) 파일 경로 (.xlsx 또는 .xls)
+        에러체크_파일: 에러체크 파일 경로 (.xlsx 또는 .xls)
+        설정: 평가 설정 (None이면 기본값)
+        출력_폴더: 결과 파일을 저장할 폴더 (None이면 에러체크 파일 폴더)
+        로그: 진행 메시지 출력 함수
+
+    Returns:
+        {"결과_파일", "검증결과_파일", "작성기준일", "재직자_수", "복사_완료", "퇴직자_수", "이슈_수", "검증_요약"}
+
+    Raises:
+        명부검증오류: .xls 변환에 실패했을 때
+        Exception: 파일을 열거나 저장하는 중 오류가 발생했을 때
+    """
+    설정 = (설정 or 평가설정()).검사()
+    작성요청_파일 = Path(작성요청_파일)
+    에러체크_파일 = Path(에러체크_파일)
+    출력_폴더 = Path(출력_폴더) if 출력_폴더 is not None else 에러체크_파일.parent
+    출력_폴더.mkdir(parents=True, exist_ok=True)
+
+    작성요청_임시파일 = None
+    에러체크_임시파일 = None
+    try:
+        # .xls 파일인 경우 .xlsx로 변환
+        if is_xls(작성요청_파일):
+            작성요청_임시파일 = xls_to_xlsx(작성요청_파일, 로그)
+        if is_xls(에러체크_파일):
+            에러체크_임시파일 = xls_to_xlsx(에러체크_파일, 로그)
+        작성요청_파일명 = 작성요청_임시파일 or 작성요청_파일
+        에러체크_파일명 = 에러체크_임시파일 or 에러체크_파일
+
+        # 1. 파일 열기
+        로그("\n[1단계] 파일 열기...")
+        # 작성요청 파일은 한 번만 읽으면서 수식과 계산된 값을 함께 추출
+        # (재직자/퇴직자 명부는 전체, 나머지 시트는 False 수치 확인 범위만 보관)
+        작성요청 = 통합문서_읽기(작성요청_파일명, 전체_시트=_전체_시트인지,
+                          최대_행=False_확인_최대_행, 최대_열=False_확인_최대_열)
+        에러체크_wb = load_workbook(에러체크_파일명, data_only=False)
+        로그("✓ 파일 열기 완료")
+
+        # 2. error check 쉬트 설정
+        로그("\n[2단계] error check 쉬트 설정...")
+        error_ws = 에러체크_wb["error check"]
+        error_ws["B1"] = 설정.평가시작일
+        error_ws["D1"] = 설정.평가종료일
+        error_ws["D2"] = 설정.정년연령
+        로그(f"✓ 평가시작일: {설정.평가시작일}")
+        로그(f"✓ 평가종료일: {설정.평가종료일}")
+        로그(f"✓ 정년연령: {설정.정년연령}")
+
+        # 2-1. 작성기준일 읽기 (작성요청 파일의 기초자료 퇴직급여 시트 I25 → 에러체크 파일 M1)
+        로그("\n[2-1단계] 작성기준일 읽기...")
+        작성기준일 = 작성기준일_설정(작성요청, 에러체크_wb, 로그)
+
+        # 3. 작성요청 파일에서 재직자명부 데이터 읽기
+        로그("\n[3단계] 작성요청 파일 - 재직자명부 데이터 읽기...")
+        재직자_수 = 데이터_행수(작성요청[재직자_시트명])
+        로그(f"✓ 재직자 수: {재직자_수}명")
+
+        # 4. 에러체크 파일의 재직자명부 시트에 데이터 복사
+        로그("\n[4단계] 재직자명부 데이터 복사...")
+        복사_완료 = 재직자명부_복사(재직자_열_읽기(작성요청, 재직자_수), 에러체크_wb)
+        로그(f"✓ {복사_완료}명의 데이터 복사 완료")
+        로그("✓ 성명(B열)에 사원번호 자동 입력 완료")
+
+        # 5. 퇴직자명부 데이터 읽기
+        로그("\n[5단계] 작성요청 파일 - 퇴직자명부 데이터 읽기...")
+        퇴직자_수 = 데이터_행수(작성요청[퇴직자_시트명])
+        로그(f"✓ 퇴직자 수: {퇴직자_수}명")
+        로그("⚠ 퇴직자명부 복사 로직은 재직자명부와 유사하게 구현 가능합니다")
+
+        # 6. 작성요청 파일 상세 검증 수행
+        로그("\n[6단계] 작성요청 파일 상세 검증 수행...")
+        검증_결과, 검증_요약 = 검증_수행(작성요청, 설정, 로그)
+        검증결과_출력(검증_결과, 로그)
+        검증결과_경로 = 검증결과_저장(출력_폴더 / 검증결과_파일명, 검증_결과, 검증_요약, 작성요청_파일.name)
+        if 검증_결과:
+            로그(f"✓ 검증 결과 및 추가작업 필요사항 저장: {검증결과_경로.name}")
+        else:
+            로그(f"✓ 검증 결과 저장: {검증결과_경로.name}")
+
+        # 7. 결과 저장 (원본 파일명 기반)
+        로그("\n[7단계] 결과 저장...")
+        결과_경로 = 출력_폴더 / 결과_파일명(에러체크_파일)
+        에러체크_wb.save(결과_경로)
+        로그(f"✓ 에러체크 파일 저장: {결과_경로.name}")
+        로그("✓ 원본 파일은 변경하지 않았습니다")
+    finally:
+        # 임시 파일 정리
+        임시파일_삭제(작성요청_임시파일, 로그)
+        임시파일_삭제(에러체크_임시파일, 로그)
+
+    return {
+        "결과_파일": 결과_경로,
+        "검증결과_파일": 검증결과_경로,
+        "작성기준일": 작성기준일,
+        "재직자_수": 재직자_수,
+        "복사_완료": 복사_완료,
+        "퇴직자_수": 퇴직자_수,
+        "이슈_수": len(검증_결과),
+        "검증_요약": {항목: len(목록) for 항목, 목록 in 검증_요약.items()},
+    }
@@ -0,0 +1,35 @@
+"""
+평가 설정
+고객사별 평가시작일, 평가종료일, 정년연령 (error check 쉬트 B1, D1, D2에 입력되는 값)
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+
+
+class 평가설정(NamedTuple):
+    """고객사 한 곳의 평가 설정"""
+
+    평가시작일: str = "20240101"  # error check 쉬트 B1 (yyyymmdd)
+    평가종료일: str = "20240331"  # error check 쉬트 D1 (yyyymmdd)
+    정년연령: int = 60  # error check 쉬트 D2
+
+    @property
+    def 평가시작일_dt(self) -> datetime:
+        return datetime.strptime(self.평가시작일, "%Y%m%d")
+
+    @property
+    def 평가종료일_dt(self) -> datetime:
+        return datetime.strptime(self.평가종료일, "%Y%m%d")
+
+    def 검사(self) -> "평가설정":
+        """
+        설정값 형식 확인 후 정리된 설정 반환
+
+        Raises:
+            ValueError: 날짜가 yyyymmdd 형식이 아니거나 시작일이 종료일보다 늦을 때
+        """
+        설정 = 평가설정(str(self.평가시작일).strip(), str(self.평가종료일).strip(), int(self.정년연령))
+        if 설정.평가시작일_dt > 설정.평가종료일_dt:
+            raise ValueError(f"평가시작일({설정.평가시작일})이 평가종료일({설정.평가종료일})보다 늦습니다.")
+        return 설정
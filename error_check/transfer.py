@@ -0,0 +1,269 @@
+"""
+재직자명부 옮기기
+작성요청 파일의 (2-2) 재직자 명부를 에러체크 파일의 재직자명부 시트로 복사하고 작성기준일 설정
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from openpyxl.utils import column_index_from_string
+
+from .dates import excel_날짜변환_배열, 날짜_텍스트_배열, 생년월일_연도_수정_배열, 작성기준일_변환
+
+
+재직자_시트명 = "(2-2) 재직자 명부"
+퇴직자_시트명 = "(2-3) 퇴직자 및 DC전환자 명부"
+에러체크_재직자_시트명 = "재직자명부"
+
+# ============================================================================
+# 컬럼 매핑 정의
+# ============================================================================
+# 작성요청 파일 - 재직자명부 (헤더: 1행, 데이터: 2행부터)
+작성요청_재직자_매핑 = {
+    "사원번호": "B",      # B열
+    "생년월일": "C",      # C열
+    "성별": "D",          # D열
+    "입사일자": "E",      # E열
+    "기준급여": "F",      # F열
+    "당년도퇴직금추계액": "G",  # G열
+    "차년도퇴직금추계액": "H",  # H열
+    "종업원구분": "I",    # I열
+    "중간정산기준일": "J", # J열
+    "중간정산액": "K",    # K열
+    "제도구분": "L",      # L열
+    "적용배수": "M",      # M열 (임원배수로 복사)
+    "휴직기간등차감": "N", # N열
+}
+
+# 에러체크 파일 - 재직자명부 (헤더: 1행, 데이터: 2행부터)
+에러체크_재직자_매핑 = {
+    "사원번호": "A",      # A열
+    "성명": "B",          # B열
+    "생년월일": "C",      # C열
+    "성별": "D",          # D열
+    "입사일자": "E",      # E열
+    "기준급여": "F",      # F열
+    "당년도퇴직금추계액": "G",  # G열
+    "차년도퇴직금추계액": "H",  # H열
+    "직종구분": "I",      # I열
+    "중간정산기준일": "J", # J열
+    "중간정산액": "K",    # K열
+    "임원배수": "L",      # L열 (적용배수에서 복사)
+}
+
+# 작성요청 → 에러체크 매핑
+재직자_데이터_매핑 = {
+    "사원번호": ("B", "A"),
+    "성명": ("B", "B"),  # 성명에도 사원번호 그대로 입력
+    "생년월일": ("C", "C"),
+    "성별": ("D", "D"),
+    "입사일자": ("E", "E"),
+    "기준급여": ("F", "F"),
+    "당년도퇴직금추계액": ("G", "G"),
+    "차년도퇴직금추계액": ("H", "H"),
+    "종업원구분": ("I", "I"),  # 직종구분
+    "중간정산기준일": ("J", "J"),
+    "중간정산액": ("K", "K"),
+    "적용배수": ("M", "L"),  # 적용배수 → 임원배수
+}
+
+# 재직자_데이터_매핑 항목별 변환 (없으면 값이 있을 때 그대로 복사)
+재직자_열_변환 = {
+    "생년월일": "생년월일",          # 연도 이상값 수정 후 yyyymmdd 텍스트
+    "입사일자": "날짜",              # yyyymmdd 텍스트
+    "중간정산기준일": "날짜",
+    "당년도퇴직금추계액": "계산값",  # 계산된 값 우선, 없으면 수식이나 입력값
+    "차년도퇴직금추계액": "계산값",
+}
+
+# 휴직기간 차감: 작성요청 N열(휴직기간 일수) → 에러체크 X열(표시용), AA열(지급률 수식 참조용)
+휴직기간_열 = "N"
+휴직기간_차감_열 = ("X", "AA")
+지급률_열 = "S"
+
+
+def 데이터_행수(시트) -> int:
+    """2행부터 사원번호(B열)가 연속으로 채워진 행 수 (시트: 시트_데이터)"""
+    행수 = 0
+    for 행 in range(2, 시트.max_row + 1):
+        사원번호 = 시트.값(행, "B")
+        if 사원번호 and str(사원번호).strip():
+            행수 += 1
+        else:
+            break
+    return 행수
+
+
+def 기초자료_시트인지(시트명: str) -> bool:
+    """기초자료 퇴직급여 시트 여부 (시트명에 "기초자료"와 "퇴직급여"가 모두 포함)"""
+    return "기초자료" in 시트명 and "퇴직급여" in 시트명
+
+
+def 기초자료_시트_찾기(작성요청) -> Optional[str]:
+    """기초자료 퇴직급여 시트명 (조건에 맞는 첫 시트)"""
+    for 시트명 in 작성요청.sheetnames:
+        if 기초자료_시트인지(시트명):
+            return 시트명
+    return None
+
+
+def 작성기준일_설정(작성요청, 에러체크_wb, 로그: Callable[[str], None] = print) -> Optional[str]:
+    """
+    작성기준일(작성요청 파일 기초자료 퇴직급여 시트 I25)을 에러체크 파일 재직자명부 M1에 yyyymmdd로 저장
+
+    Args:
+        작성요청: 작성요청 파일 데이터 (통합문서_읽기() 결과)
+        에러체크_wb: 에러체크 워크북
+        로그: 진행 메시지 출력 함수
+
+    Returns:
+        저장한 작성기준일 문자열 (시트가 없거나 I25가 비어 있으면 None)
+    """
+    기초자료_시트명 = 기초자료_시트_찾기(작성요청)
+    if not 기초자료_시트명:
+        로그("⚠ 기초자료 퇴직급여 시트를 찾을 수 없습니다.")
+        로그(f"   사용 가능한 시트: {작성요청.sheetnames}")
+        return None
+
+    로그(f"   기초자료 시트 발견: {기초자료_시트명}")
+    작성기준일_값 = 작성요청[기초자료_시트명].값(25, "I")
+    if 작성기준일_값 is None:
+        로그("⚠ I25 셀이 비어있습니다.")
+        return None
+
+    작성기준일 = 작성기준일_변환(작성기준일_값)
+    에러체크_wb[에러체크_재직자_시트명]["M1"] = 작성기준일
+    로그(f"✓ 작성기준일 M1에 저장: {작성기준일}")
+    return 작성기준일
+
+
+def 재직자_열_읽기(작성요청, 행수: int) -> Dict[str, np.ndarray]:
+    """
+    작성요청 파일 재직자 명부의 복사용 열 배열 (2행부터 행수만큼)
+
+    Args:
+        작성요청: 작성요청 파일 데이터 (통합문서_읽기() 결과)
+        행수: 읽을 재직자 수 (데이터_행수() 결과)
+
+    Returns:
+        {"B"~"N": 수식 또는 입력값, "G_값"/"H_값": 계산된 값} 열별 object 배열
+    """
+    시트 = 작성요청[재직자_시트명]
+    열 = {원본_열: 시트.열_배열(원본_열, 2, 행수) for 원본_열 in 작성요청_재직자_매핑.values()}
+    for 항목, 변환 in 재직자_열_변환.items():
+        if 변환 == "계산값":
+            원본_열 = 재직자_데이터_매핑[항목][0]
+            열[f"{원본_열}_값"] = 시트.열_배열(원본_열, 2, 행수, 계산값=True)
+    return 열
+
+
+def _값_있음(값: np.ndarray) -> np.ndarray:
+    return np.fromiter((v is not None for v in 값), dtype=bool, count=len(값))
+
+
+def _날짜_텍스트_열(값: np.ndarray, 연도_수정: bool) -> Tuple[np.ndarray, np.ndarray]:
+    날짜_숫자 = excel_날짜변환_배열(값)
+    쓰기 = ~np.isnan(날짜_숫자) & (날짜_숫자 != 0)
+    if 연도_수정:
+        날짜_숫자 = 생년월일_연도_수정_배열(날짜_숫자)
+    텍스트 = 날짜_텍스트_배열(날짜_숫자)
+    return 텍스트, 쓰기 & _값_있음(텍스트)
+
+
+def _열_변환(변환: Optional[str], 열: Dict[str, np.ndarray], 원본_열: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    재직자_열_변환 규칙으로 원본 열 하나를 에러체크 값 배열로 변환
+
+    Returns:
+        (값 배열, 쓸 행 마스크)
+    """
+    값 = 열[원본_열]
+    if 변환 == "생년월일":
+        return _날짜_텍스트_열(값, 연도_수정=True)
+    if 변환 == "날짜":
+        return _날짜_텍스트_열(값, 연도_수정=False)
+    if 변환 == "계산값":
+        계산값 = 열[f"{원본_열}_값"]
+        값 = np.where(_값_있음(계산값), 계산값, 값)
+    return 값, _값_있음(값)
+
+
+def _휴직기간_연환산(휴직기간_일수: np.ndarray) -> np.ndarray:
+    """휴직기간 일수 / 365.25 (값이 없거나 0이면 0)"""
+    결과 = np.zeros(len(휴직기간_일수), dtype=object)
+    대상 = _값_있음(휴직기간_일수)
+    대상[대상] = np.asarray(휴직기간_일수[대상] != 0, dtype=bool)
+    결과[대상] = 휴직기간_일수[대상] / 365.25
+    return 결과
+
+
+def _열_쓰기(ws, 열: str, 행: np.ndarray, 값: np.ndarray, 쓰기: Optional[np.ndarray] = None) -> None:
+    """열 하나에 값 배열을 한 번에 쓰기 (쓰기 마스크가 False인 행은 기존 값 유지)"""
+    if 쓰기 is not None:
+        행, 값 = 행[쓰기], 값[쓰기]
+    번호 = column_index_from_string(열)
+    for 행_번호, v in zip(행.tolist(), 값.tolist()):
+        ws.cell(row=행_번호, column=번호, value=v)
+
+
+def _지급률_수식_수정(ws, 행: np.ndarray) -> None:
+    """지급률(S열) 수식 끝에 휴직기간 차감(-AA{행}) 추가 (이미 있으면 추가하지 않음, 수식이 없으면 그대로)"""
+    if not len(행):
+        return
+    번호 = column_index_from_string(지급률_열)
+    수식 = np.empty(len(행), dtype=object)
+    수식[:] = [값 for (값,) in ws.iter_rows(min_row=int(행[0]), max_row=int(행[-1]),
+                                         min_col=번호, max_col=번호, values_only=True)]
+    대상 = np.fromiter((isinstance(v, str) and v.startswith("=") for v in 수식), dtype=bool, count=len(수식))
+    if not 대상.any():
+        return
+
+    참조 = np.char.add(f"{휴직기간_차감_열[1]}", 행[대상].astype(str))  # AA{행}
+    기존 = 수식[대상].astype(str)
+    추가 = np.char.find(기존, 참조) < 0
+    새_수식 = np.char.add(np.char.add(np.char.rstrip(기존[추가]), "-"), 참조[추가])
+    _열_쓰기(ws, 지급률_열, 행[대상][추가], 새_수식.astype(object))
+
+
+def 재직자명부_복사(재직자_열: Dict[str, np.ndarray], 에러체크_wb) -> int:
+    """
+    작성요청 파일의 재직자 명부를 에러체크 파일 재직자명부 시트로 복사
+
+    재직자_데이터_매핑의 열마다 재직자_열_변환 규칙을 열 전체에 한 번에 적용한 뒤 열 단위로 씁니다.
+    날짜는 yyyymmdd 텍스트로(생년월일은 연도 이상값 수정), 추계액은 계산된 값을 우선 사용하고,
+    휴직기간(N열)은 365.25로 나눈 연환산 값을 X열과 AA열에 저장한 뒤 지급률(S열) 수식에서 AA열을 뺍니다.
+
+    Args:
+        재직자_열: 재직자_열_읽기() 결과
+        에러체크_wb: 에러체크 워크북
+
+    Returns:
+        복사한 재직자 수 (사원번호가 처음 비어 있는 행 전까지)
+    """
+    에러체크_재직자_ws = 에러체크_wb[에러체크_재직자_시트명]
+
+    # 휴직기간 차감 열 헤더 설정 (1행)
+    # X열(오차율 오른쪽) 헤더 설정
+    if 에러체크_재직자_ws["X1"].value is None:
+        에러체크_재직자_ws["X1"] = "휴직기간 차감"
+    # AA열 헤더 설정 (지급률 수식 참조용)
+    if 에러체크_재직자_ws["AA1"].value is None:
+        에러체크_재직자_ws["AA1"] = "휴직기간 차감(참조용)"
+
+    # 사원번호가 비어 있는 첫 행 전까지 복사
+    사원번호 = 재직자_열[재직자_데이터_매핑["사원번호"][0]]
+    빈_행 = [i for i, v in enumerate(사원번호) if not v or not str(v).strip()]
+    복사_완료 = 빈_행[0] if 빈_행 else len(사원번호)
+    열 = {원본_열: 값[:복사_완료] for 원본_열, 값 in 재직자_열.items()}
+    행 = np.arange(2, 2 + 복사_완료)  # 작성요청 파일과 같은 행 (2행부터 시작)
+
+    for 항목, (원본_열, 에러체크_열) in 재직자_데이터_매핑.items():
+        값, 쓰기 = _열_변환(재직자_열_변환.get(항목), 열, 원본_열)
+        _열_쓰기(에러체크_재직자_ws, 에러체크_열, 행, 값, 쓰기)
+
+    휴직기간_연환산 = _휴직기간_연환산(열[휴직기간_열])
+    for 에러체크_열 in 휴직기간_차감_열:
+        _열_쓰기(에러체크_재직자_ws, 에러체크_열, 행, 휴직기간_연환산)
+
+    _지급률_수식_수정(에러체크_재직자_ws, 행)
+    return 복사_완료
@@ -0,0 +1,286 @@
+"""
+작성요청 파일 상세 검증
+False 수치, 생년월일 이상값, 정년초과자/임원/계약직 차년도 추계액 누락, 중간정산액 누락,
+기준급여/당년도 차이, 퇴직자명부 누락 항목을 확인하고 검증결과 텍스트 파일로 저장
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+from openpyxl.utils import get_column_letter
+
+from .checks import 재직자_검증
+from .settings import 평가설정
+from .transfer import 재직자_시트명
+
+
+검증결과_파일명 = "검증결과_및_추가작업필요사항.txt"
+
+검증_요약_항목 = (
+    "False_수치",
+    "정년초과자_차년도누락",
+    "중간정산액누락",
+    "기준급여당년도차이",
+    "차년도누락_임원계약직",
+    "퇴직자명부누락",
+    "정년초과자_목록",
+)
+
+# False 값을 찾는 범위 (시트마다 앞쪽 999행 × 49열)
+False_확인_최대_행 = 999
+False_확인_최대_열 = 49
+
+# 요약에 항목별로 나열할 최대 건수, 상세 결과에 유형별로 나열할 최대 건수
+요약_최대_건수 = 10
+상세_최대_건수 = 50
+
+
+def 새_검증_요약() -> Dict[str, List[str]]:
+    return {항목: [] for 항목 in 검증_요약_항목}
+
+
+def False_수치_확인(작성요청, 검증_결과: List[Dict[str, Any]], 검증_요약: Dict[str, List[str]]) -> None:
+    """모든 시트의 앞쪽 False_확인_최대_행 × False_확인_최대_열 범위에서 False 값 찾기"""
+    for 시트명 in 작성요청.sheetnames:
+        ws = 작성요청[시트명]
+        최대_행 = min(ws.max_row, False_확인_최대_행)
+        최대_열 = min(ws.max_column, False_확인_최대_열)
+        for 행, 열, 셀값 in ws.셀_목록(최대_행, 최대_열):
+            if 셀값 is False or (isinstance(셀값, str) and 셀값.lower() == "false"):
+                검증_결과.append({
+                    "유형": "False 수치 발견",
+                    "시트": 시트명,
+                    "셀": f"{get_column_letter(열)}{행}",
+                    "사원번호": "-",
+                    "내용": f"False 값이 발견되었습니다"
+                })
+                검증_요약["False_수치"].append(f"{시트명}!{get_column_letter(열)}{행}")
+
+
+def 퇴직자_시트인지(시트명: str) -> bool:
+    """퇴직자명부 시트 여부 (시트명에 "퇴직자" 또는 "DC전환"이 포함)"""
+    return "퇴직자" in 시트명 or "DC전환" in 시트명
+
+
+def 퇴직자_시트_찾기(시트명_목록: List[str]) -> Optional[str]:
+    """퇴직자명부 시트명 (조건에 맞는 첫 시트)"""
+    for 시트명 in 시트명_목록:
+        if 퇴직자_시트인지(시트명):
+            return 시트명
+    return None
+
+
+def 퇴직자_검증(퇴직자_df: pd.DataFrame, 퇴직자_시트명: str, 검증_결과: List[Dict[str, Any]],
+              검증_요약: Dict[str, List[str]]) -> None:
+    """퇴직자명부의 퇴직금, 퇴직일 누락 확인 (사원번호가 있는 행만)"""
+    퇴직자_사원번호_컬럼 = None
+    퇴직금_컬럼 = None
+    퇴직일_컬럼 = None
+
+    for col in 퇴직자_df.columns:
+        col_str = str(col)
+        if "사원번호" in col_str:
+            퇴직자_사원번호_컬럼 = col
+        if "퇴직금" in col_str and "추계" not in col_str:
+            퇴직금_컬럼 = col
+        if "퇴직일" in col_str:
+            퇴직일_컬럼 = col
+
+    if not 퇴직자_사원번호_컬럼:
+        return
+
+    퇴직자_df = 퇴직자_df[퇴직자_df[퇴직자_사원번호_컬럼].notna()]
+    for idx, row in 퇴직자_df.iterrows():
+        사원번호 = row.get(퇴직자_사원번호_컬럼)
+
+        if 퇴직금_컬럼 and pd.isna(row.get(퇴직금_컬럼)):
+            검증_결과.append({
+                "유형": "퇴직자명부 퇴직금 누락",
+                "시트": 퇴직자_시트명,
+                "사원번호": 사원번호,
+                "내용": "퇴직금이 누락되었습니다"
+            })
+            검증_요약["퇴직자명부누락"].append(f"사원번호 {사원번호} (퇴직금 누락)")
+
+        if 퇴직일_컬럼 and pd.isna(row.get(퇴직일_컬럼)):
+            검증_결과.append({
+                "유형": "퇴직자명부 퇴직일 누락",
+                "시트": 퇴직자_시트명,
+                "사원번호": 사원번호,
+                "내용": "퇴직일이 누락되었습니다"
+            })
+            검증_요약["퇴직자명부누락"].append(f"사원번호 {사원번호} (퇴직일 누락)")
+
+
+def 검증_수행(작성요청, 설정: 평가설정,
+            로그: Callable[[str], None] = print) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+    """
+    작성요청 파일 상세 검증
+
+    Args:
+        작성요청: 작성요청 파일 데이터 (통합문서_읽기() 결과, 재직자/퇴직자 명부 시트는 전체 셀 포함)
+        설정: 평가 설정
+        로그: 진행 메시지 출력 함수
+
+    Returns:
+        (검증_결과 리스트, 검증_요약 딕셔너리) 튜플
+    """
+    검증_결과: List[Dict[str, Any]] = []
+    검증_요약 = 새_검증_요약()
+
+    재직자_df = 작성요청[재직자_시트명].to_frame()
+
+    # 1. False 수치 확인
+    로그("   1) False 수치 확인...")
+    False_수치_확인(작성요청, 검증_결과, 검증_요약)
+
+    재직자_검증(재직자_df, 설정, 검증_결과, 검증_요약, 로그)
+
+    # 7. 퇴직자명부 확인
+    로그("   7) 퇴직자명부 확인...")
+    try:
+        퇴직자_시트명 = 퇴직자_시트_찾기(작성요청.sheetnames)
+        if 퇴직자_시트명:
+            퇴직자_df = 작성요청[퇴직자_시트명].to_frame()
+            퇴직자_검증(퇴직자_df, 퇴직자_시트명, 검증_결과, 검증_요약)
+    except Exception as e:
+        로그(f"   ⚠ 퇴직자명부 확인 중 오류: {e}")
+
+    return 검증_결과, 검증_요약
+
+
+def 검증결과_출력(검증_결과: List[Dict[str, Any]], 로그: Callable[[str], None] = print) -> None:
+    """검증 결과 앞쪽 20건 출력"""
+    if not 검증_결과:
+        로그("\n✓ 작성요청 파일 검증 통과")
+        return
+    로그(f"\n⚠ 검증 결과: {len(검증_결과)}건의 이슈 발견")
+    for i, 결과 in enumerate(검증_결과[:20], 1):
+        로그(f"  {i}. [{결과['유형']}] {결과.get('시트', '')} 사원번호 {결과['사원번호']}: {결과['내용']}")
+    if len(검증_결과) > 20:
+        로그(f"  ... 외 {len(검증_결과) - 20}건")
+
+
+def _요약_항목_쓰기(f, 제목: str, 항목_목록: List[str], 안내: Optional[str] = None) -> None:
+    if not 항목_목록:
+        return
+    f.write(f"⚠ {제목}: {len(항목_목록)}건\n")
+    if 안내:
+        f.write(f"   → {안내}\n")
+    for item in 항목_목록[:요약_최대_건수]:
+        f.write(f"   - {item}\n")
+    if len(항목_목록) > 요약_최대_건수:
+        f.write(f"   ... 외 {len(항목_목록) - 요약_최대_건수}건\n")
+    f.write("\n")
+
+
+def 검증결과_저장(저장_경로, 검증_결과: List[Dict[str, Any]], 검증_요약: Dict[str, List[str]],
+               작성요청_파일_표시명: str) -> Path:
+    """
+    검증 결과 및 추가 작업 필요사항 텍스트 파일 저장
+
+    Args:
+        저장_경로: 텍스트 파일 경로
+        검증_결과: 검증_수행() 결과 리스트
+        검증_요약: 검증_수행() 요약 딕셔너리
+        작성요청_파일_표시명: 보고서에 표시할 작성요청 파일명
+
+    Returns:
+        저장한 파일 경로
+    """
+    저장_경로 = Path(저장_경로)
+    with open(저장_경로, "w", encoding="utf-8") as f:
+        if not 검증_결과:
+            # 검증 통과 시에도 간단한 보고서 생성
+            f.write("=" * 80 + "\n")
+            f.write("작성요청 파일 검증 결과\n")
+            f.write("=" * 80 + "\n\n")
+            f.write(f"검증 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"작성요청 파일: {작성요청_파일_표시명}\n\n")
+            f.write("✓ 기본 검증 통과\n\n")
+            f.write("추가 확인 사항:\n")
+            f.write("- (1-2) 시트 D34, E34 셀의 연도 확인\n")
+            f.write("- 2개년도 평가 시 명부 누락 확인\n")
+            f.write("- 혼합형(DB+DC) DB 비율 확인\n")
+            f.write("- 기타장기 DC 대상자 확인\n")
+            return 저장_경로
+
+        f.write("=" * 80 + "\n")
+        f.write("작성요청 파일 검증 결과 및 추가 작업 필요사항\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"검증 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"작성요청 파일: {작성요청_파일_표시명}\n")
+        f.write(f"총 검증 이슈: {len(검증_결과)}건\n\n")
+
+        f.write("=" * 80 + "\n")
+        f.write("1. 검증 결과 요약\n")
+        f.write("=" * 80 + "\n\n")
+
+        _요약_항목_쓰기(f, "False 수치 발견", 검증_요약["False_수치"])
+        _요약_항목_쓰기(f, "정년초과자 차년도 퇴직금추계액 누락", 검증_요약["정년초과자_차년도누락"])
+        _요약_항목_쓰기(f, "중간정산액 누락", 검증_요약["중간정산액누락"])
+        _요약_항목_쓰기(f, "기준급여/당년도 차이 5% 이상", 검증_요약["기준급여당년도차이"], "고객사에 확인 요청 필요")
+        _요약_항목_쓰기(f, "차년도 퇴직금추계액 누락 (임원/계약직)", 검증_요약["차년도누락_임원계약직"])
+        _요약_항목_쓰기(f, "퇴직자명부 누락 항목", 검증_요약["퇴직자명부누락"])
+
+        f.write("=" * 80 + "\n")
+        f.write("2. 추가 작업 및 확인 필요사항\n")
+        f.write("=" * 80 + "\n\n")
+
+        f.write("ⓐ (1-2) 시트 D34, E34 셀의 연도 확인\n")
+        f.write("   - 평가년도에 맞게 연도가 수정되었는지 확인\n")
+        f.write("   - 종업원수에 따른 범위 확인\n\n")
+
+        if 검증_요약["False_수치"]:
+            f.write("ⓑ False 수치 수정 필요\n")
+            f.write("   - 발견된 False 값들을 올바른 값으로 수정 요청\n\n")
+
+        if 검증_요약["정년초과자_차년도누락"] or 검증_요약["차년도누락_임원계약직"]:
+            f.write("ⓒ 차년도 퇴직금추계액 입력 필요\n")
+            f.write("   - 임원, 계약직, 정년초과자의 차년도 퇴직금추계액 필수 입력\n")
+            f.write("   - 공란이면 PUC_채무평가 파일에서 오류 발생\n")
+            f.write("   - 정년초과자/계약직의 경우, 기준급여+당년도 퇴직금 추계액 합산 값으로 사용 가능\n\n")
+
+        if 검증_요약["기준급여당년도차이"]:
+            f.write("ⓓ 기준급여/당년도 차이 5% 이상 확인 요청\n")
+            f.write("   - 고객사에 차이 발생 원인 확인 요청\n")
+            f.write(f"   - 총 {len(검증_요약['기준급여당년도차이'])}건 발견\n\n")
+
+        if 검증_요약["중간정산액누락"]:
+            f.write("ⓔ 중간정산액 입력 필요\n")
+            f.write("   - 평가년도에 중간정산한 사람은 중간정산액 반드시 필요\n\n")
+
+        if 검증_요약["퇴직자명부누락"]:
+            f.write("ⓕ 퇴직자명부 누락 항목 입력 필요\n")
+            f.write("   - 퇴직금, 퇴직일, 사원번호 필수 입력 확인\n\n")
+
+        if 검증_요약["정년초과자_목록"]:
+            f.write("ⓖ 정년초과자 목록\n")
+            f.write(f"   - 총 {len(검증_요약['정년초과자_목록'])}명 확인\n")
+            f.write("   - 차년도 퇴직금추계액 입력 확인 필요\n\n")
+
+        f.write("ⓗ 추가 확인 사항\n")
+        f.write("   - 2개년도 평가 시 명부 누락 확인 (예: 25년도 퇴직했는데 24년도 명부에 없음)\n")
+        f.write("   - 퇴직금제도 혼합형(DB+DC)인 경우 DB 비율 확인\n")
+        f.write("   - 기타장기가 있을 경우 DC 대상자 누락 확인\n\n")
+
+        f.write("=" * 80 + "\n")
+        f.write("3. 상세 검증 결과\n")
+        f.write("=" * 80 + "\n\n")
+
+        # 유형별로 그룹화
+        유형별_결과: Dict[str, List[Dict[str, Any]]] = {}
+        for 결과 in 검증_결과:
+            유형별_결과.setdefault(결과["유형"], []).append(결과)
+
+        for 유형, 결과_목록 in 유형별_결과.items():
+            f.write(f"\n[{유형}] ({len(결과_목록)}건)\n")
+            f.write("-" * 80 + "\n")
+            for 결과 in 결과_목록[:상세_최대_건수]:
+                f.write(f"  사원번호: {결과['사원번호']}, 시트: {결과.get('시트', '-')}, {결과['내용']}\n")
+            if len(결과_목록) > 상세_최대_건수:
+                f.write(f"  ... 외 {len(결과_목록) - 상세_최대_건수}건\n")
+
+    return 저장_경로
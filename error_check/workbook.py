@@ -0,0 +1,244 @@
+"""
+작성요청 파일 한 번 읽기
+시트 XML을 한 번만 훑으면서 셀마다 수식 텍스트(data_only=False로 읽은 값)와
+계산된 값(data_only=True로 읽은 값)을 함께 추출하고, 복사용 열 배열과 검증용 DataFrame을 만듭니다.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.utils import column_index_from_string, range_boundaries
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+# 시트 XML을 직접 파싱하는 openpyxl 내부 API (없는 버전에서는 load_workbook()을 두 번 사용)
+try:
+    from openpyxl.worksheet._reader import FORMULA_TAG, WorkSheetParser
+except ImportError:
+    WorkSheetParser = None
+
+_통합문서_내부_속성 = ("_archive", "shared_strings", "epoch", "_date_formats", "_timedelta_formats")
+
+
+if WorkSheetParser is not None:
+    class _수식_값_파서(WorkSheetParser):
+        """셀 하나에서 수식 텍스트와 계산된 값을 함께 읽는 시트 파서 (data_only=True로 생성)"""
+
+        def parse_cell(self, element):
+            셀 = super().parse_cell(element)
+            # 공유 수식은 parse_formula()가 셀 좌표에 맞게 변환
+            셀["formula"] = self.parse_formula(element) if element.find(FORMULA_TAG) is not None else 셀["value"]
+            return 셀
+
+
+def _판다스_셀값(값, 자료형):
+    """pd.read_excel(engine="openpyxl")과 같은 셀 값 변환 (빈 셀 "", 오류 NaN, 정수로 표현되는 실수는 int)"""
+    if 값 is None:
+        return ""
+    if 자료형 == TYPE_ERROR:
+        return np.nan
+    if 자료형 == TYPE_NUMERIC:
+        정수 = int(값)
+        return 정수 if 정수 == 값 else float(값)
+    return 값
+
+
+class 시트_데이터:
+    """
+    시트 한 장의 셀 값
+
+    셀마다 (수식 또는 입력값, 계산된 값, 계산된 값 자료형)을 보관합니다.
+    max_row/max_column은 load_workbook()으로 연 워크시트와 같은 값입니다 (병합 셀 범위 포함).
+    """
+
+    def __init__(self, 이름: str, 셀: Dict[Tuple[int, int], Tuple[Any, Any, str]],
+                 max_row: int, max_column: int, 전체: bool):
+        self.이름 = 이름
+        self._셀 = 셀
+        self.max_row = max_row
+        self.max_column = max_column
+        self.전체 = 전체  # False면 읽기 범위 밖의 셀은 보관하지 않음
+
+    def 값(self, 행: int, 열) -> Any:
+        """수식 또는 입력값 (load_workbook(data_only=False)의 셀 값)"""
+        셀 = self._셀.get((행, self._열_번호(열)))
+        return 셀[0] if 셀 else None
+
+    def 계산값(self, 행: int, 열) -> Any:
+        """계산된 값 (load_workbook(data_only=True)의 셀 값)"""
+        셀 = self._셀.get((행, self._열_번호(열)))
+        return 셀[1] if 셀 else None
+
+    @staticmethod
+    def _열_번호(열) -> int:
+        return 열 if isinstance(열, int) else column_index_from_string(열)
+
+    def 셀_목록(self, 최대_행: int, 최대_열: int) -> Iterator[Tuple[int, int, Any]]:
+        """최대_행 × 최대_열 범위의 값이 있는 셀 (행, 열, 수식 또는 입력값)을 행 우선 순서로"""
+        범위_셀 = [(행, 열, 셀[0]) for (행, 열), 셀 in self._셀.items()
+                 if 행 <= 최대_행 and 열 <= 최대_열 and 셀[0] is not None]
+        범위_셀.sort(key=lambda 셀: (셀[0], 셀[1]))
+        return iter(범위_셀)
+
+    def 열_배열(self, 열, 시작_행: int, 행수: int, 계산값: bool = False) -> np.ndarray:
+        """
+        열 하나의 값 배열 (복사용)
+
+        Args:
+            열: 열 문자 또는 번호
+            시작_행: 첫 데이터 행 번호
+            행수: 읽을 행 수
+            계산값: True면 계산된 값, False면 수식 또는 입력값
+
+        Returns:
+            object 배열 (빈 셀은 None)
+        """
+        번호 = self._열_번호(열)
+        위치 = 1 if 계산값 else 0
+        배열 = np.empty(행수, dtype=object)
+        배열[:] = [셀[위치] if 셀 else None
+                  for 셀 in (self._셀.get((행, 번호)) for 행 in range(시작_행, 시작_행 + 행수))]
+        return 배열
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        계산된 값으로 DataFrame 생성 (pd.read_excel(파일, sheet_name=시트, header=0)과 같은 결과)
+
+        Raises:
+            ValueError: 읽기 범위만 보관한 시트일 때
+        """
+        if not self.전체:
+            raise ValueError(f"'{self.이름}' 시트는 전체 셀을 읽지 않았습니다.")
+
+        행별: Dict[int, Dict[int, Any]] = {}
+        for (행, 열), 셀 in self._셀.items():
+            행별.setdefault(행, {})[열] = _판다스_셀값(셀[1], 셀[2])
+
+        data: List[List[Any]] = []
+        마지막_행 = max(행별) if 행별 else 0
+        for 행 in range(1, 마지막_행 + 1):
+            행_값 = 행별.get(행, {})
+            너비 = max(행_값) if 행_값 else 0
+            값_목록 = [행_값.get(열, "") for 열 in range(1, 너비 + 1)]
+            while 값_목록 and 값_목록[-1] == "":
+                값_목록.pop()
+            data.append(값_목록)
+
+        # 뒤쪽 빈 행 제거 후 행 너비 맞추기
+        while data and not data[-1]:
+            data.pop()
+        if not data:
+            return pd.DataFrame()
+        최대_너비 = max(len(행_값) for 행_값 in data)
+        data = [행_값 + [""] * (최대_너비 - len(행_값)) for 행_값 in data]
+
+        try:
+            return TextParser(data, header=0, skip_blank_lines=False).read()
+        except EmptyDataError:
+            return pd.DataFrame()
+
+
+class 통합문서_데이터:
+    """작성요청 파일의 시트별 데이터 (시트명 순서는 원본과 같음)"""
+
+    def __init__(self, 시트: Dict[str, 시트_데이터]):
+        self._시트 = 시트
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._시트)
+
+    def __getitem__(self, 시트명: str) -> 시트_데이터:
+        return self._시트[시트명]
+
+    def __contains__(self, 시트명: str) -> bool:
+        return 시트명 in self._시트
+
+
+def _내부_API_사용가능(wb) -> bool:
+    """시트 XML을 직접 파싱할 수 있는 openpyxl 버전인지"""
+    return (WorkSheetParser is not None
+            and all(hasattr(wb, 속성) for 속성 in _통합문서_내부_속성)
+            and all(hasattr(ws, "_worksheet_path") for ws in wb.worksheets))
+
+
+def _시트_읽기(wb, ws, 이름: str, 전체: bool, 최대_행: int, 최대_열: int) -> 시트_데이터:
+    셀: Dict[Tuple[int, int], Tuple[Any, Any, str]] = {}
+    마지막_행 = 마지막_열 = 0
+    with wb._archive.open(ws._worksheet_path) as src:
+        parser = _수식_값_파서(src, wb.shared_strings, data_only=True, epoch=wb.epoch,
+                              date_formats=wb._date_formats, timedelta_formats=wb._timedelta_formats)
+        for _, 행_셀 in parser.parse():
+            for c in 행_셀:
+                행, 열 = c["row"], c["column"]
+                마지막_행 = max(마지막_행, 행)
+                마지막_열 = max(마지막_열, 열)
+                # 서식만 있는 빈 셀은 크기에만 반영하고 보관하지 않음 (_두번_읽기와 같은 셀 구성)
+                if c["formula"] is None and c["value"] is None:
+                    continue
+                if 전체 or (행 <= 최대_행 and 열 <= 최대_열):
+                    셀[(행, 열)] = (c["formula"], c["value"], c["data_type"])
+
+        # 병합 셀 범위도 워크시트 크기에 포함 (load_workbook과 같은 max_row/max_column)
+        if parser.merged_cells:
+            for 병합 in parser.merged_cells.mergeCell:
+                min_col, min_row, max_col, max_row = range_boundaries(병합.ref)
+                if (min_col, min_row) != (max_col, max_row):
+                    마지막_행 = max(마지막_행, max_row)
+                    마지막_열 = max(마지막_열, max_col)
+
+    return 시트_데이터(이름, 셀, 마지막_행 or 1, 마지막_열 or 1, 전체)
+
+
+def _두번_읽기(파일명, 전체_시트: Optional[Callable[[str], bool]],
+           최대_행: int, 최대_열: int) -> 통합문서_데이터:
+    """openpyxl 공개 API만으로 읽기 (수식용, 계산된 값용 load_workbook() 두 번)"""
+    수식_wb = load_workbook(파일명, data_only=False)
+    값_wb = load_workbook(파일명, data_only=True)
+    시트 = {}
+    for 수식_ws in 수식_wb.worksheets:
+        값_ws = 값_wb[수식_ws.title]
+        전체 = 전체_시트 is None or 전체_시트(수식_ws.title)
+        마지막_행, 마지막_열 = 수식_ws.max_row, 수식_ws.max_column
+        읽을_행 = 마지막_행 if 전체 else min(마지막_행, 최대_행)
+        읽을_열 = 마지막_열 if 전체 else min(마지막_열, 최대_열)
+        셀: Dict[Tuple[int, int], Tuple[Any, Any, str]] = {}
+        for 수식_행, 값_행 in zip(수식_ws.iter_rows(max_row=읽을_행, max_col=읽을_열),
+                               값_ws.iter_rows(max_row=읽을_행, max_col=읽을_열)):
+            for 수식_셀, 값_셀 in zip(수식_행, 값_행):
+                if 수식_셀.value is not None or 값_셀.value is not None:
+                    셀[(수식_셀.row, 수식_셀.column)] = (수식_셀.value, 값_셀.value, 값_셀.data_type)
+        시트[수식_ws.title] = 시트_데이터(수식_ws.title, 셀, 마지막_행, 마지막_열, 전체)
+    return 통합문서_데이터(시트)
+
+
+def 통합문서_읽기(파일명, 전체_시트: Optional[Callable[[str], bool]] = None,
+             최대_행: int = 999, 최대_열: int = 49) -> 통합문서_데이터:
+    """
+    작성요청 파일을 한 번만 읽어 시트별 수식/계산된 값 추출
+
+    openpyxl 내부 API(시트 XML 파서)가 없는 버전에서는 load_workbook()을 두 번 사용합니다.
+
+    Args:
+        파일명: .xlsx 파일 경로
+        전체_시트: 모든 셀을 보관할 시트인지 판단하는 함수 (None이면 모든 시트)
+        최대_행: 그 밖의 시트에서 보관할 최대 행 번호
+        최대_열: 그 밖의 시트에서 보관할 최대 열 번호
+
+    Returns:
+        통합문서_데이터
+    """
+    wb = load_workbook(파일명, read_only=True)
+    try:
+        if not _내부_API_사용가능(wb):
+            return _두번_읽기(파일명, 전체_시트, 최대_행, 최대_열)
+        시트 = {}
+        for ws in wb.worksheets:
+            전체 = 전체_시트 is None or 전체_시트(ws.title)
+            시트[ws.title] = _시트_읽기(wb, ws, ws.title, 전체, 최대_행, 최대_열)
+        return 통합문서_데이터(시트)
+    finally:
+        wb.close()
@@ -0,0 +1,11 @@
+"""
+테스트에서 error_check 패키지를 import할 수 있도록 저장소 루트를 경로에 추가
+"""
+
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+if str(REPO_DIR) not in sys.path:
+    sys.path.insert(0, str(REPO_DIR))
@@ -0,0 +1,93 @@
+"""
+error_check 작성요청 파일 읽기 검증
+시트 XML 한 번 읽기(통합문서_읽기)와 공개 API로 두 번 읽기(_두번_읽기)의 셀/크기 일치,
+to_frame()과 pd.read_excel의 결과 일치
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
+from pandas.testing import assert_frame_equal
+
+from error_check.workbook import WorkSheetParser, 통합문서_읽기, _두번_읽기
+
+DATA_FILES = sorted((Path(__file__).resolve().parent.parent / "명부 에이전트" / "data").glob("*.xlsx"))
+
+pytestmark = pytest.mark.skipif(WorkSheetParser is None, reason="openpyxl 시트 파서 내부 API 없음")
+
+
+def _assert_same_cells(파일명, 전체_시트=None, 최대_행: int = 999, 최대_열: int = 49) -> None:
+    """한 번 읽기와 두 번 읽기의 시트별 셀과 크기 비교"""
+    한번 = 통합문서_읽기(파일명, 전체_시트, 최대_행, 최대_열)
+    두번 = _두번_읽기(파일명, 전체_시트, 최대_행, 최대_열)
+
+    assert 한번.sheetnames == 두번.sheetnames
+    for 시트명 in 한번.sheetnames:
+        a, b = 한번[시트명], 두번[시트명]
+        assert (a.max_row, a.max_column) == (b.max_row, b.max_column), 시트명
+        assert a._셀 == b._셀, 시트명
+
+
+def _assert_frames_match(파일명) -> None:
+    """모든 셀을 읽은 시트의 to_frame()과 pd.read_excel 비교"""
+    통합문서 = 통합문서_읽기(파일명)
+    for 시트명 in 통합문서.sheetnames:
+        expected = pd.read_excel(파일명, sheet_name=시트명, header=0, engine="openpyxl")
+        assert_frame_equal(통합문서[시트명].to_frame(), expected, obj=시트명)
+
+
+@pytest.fixture
+def 작성요청(tmp_path) -> Path:
+    """수식, 날짜, 불리언, 병합 셀, 서식만 있는 빈 셀이 섞인 작성요청 파일"""
+    경로 = tmp_path / "작성요청.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "재직자 명부"
+    ws.append(["사원번호", "생년월일", "기준급여", "추계액", "임원여부"])
+    for i in range(1, 6):
+        ws.append([100000 + i, datetime(1980, 1, i), 3000000 + i, f"=C{i + 1}*12", i % 2 == 0])
+    ws.append([None, None, None, "=SUM(D2:D6)", None])
+    # 서식만 있는 빈 셀 (크기에는 포함, 값은 없음)
+    노랑 = PatternFill("solid", fgColor="FFFF00")
+    for 행 in range(10, 40):
+        for 열 in range(1, 8):
+            ws.cell(row=행, column=열).fill = 노랑
+    ws.merge_cells("G2:H3")
+
+    기초 = wb.create_sheet("기초자료")
+    기초.append(["항목", "값"])
+    기초.append(["할인율", 0.045])
+    기초.append(["평가기준일", datetime(2022, 12, 31)])
+    기초.append(["비고", None])
+    기초.cell(row=20, column=30, value="범위 밖")
+    wb.save(경로)
+    return 경로
+
+
+def test_single_pass_matches_two_pass(작성요청):
+    _assert_same_cells(작성요청)
+
+
+def test_single_pass_matches_two_pass_within_read_range(작성요청):
+    _assert_same_cells(작성요청, 전체_시트=lambda 시트명: 시트명 == "재직자 명부", 최대_행=3, 최대_열=2)
+
+
+def test_styled_empty_cells_are_not_stored(작성요청):
+    시트 = 통합문서_읽기(작성요청)["재직자 명부"]
+
+    assert (시트.max_row, 시트.max_column) == (39, 8)
+    assert max(행 for 행, _ in 시트._셀) == 7
+
+
+def test_to_frame_matches_read_excel(작성요청):
+    _assert_frames_match(작성요청)
+
+
+@pytest.mark.parametrize("파일명", DATA_FILES, ids=lambda p: p.name)
+def test_bundled_workbook(파일명):
+    _assert_same_cells(파일명)
+    _assert_frames_match(파일명)
@@ -0,0 +1,249 @@
+"""
+검증 파이프라인 벤치마크
+오류를 심은 합성 명부 워크북을 크기별로 만들어 로드 → 검증 → 리포트 전체 과정을 API 없이 실행하고
+단계별 소요 시간, 프롬프트 토큰 수, 규칙 검증 재현율/정밀도를 측정
+
+사용 예:
+    python benchmark.py --sizes 100 1000 10000
+    python benchmark.py --llm record --recording output/benchmark/replay.jsonl   (실제 API로 응답 기록)
+    python benchmark.py --llm replay --recording output/benchmark/replay.jsonl   (기록한 응답으로 재현)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.loader import ExcelLoader, LOADER_ENGINES
+from core.agent import AuditAgent
+from core.reporter import ReportGenerator
+from core.fake_llm import FAKE_RESPONSE, FakeChatModel, ReplayChatModel, RecordingChatModel
+from core.synthetic import generate_roster_workbook
+from core.tokens import count_tokens
+
+
+def parse_args():
+    """
+    명령행 인자 파싱
+
+    Returns:
+        파싱된 인자 (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description="검증 파이프라인 벤치마크 (합성 명부, 오프라인 LLM)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="합성 워크북의 재직자 수 목록 (기본값: 100 1000 10000)")
+    parser.add_argument("--anomaly-rate", type=float, default=0.01,
+                        help="오류 종류별로 오류를 심을 재직자 비율 (기본값: 0.01)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="합성 데이터와 가짜 모델의 무작위 값 시드 (기본값: 0)")
+    parser.add_argument("--llm", choices=["synthetic", "replay", "record"], default="synthetic",
+                        help="synthetic: 가짜 모델, replay: 기록한 응답 재생, "
+                             "record: 실제 API 응답을 기록 (기본값: synthetic)")
+    parser.add_argument("--recording", type=Path,
+                        default=PROJECT_ROOT / "output" / "benchmark" / "replay.jsonl",
+                        help="replay/record 모드의 응답 기록 파일 (JSONL)")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="synthetic 모드의 응답 지연 시간(초) (기본값: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="synthetic 모드의 지연 시간 무작위 편차 최대값(초)")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0,
+                        help="synthetic 모드에서 호출마다 429 오류가 발생할 확률")
+    parser.add_argument("--error-probability", type=float, default=0.0,
+                        help="synthetic 모드에서 호출마다 서버 오류(500)가 발생할 확률")
+    parser.add_argument("--retry-after", type=float, default=0.05,
+                        help="synthetic 모드 429 오류의 재시도 대기 시간(초) (기본값: 0.05)")
+    parser.add_argument("--engine", choices=LOADER_ENGINES, default="native",
+                        help="엑셀 로드 엔진 (기본값: native)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="동시에 진행할 시트별 AI 검증 호출 수 (기본값: 1)")
+    parser.add_argument("--serializer", choices=["delimited", "keyed", "text"], default="delimited",
+                        help="시트 데이터를 AI에 보내는 형식 (기본값: delimited)")
+    parser.add_argument("--profile", action="store_true",
+                        help="행 데이터 대신 시트 통계 프로파일만 AI에 보냄")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / "output" / "benchmark",
+                        help="합성 워크북, 리포트, 결과 JSON 저장 디렉토리")
+    return parser.parse_args()
+
+
+def echo_findings(prompt: str) -> str:
+    """
+    synthetic 모드 응답: 프롬프트에 담긴 규칙 검증 문제 목록을 그대로 설명문으로 돌려줌
+
+    문제 목록이 없는 프롬프트(프로파일, 시트 전체 검증)에는 고정 문구를 돌려줍니다.
+    """
+    lines = [line for line in prompt.splitlines() if line.startswith("- [")]
+    if not lines:
+        return FAKE_RESPONSE
+    return "담당자님, 규칙 검증에서 확인된 문제를 설명드립니다.\n" + "\n".join(lines)
+
+
+def create_llm(args):
+    """
+    벤치마크 모드에 맞는 채팅 모델 생성
+
+    Returns:
+        FakeChatModel, ReplayChatModel 또는 RecordingChatModel
+    """
+    if args.llm == "replay":
+        if not args.recording.exists():
+            raise SystemExit(f"❌ 오류: 응답 기록 파일이 없습니다: {args.recording} "
+                             f"(--llm record로 먼저 기록하세요)")
+        return ReplayChatModel(args.recording)
+
+    if args.llm == "record":
+        from dotenv import load_dotenv
+        from langchain_openai import ChatOpenAI
+
+        load_dotenv(PROJECT_ROOT / ".env")
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise SystemExit("❌ 오류: record 모드에는 .env 파일의 OPENAI_API_KEY가 필요합니다.")
+        return RecordingChatModel(
+            ChatOpenAI(model="gpt-4o-mini", temperature=0, openai_api_key=api_key),
+            args.recording
+        )
+
+    return FakeChatModel(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_probability=args.rate_limit_probability,
+        retry_after=args.retry_after,
+        error_probability=args.error_probability,
+        responder=echo_findings,
+        seed=args.seed
+    )
+
+
+def score_findings(planted: List[Dict[str, Any]], audit_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    심은 오류와 검증 결과 비교
+
+    Args:
+        planted: generate_roster_workbook()이 반환한 심은 오류 리스트
+        audit_results: agent.audit_data() 결과
+
+    Returns:
+        {"planted", "found", "true_positives", "recall", "precision", "opinion_recall"} 딕셔너리
+        - recall/precision: (규칙 ID, 시트, 행) 기준 규칙 검증 결과
+        - opinion_recall: 심은 오류의 사원번호가 해당 시트 AI 의견에 언급된 비율
+    """
+    expected = {(p["rule_id"], p["sheet"], p["row"]) for p in planted}
+    found = {(f["rule_id"], f["sheet"], f["row"]) for f in audit_results.get("rule_findings", [])}
+    true_positives = len(expected & found)
+
+    opinions = {f["sheet"]: str(f["result"]) for f in audit_results["findings"] if not f.get("error")}
+    mentioned = sum(1 for p in planted if p["employee_id"] in opinions.get(p["sheet"], ""))
+
+    return {
+        "planted": len(expected),
+        "found": len(found),
+        "true_positives": true_positives,
+        "recall": true_positives / len(expected) if expected else 1.0,
+        "precision": true_positives / len(found) if found else 1.0,
+        "opinion_recall": mentioned / len(planted) if planted else 1.0,
+    }
+
+
+def run_size(args, employees: int, output_dir: Path) -> Dict[str, Any]:
+    """
+    합성 워크북 하나로 로드 → 검증 → 리포트 실행
+
+    Args:
+        args: 명령행 인자
+        employees: 재직자 수
+        output_dir: 저장 디렉토리
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    workbook_path = output_dir / f"synthetic_{employees}.xlsx"
+    stages = {}
+
+    start = time.perf_counter()
+    planted = generate_roster_workbook(workbook_path, employees, args.anomaly_rate, args.seed)
+    stages["generate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loader = ExcelLoader(output_dir, engine=args.engine)
+    dataframes = loader.load_excel(workbook_path)
+    stages["load"] = time.perf_counter() - start
+
+    llm = create_llm(args)
+    agent = AuditAgent(
+        api_key="benchmark",
+        llm=llm,
+        max_concurrency=args.concurrency,
+        serializer=args.serializer,
+        profile_mode=args.profile,
+        max_retries=5
+    )
+    start = time.perf_counter()
+    audit_results = agent.audit_data(dataframes)
+    stages["audit"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report_path = ReportGenerator(output_dir).generate_report(audit_results, source_file=workbook_path.name)
+    stages["report"] = time.perf_counter() - start
+
+    return {
+        "employees": employees,
+        "rows": sum(len(df) for df in dataframes.values()),
+        "stages": stages,
+        "pipeline_seconds": stages["load"] + stages["audit"] + stages["report"],
+        "llm_calls": len(llm.prompts),
+        "prompt_tokens": sum(count_tokens(prompt) for prompt in llm.prompts),
+        "llm_errors": sum(1 for f in audit_results["findings"] if f.get("error")),
+        "rate_limited": getattr(llm, "rate_limited", 0),
+        "scores": score_findings(planted, audit_results),
+        "report": str(report_path),
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    """측정 결과를 표로 출력"""
+    header = (f"{'재직자 수':>10} {'전체 행':>8} {'로드(초)':>9} {'검증(초)':>9} {'리포트(초)':>10} "
+              f"{'호출':>5} {'프롬프트 토큰':>12} {'재현율':>7} {'정밀도':>7} {'의견 언급률':>10}")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        s = r["stages"]
+        print(f"{r['employees']:>10} {r['rows']:>8} {s['load']:>9.2f} {s['audit']:>9.2f} {s['report']:>10.2f} "
+              f"{r['llm_calls']:>5} {r['prompt_tokens']:>12} {r['scores']['recall']:>7.1%} "
+              f"{r['scores']['precision']:>7.1%} {r['scores']['opinion_recall']:>10.1%}")
+
+
+def main():
+    """크기별 벤치마크 실행 후 표 출력 및 JSON 저장"""
+    args = parse_args()
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 60)
+    print(f"검증 파이프라인 벤치마크 (LLM: {args.llm}, 크기: {args.sizes})")
+    print("=" * 60)
+
+    results = []
+    for employees in args.sizes:
+        print(f"\n[재직자 {employees}명] 합성 워크북 생성 및 검증 중...")
+        results.append(run_size(args, employees, args.output))
+
+    print("\n" + "=" * 60)
+    print_table(results)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    result_path = args.output / f"benchmark_{timestamp}.json"
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"args": {k: str(v) for k, v in vars(args).items()}, "results": results},
+                  f, ensure_ascii=False, indent=2)
+    print(f"\n결과 파일: {result_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,163 @@ AI 에이전트 정의
 계리 지식을 바탕으로 데이터를 검증하는 AI 에이전트
 """
 
-from typing import Dict, List, Any
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
+from langchain_core.messages import AIMessage
 from langchain_openai import ChatOpenAI
 
+from .findings import (
+    RESPONSE_FORMAT,
+    count_by_severity,
+    merge_findings,
+    narrate_findings,
+    parse_findings,
+    structured_instructions,
+)
+from .incremental import (
+    STATE_VERSION,
+    STATUS_NEW,
+    STATUS_UNCHANGED,
+    SheetDelta,
+    delta_frame,
+    mark_statuses,
+    sheet_state,
+    status_key,
+)
+from .llm_cache import LLMCache
+from .metrics import MetricsLog, call_record, summarize_metrics
+from .profile import profile_sheet, format_profile
+from .normalize import find_column
+from .serializer import estimate_frame_tokens, get_serializer, measure_savings
+from .ratelimit import RateLimiter
+from .scheduler import RequestScheduler, RetryPolicy
+from .rules import RuleEngine, VALUATION_DATE, excel_row
+from .tokens import count_tokens
+
+
+# 규칙 검증에서 문제가 없을 때의 피드백 (LLM 호출 없이 사용)
+NO_ISSUE_MESSAGE = "담당자님, 이 시트의 데이터를 검토한 결과 특별한 문제가 발견되지 않았습니다."
+NOT_ROSTER_MESSAGE = "담당자님, 이 시트는 사원번호가 있는 명부가 아니어서 규칙 검증 대상에서 제외했습니다."
+
+# 설명을 위해 LLM에 보내는 시트당 최대 문제 행 수
+MAX_EXPLAIN_ROWS = 200
+
+# 속도 제한/일시적 오류 재시도 기본 대기 시간(초, 시도마다 2배)과 상한
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# 시트를 나눠 검증할 때 조각 하나에 담을 데이터 토큰 수 기본값
+DEFAULT_CHUNK_TOKENS = 6000
+
+# 프로파일 모드에서 함께 보내는 예시 행 수
+PROFILE_SAMPLE_ROWS = 5
+
+# 구조화된 발견 사항의 구어체 설명 방식
+NARRATIVE_MODES = ("template", "llm", "none")
+
+
+def _chat_openai(model_name: str, api_key: str) -> ChatOpenAI:
+    """
+    ChatOpenAI 생성 (스트리밍 응답에도 토큰 사용량이 오도록 stream_usage 지정)
+    
+    stream_usage 필드가 없는 이전 langchain-openai에서는 지정하지 않고,
+    그때는 _record_call()이 토크나이저로 센 토큰 수를 사용합니다.
+    """
+    fields = getattr(ChatOpenAI, "model_fields", None) or getattr(ChatOpenAI, "__fields__", {})
+    options = {"stream_usage": True} if "stream_usage" in fields else {}
+    return ChatOpenAI(model=model_name, temperature=0, openai_api_key=api_key, **options)
+
 
 class AuditAgent:
     """확정급여채무평가 데이터를 검증하는 AI 에이전트"""
     
-    def __init__(self, api_key: str, model_name: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gpt-4o-mini",
+        use_rules: bool = True,
+        valuation_date: pd.Timestamp = VALUATION_DATE,
+        llm=None,
+        max_concurrency: int = 1,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 3,
+        chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        cache_path: Optional[Path] = None,
+        cache_max_bytes: int = 256 * 1024 * 1024,
+        cache_max_age_days: Optional[float] = 30,
+        serializer="delimited",
+        profile_mode: bool = False,
+        metrics_log: Optional[Path] = None,
+        structured: bool = False,
+        narrative: str = "template",
+        incremental: bool = False
+    ):
         """
         Args:
             api_key: OpenAI API 키
             model_name: 사용할 모델 이름 (기본값: gpt-4o-mini)
+            use_rules: True면 규칙 엔진으로 전체 명부를 먼저 검증하고
+                LLM에는 문제가 발견된 행만 보내 구어체 설명을 받음
+                (False면 시트 전체를 LLM에 보내는 기존 방식)
+            valuation_date: 규칙 검증 평가기준일 (기본값: 2022.12.31)
+            llm: 사용할 채팅 모델 (None이면 ChatOpenAI, 시험 시 FakeChatModel 등)
+            max_concurrency: 동시에 진행할 시트별 LLM 호출 수 (기본값: 1, 순차 실행)
+            requests_per_minute: 분당 최대 LLM 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 분당 최대 프롬프트 토큰 수 (None이면 제한 없음)
+            max_retries: 속도 제한(429)과 일시적 오류(5xx, 시간 초과, 연결 오류) 시 재시도 횟수
+            chunk_tokens: 시트 전체 또는 규칙 검증 문제 행을 LLM에 보낼 때 조각 하나에 담을 데이터 토큰 수
+                (이보다 크면 조각별로 검증/설명한 뒤 의견을 하나로 합침)
+            cache_path: LLM 응답 캐시 파일 경로 (None이면 캐시 사용 안 함)
+            cache_max_bytes: 응답 캐시 최대 크기
+            cache_max_age_days: 응답 캐시 유효 기간(일) (None이면 기간 제한 없음)
+            serializer: 시트 데이터를 프롬프트 텍스트로 바꾸는 형식
+                ("delimited", "keyed", "text"(기존 to_string) 또는 serialize_lines(df)를 가진 객체)
+            profile_mode: True면 행 데이터 대신 시트 통계 프로파일과 예시 행만 LLM에 보냄
+                (직원 수와 관계없이 시트당 프롬프트 크기가 거의 일정, 규칙 검증 결과는 함께 전달)
+            metrics_log: LLM 호출 지표를 덧붙여 기록할 JSONL 파일 경로 (None이면 기록 안 함)
+            structured: True면 LLM에 JSON 스키마로 발견 사항(규칙 ID, 심각도, 사원번호, 시트, 행,
+                메시지)을 요청하여 audit_results["structured_findings"]에 모으고,
+                규칙 검증 결과는 LLM 호출 없이 그대로 사용
+            narrative: structured=True일 때 시트별 구어체 설명 방식
+                ("template": 발견 사항으로 바로 작성, "llm": 발견 사항을 LLM에 보내 작성,
+                "none": 건수만 안내)
+            incremental: True면 시트별 행 해시 상태를 audit_results["audit_state"]에 담고,
+                audit_data(baseline=이전 상태)로 호출하면 추가/삭제/수정된 행만 AI로 다시 검증
+                (structured=True로 동작, 규칙 검증은 매번 전체 행으로 수행하고 그 결과는 LLM 호출 없이
+                설명하므로 행 단위 증분 AI 검증은 use_rules=False 또는 profile_mode=True일 때 적용)
         """
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=0,
-            openai_api_key=api_key
-        )
+        if narrative not in NARRATIVE_MODES:
+            raise ValueError(f"지원하지 않는 설명 방식입니다: {narrative} (사용 가능: {', '.join(NARRATIVE_MODES)})")
+        
+        self.llm = llm if llm is not None else _chat_openai(model_name, api_key)
         self.api_key = api_key
+        self.model_name = model_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.retry_policy = RetryPolicy(max_retries, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+        self.chunk_tokens = max(1, chunk_tokens)
+        self.temperature = getattr(self.llm, "temperature", 0)
+        self.serializer = get_serializer(serializer)
+        self.profile_mode = profile_mode
+        self.valuation_date = pd.Timestamp(valuation_date)
+        self.serializer_name = getattr(self.serializer, "name", type(self.serializer).__name__)
+        self.cache = LLMCache(cache_path, cache_max_bytes, cache_max_age_days) if cache_path else None
+        self.rule_engine = RuleEngine(valuation_date) if use_rules else None
+        self.metrics_log = MetricsLog(metrics_log) if metrics_log else None
+        self.incremental = incremental
+        self.structured = structured or incremental
+        self.narrative = narrative
+        # OpenAI 모델에는 JSON 스키마를 응답 형식으로 지정 (다른 모델은 프롬프트 지침만 사용)
+        self.structured_llm = (self.llm.bind(response_format=RESPONSE_FORMAT)
+                               if self.structured and isinstance(self.llm, ChatOpenAI) else self.llm)
+        # 스트리밍을 지원하는 모델은 스트리밍으로 호출하여 첫 토큰까지 시간 측정
+        self.stream_responses = hasattr(self.llm, "stream") and hasattr(self.llm, "astream")
     
     def _get_audit_prompt(self) -> str:
         """
@@ -62,63 +199,839 @@ class AuditAgent:
 """
         return prompt
     
-    def audit_data(self, dataframes: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+    def audit_data(self, dataframes: Dict[str, pd.DataFrame],
+                   baseline: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         여러 DataFrame을 검증하고 결과를 반환
         
+        max_concurrency가 2 이상이면 시트별 LLM 호출을 동시에 진행합니다
+        (audit_data_async 참고).
+        
+        Args:
+            dataframes: {시트명: DataFrame} 형태의 딕셔너리
+            baseline: 증분 검증에서 비교할 이전 검증의 audit_results["audit_state"]
+                (None이면 전체 검증, incremental=True일 때만 사용)
+            
+        Returns:
+            검증 결과 딕셔너리
+        """
+        if self.max_concurrency > 1:
+            return asyncio.run(self.audit_data_async(dataframes, baseline))
+        
+        start = time.perf_counter()
+        audit_results, tasks = self._plan_audit(dataframes, baseline)
+        limiter = RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+        
+        # 각 시트별로 검증 수행
+        for sheet_name, prompts, result in tasks:
+            print(f"      - {sheet_name} 검증 중...{self._chunk_note(prompts)}")
+            
+            if prompts:
+                try:
+                    # AI에게 직접 질문 (코드 실행 없이), 조각별 결과는 reduce 단계에서 합침
+                    partials = [self._ask(sheet_name, prompt, audit_results, limiter, self.structured)
+                                for prompt in prompts]
+                    while True:
+                        merged, reduce_prompts = self._plan_reduce(sheet_name, partials, audit_results)
+                        if merged is not None:
+                            break
+                        partials = [self._ask(sheet_name, prompt, audit_results, limiter)
+                                    for prompt in reduce_prompts]
+                    result = merged
+                except Exception as e:
+                    result = e
+            
+            self._record_result(audit_results, sheet_name, result)
+        
+        # 구조화된 발견 사항의 구어체 설명을 LLM으로 작성
+        for entry, prompt in self._plan_narratives(audit_results):
+            try:
+                entry["result"] = self._ask(entry["sheet"], prompt, audit_results, limiter)
+            except Exception as e:
+                print(f"      ⚠️  시트 '{entry['sheet']}' 설명 작성 실패, 기본 설명 사용: {str(e)}")
+        
+        # 호출 지표 집계 후 전체 요약 생성
+        self._sort_findings(audit_results, list(dataframes))
+        self._finish_incremental(audit_results, baseline)
+        self._finish_metrics(audit_results, time.perf_counter() - start)
+        audit_results["summary"] = self._generate_summary(audit_results)
+        
+        return audit_results
+    
+    async def audit_data_async(self, dataframes: Dict[str, pd.DataFrame],
+                               baseline: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        시트별(조각별) LLM 호출을 동시에 진행하여 검증 (결과는 원래 시트 순서대로 기록)
+        
+        호출은 RequestScheduler를 거칩니다. 동시 호출 수는 max_concurrency로 제한하고,
+        RPM/TPM 예산을 넘지 않도록 호출 전에 대기하며, 작은 요청과 재시도 요청을 먼저 처리합니다.
+        속도 제한(429)과 일시적 오류는 Retry-After 또는 지터를 섞은 지수 백오프 간격으로
+        max_retries번까지 다시 시도합니다.
+        
         Args:
             dataframes: {시트명: DataFrame} 형태의 딕셔너리
+            baseline: 증분 검증에서 비교할 이전 검증 상태 (audit_data 참고)
             
         Returns:
             검증 결과 딕셔너리
         """
+        start = time.perf_counter()
+        audit_results, tasks = self._plan_audit(dataframes, baseline)
+        
+        scheduler = RequestScheduler(
+            self._ainvoke_timed,
+            max_concurrency=self.max_concurrency,
+            limiter=RateLimiter(self.requests_per_minute, self.tokens_per_minute),
+            policy=self.retry_policy,
+            on_retry=self._report_retry
+        )
+        
+        async def ask(sheet_name: str, prompt: str, structured: bool = False) -> str:
+            key, cached = self._cache_lookup(sheet_name, prompt, audit_results)
+            if cached is not None:
+                return cached
+            request = await scheduler.submit(prompt, count_tokens(prompt, self.model_name), structured=structured)
+            self._record_call(audit_results, sheet_name, prompt, request.response, request.latency,
+                              request.ttft, request.retries, request.error)
+            if request.error is not None:
+                raise request.error
+            self._cache_store(key, request.response)
+            return request.response.content
+        
+        async def audit_sheet(sheet_name: str, prompts: List[str], result: Any) -> Any:
+            if not prompts:
+                return result
+            print(f"      - {sheet_name} 검증 중...{self._chunk_note(prompts)}")
+            try:
+                partials = await asyncio.gather(*(ask(sheet_name, prompt, self.structured) for prompt in prompts))
+                while True:
+                    merged, reduce_prompts = self._plan_reduce(sheet_name, partials, audit_results)
+                    if merged is not None:
+                        return merged
+                    partials = await asyncio.gather(*(ask(sheet_name, prompt) for prompt in reduce_prompts))
+            except Exception as e:
+                return e
+        
+        async def narrate(entry: Dict[str, Any], prompt: str) -> None:
+            try:
+                entry["result"] = await ask(entry["sheet"], prompt)
+            except Exception as e:
+                print(f"      ⚠️  시트 '{entry['sheet']}' 설명 작성 실패, 기본 설명 사용: {str(e)}")
+        
+        async with scheduler:
+            results = await asyncio.gather(*(audit_sheet(*task) for task in tasks))
+            
+            for (sheet_name, _, _), result in zip(tasks, results):
+                self._record_result(audit_results, sheet_name, result)
+            
+            # 구조화된 발견 사항의 구어체 설명을 LLM으로 작성
+            await asyncio.gather(*(narrate(entry, prompt) for entry, prompt in self._plan_narratives(audit_results)))
+        
+        # 호출 지표 집계 후 전체 요약 생성
+        self._sort_findings(audit_results, list(dataframes))
+        self._finish_incremental(audit_results, baseline)
+        self._finish_metrics(audit_results, time.perf_counter() - start)
+        audit_results["summary"] = self._generate_summary(audit_results)
+        
+        return audit_results
+    
+    def _ask(self, sheet_name: str, prompt: str, audit_results: Dict[str, Any],
+             limiter: RateLimiter, structured: bool = False) -> str:
+        """
+        LLM에 동기로 질문 (캐시에 같은 요청의 응답이 있으면 호출하지 않음)
+        
+        RPM/TPM 예산을 확보한 뒤 호출하고, 일시적 오류는 retry_policy에 따라 기다렸다가 다시 시도합니다.
+        
+        Args:
+            sheet_name: 시트명 (호출 지표 집계용)
+            prompt: 프롬프트 문자열
+            audit_results: 캐시 적중/미적중 수와 호출 지표를 기록할 검증 결과 딕셔너리
+            limiter: RPM/TPM 예산
+            structured: True면 JSON 스키마 응답 형식을 지정한 모델로 호출
+            
+        Returns:
+            응답 텍스트
+        """
+        key, cached = self._cache_lookup(sheet_name, prompt, audit_results)
+        if cached is not None:
+            return cached
+        
+        tokens = count_tokens(prompt, self.model_name)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            limiter.acquire_blocking(tokens)
+            try:
+                response, ttft = self._invoke_timed(prompt, structured)
+                break
+            except Exception as e:
+                if not self.retry_policy.should_retry(e, attempt):
+                    self._record_call(audit_results, sheet_name, prompt, None,
+                                      time.perf_counter() - start, retries=attempt, error=e)
+                    raise
+                delay = self.retry_policy.delay(e, attempt)
+                self._report_retry(None, e, delay, attempt)
+                time.sleep(delay)
+                attempt += 1
+        
+        self._record_call(audit_results, sheet_name, prompt, response,
+                          time.perf_counter() - start, ttft, retries=attempt)
+        self._cache_store(key, response)
+        return response.content
+    
+    def _report_retry(self, request, error: Exception, delay: float, attempt: Optional[int] = None) -> None:
+        """재시도 예약 안내 출력"""
+        attempt = request.retries if attempt is None else attempt
+        print(f"      ⚠️  {type(error).__name__}: {delay:.1f}초 후 다시 시도합니다 "
+              f"({attempt + 1}/{self.max_retries})")
+    
+    def _invoke_timed(self, prompt: str, structured: bool = False):
+        """
+        동기 LLM 호출 (스트리밍 가능한 모델은 조각을 이어 붙여 하나의 응답으로 만듦)
+        
+        Args:
+            prompt: 프롬프트 문자열
+            structured: True면 JSON 스키마 응답 형식을 지정한 모델로 호출
+        
+        Returns:
+            (응답 메시지, 첫 토큰까지 시간(초) 또는 None) 튜플
+        """
+        llm = self.structured_llm if structured else self.llm
+        if not self.stream_responses:
+            return llm.invoke(prompt), None
+        
+        start = time.perf_counter()
+        response, ttft = None, None
+        for chunk in llm.stream(prompt):
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            response = chunk if response is None else response + chunk
+        return (response if response is not None else AIMessage(content="")), ttft
+    
+    async def _ainvoke_timed(self, prompt: str, structured: bool = False):
+        """비동기 LLM 호출 (_invoke_timed 참고)"""
+        llm = self.structured_llm if structured else self.llm
+        if not self.stream_responses:
+            return await llm.ainvoke(prompt), None
+        
+        start = time.perf_counter()
+        response, ttft = None, None
+        async for chunk in llm.astream(prompt):
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            response = chunk if response is None else response + chunk
+        return (response if response is not None else AIMessage(content="")), ttft
+    
+    def _record_call(self, audit_results: Dict[str, Any], sheet_name: str, prompt: str, response,
+                     latency: float, ttft: Optional[float] = None, retries: int = 0,
+                     error: Optional[Exception] = None) -> None:
+        """
+        LLM 호출 하나의 지표를 검증 결과에 추가
+        
+        응답에 토큰 사용량(usage_metadata)이 없으면 토크나이저로 센 값을 사용합니다.
+        """
+        usage = getattr(response, "usage_metadata", None) or {}
+        metadata = getattr(response, "response_metadata", None) or {}
+        content = response.content if response is not None else ""
+        audit_results["llm_calls"].append(call_record(
+            sheet_name,
+            metadata.get("model_name") or self.model_name,
+            usage.get("input_tokens") or count_tokens(prompt, self.model_name),
+            usage.get("output_tokens") or count_tokens(content, self.model_name),
+            latency,
+            ttft=ttft,
+            retries=retries,
+            error=None if error is None else str(error)
+        ))
+    
+    def _sort_findings(self, audit_results: Dict[str, Any], sheet_order: List[str]) -> None:
+        """구조화된 발견 사항을 시트 순서, 행 순서로 정렬 (비동기 검증도 같은 순서가 되도록)"""
+        order = {sheet_name: i for i, sheet_name in enumerate(sheet_order)}
+        audit_results["structured_findings"].sort(
+            key=lambda f: (order.get(f["sheet"], len(order)), f["row"] or 0)
+        )
+    
+    def _finish_metrics(self, audit_results: Dict[str, Any], elapsed: float) -> None:
+        """호출 지표를 시트별/실행별로 집계하고 지표 로그 파일에 기록"""
+        audit_results["metrics"] = summarize_metrics(audit_results["llm_calls"], elapsed)
+        if self.metrics_log is not None:
+            self.metrics_log.append(audit_results["llm_calls"], audit_results["metrics"])
+    
+    def _cache_lookup(self, sheet_name: str, prompt: str,
+                      audit_results: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        응답 캐시 조회 후 적중/미적중 수 갱신 (적중하면 비용 0인 호출로 지표 기록)
+        
+        Returns:
+            (캐시 키, 캐시된 응답 텍스트) 튜플 (캐시를 쓰지 않으면 (None, None))
+        """
+        if self.cache is None:
+            return None, None
+        
+        key = self.cache.make_key(self.model_name, self.temperature, self._get_audit_prompt(), prompt)
+        try:
+            entry = self.cache.get(key)
+        except Exception as e:
+            print(f"      ⚠️  LLM 응답 캐시 읽기 실패 (무시): {str(e)}")
+            entry = None
+        
+        stats = audit_results["llm_cache"]
+        if entry is None:
+            stats["misses"] += 1
+            return key, None
+        
+        stats["hits"] += 1
+        audit_results["llm_calls"].append(call_record(
+            sheet_name, self.model_name, entry["prompt_tokens"], entry["completion_tokens"],
+            latency=0.0, cached=True
+        ))
+        return key, entry["response"]
+    
+    def _cache_store(self, key: Optional[str], response) -> None:
+        """LLM 응답과 토큰 사용량을 캐시에 저장"""
+        if self.cache is None or key is None:
+            return
+        
+        usage = getattr(response, "usage_metadata", None) or {}
+        self.cache.put(
+            key,
+            self.model_name,
+            response.content,
+            prompt_tokens=usage.get("input_tokens", 0),
+            completion_tokens=usage.get("output_tokens", 0)
+        )
+    
+    def _plan_audit(self, dataframes: Dict[str, pd.DataFrame], baseline: Optional[Dict[str, Any]] = None):
+        """
+        규칙 검증을 수행하고 시트별로 LLM에 보낼 프롬프트 준비
+        
+        증분 검증이면 규칙 검증은 전체 행으로 다시 하고(명부 간 비교가 필요하므로),
+        LLM에는 이전 검증 이후 추가/수정된 행만 보냅니다.
+        
+        Args:
+            dataframes: {시트명: DataFrame} 형태의 딕셔너리
+            baseline: 이전 검증 상태 (audit_data 참고)
+            
+        Returns:
+            (검증 결과 딕셔너리, 작업 리스트) 튜플
+            작업: (시트명, 프롬프트 리스트, 결과) - 프롬프트가 없으면 결과(텍스트 또는 예외)를 그대로 기록
+        """
         audit_results = {
             "sheets_audited": [],
             "findings": [],
+            "rule_findings": [],
+            "structured_findings": [],
+            "llm_cache": {"enabled": self.cache is not None, "hits": 0, "misses": 0},
+            "serialization": [],
+            "llm_calls": [],
+            "metrics": {},
             "summary": ""
         }
         
-        # 각 시트별로 검증 수행
-        for sheet_name, df in dataframes.items():
-            print(f"      - {sheet_name} 검증 중...")
+        # 규칙 엔진으로 전체 명부를 먼저 검증
+        findings_by_sheet = None
+        if self.rule_engine is not None:
+            rule_findings, index = self.rule_engine.run_indexed(dataframes)
+            audit_results["rule_findings"] = rule_findings
+            audit_results["employee_index"] = index.summary()
+            print(f"      - 사원번호 색인: {len(index)}명 ({audit_results['employee_index']['postings']}행)")
+            print(f"      - 규칙 검증: {len(rule_findings)}건 발견")
             
+            findings_by_sheet = {}
+            for finding in rule_findings:
+                findings_by_sheet.setdefault(finding["sheet"], []).append(finding)
+            if self.structured:
+                audit_results["structured_findings"] = [{**f, "source": "rule"} for f in rule_findings]
+        
+        deltas = {}
+        if self.incremental:
+            deltas = self._plan_deltas(dataframes, baseline, audit_results)
+        
+        tasks = []
+        for sheet_name, df in dataframes.items():
             try:
-                # DataFrame을 텍스트로 변환 (AI가 읽을 수 있게)
-                # 데이터가 너무 크면 처음 1000행만 사용
-                if len(df) > 1000:
-                    data_text = f"총 {len(df)}행 중 상위 1000행:\n{df.head(1000).to_string()}"
-                else:
-                    data_text = df.to_string()
+                if sheet_name in deltas and (self.profile_mode or findings_by_sheet is None):
+                    tasks.append(self._plan_incremental_sheet(sheet_name, df, deltas[sheet_name],
+                                                              baseline, findings_by_sheet, audit_results))
+                    continue
                 
-                # 프롬프트 작성
-                prompt = self._get_audit_prompt()
-                prompt += f"\n\n시트명: '{sheet_name}'\n"
-                prompt += f"컬럼명: {list(df.columns)}\n"
-                prompt += f"데이터:\n{data_text}\n"
-                prompt += "\n위 데이터를 읽어보고 이상한 부분이 있으면 피드백을 작성하세요."
-                
-                # AI에게 직접 질문 (코드 실행 없이)
-                response = self.llm.invoke(prompt)
-                result_text = response.content
+                if self.profile_mode:
+                    sheet_findings = (findings_by_sheet or {}).get(sheet_name, [])
+                    tasks.append((sheet_name, [self._build_profile_prompt(sheet_name, df, sheet_findings, audit_results)], None))
+                    continue
                 
-                audit_results["sheets_audited"].append(sheet_name)
-                audit_results["findings"].append({
-                    "sheet": sheet_name,
-                    "result": result_text
-                })
+                if findings_by_sheet is None:
+                    tasks.append((sheet_name, self._build_sheet_prompts(sheet_name, df, audit_results), None))
+                    continue
                 
+                sheet_findings = findings_by_sheet.get(sheet_name, [])
+                if sheet_findings and self.structured:
+                    # 규칙 검증 결과가 이미 구조화되어 있으므로 LLM 호출 없이 설명 작성
+                    tasks.append((sheet_name, [], self._narrate(sheet_name, audit_results)))
+                elif sheet_findings:
+                    tasks.append((sheet_name, self._build_explain_prompts(sheet_name, df, sheet_findings, audit_results), None))
+                else:
+                    # 문제가 없는 시트는 LLM을 호출하지 않음
+                    is_roster = find_column(df.columns, "employee_id") is not None
+                    tasks.append((sheet_name, [], NO_ISSUE_MESSAGE if is_roster else NOT_ROSTER_MESSAGE))
             except Exception as e:
-                error_msg = f"시트 '{sheet_name}' 검증 중 오류 발생: {str(e)}"
-                audit_results["findings"].append({
-                    "sheet": sheet_name,
-                    "result": error_msg,
-                    "error": True
-                })
-        
-        # 전체 요약 생성
-        audit_results["summary"] = self._generate_summary(audit_results)
+                tasks.append((sheet_name, [], e))
         
-        return audit_results
+        return audit_results, tasks
+    
+    def _plan_deltas(self, dataframes: Dict[str, pd.DataFrame], baseline: Optional[Dict[str, Any]],
+                     audit_results: Dict[str, Any]) -> Dict[str, SheetDelta]:
+        """
+        시트별 행 해시를 계산하여 이번 검증 상태를 만들고 이전 상태와 비교
+        
+        Returns:
+            {시트명: SheetDelta} 딕셔너리 (이전 상태가 없으면 모든 시트가 전체 검증 대상)
+        """
+        previous_sheets = (baseline or {}).get("sheets", {})
+        states = {sheet_name: sheet_state(df) for sheet_name, df in dataframes.items()}
+        deltas = {sheet_name: SheetDelta(previous_sheets.get(sheet_name), state)
+                  for sheet_name, state in states.items()}
+        
+        audit_results["audit_state"] = {"version": STATE_VERSION, "sheets": states, "findings": []}
+        audit_results["incremental"] = {sheet_name: delta.summary() for sheet_name, delta in deltas.items()}
+        if baseline is not None:
+            changed = sum(1 for delta in deltas.values() if delta.changed)
+            print(f"      - 증분 검증: {len(deltas)}개 시트 중 {changed}개 시트 변경")
+        
+        return deltas
+    
+    def _plan_incremental_sheet(self, sheet_name: str, df: pd.DataFrame, delta: SheetDelta,
+                                baseline: Optional[Dict[str, Any]],
+                                findings_by_sheet: Optional[Dict[str, List[Dict[str, Any]]]],
+                                audit_results: Dict[str, Any]) -> tuple:
+        """
+        증분 검증에서 시트 하나의 LLM 작업 준비
+        
+        변경되지 않은 행의 이전 AI 발견 사항은 새 행 번호로 옮겨 이어 쓰고, 추가/수정된 행만
+        프롬프트로 만듭니다. 프로파일은 시트 전체 통계이므로 시트가 바뀌었으면 전체를 다시 보냅니다.
+        
+        Returns:
+            (시트명, 프롬프트 리스트, 결과) 작업 튜플
+        """
+        if delta.full:
+            if self.profile_mode:
+                sheet_findings = (findings_by_sheet or {}).get(sheet_name, [])
+                return sheet_name, [self._build_profile_prompt(sheet_name, df, sheet_findings, audit_results)], None
+            return sheet_name, self._build_sheet_prompts(sheet_name, df, audit_results), None
+        
+        previous = [f for f in (baseline or {}).get("findings", [])
+                    if f["sheet"] == sheet_name and f.get("source") == "llm"]
+        if not delta.changed:
+            carried = [delta.carry_forward(f) for f in previous]
+            audit_results["structured_findings"].extend(f for f in carried if f is not None)
+            print(f"      - {sheet_name}: 변경 없음, 이전 검증 결과 재사용")
+            return sheet_name, [], self._narrate(sheet_name, audit_results)
+        
+        print(f"      - {sheet_name}: 추가 {len(delta.inserted)}행, 삭제 {len(delta.deleted)}행, "
+              f"수정 {len(delta.modified)}행")
+        if self.profile_mode:
+            sheet_findings = (findings_by_sheet or {}).get(sheet_name, [])
+            return sheet_name, [self._build_profile_prompt(sheet_name, df, sheet_findings, audit_results)], None
+        
+        carried = [delta.carry_forward(f) for f in previous]
+        audit_results["structured_findings"].extend(f for f in carried if f is not None)
+        if not delta.changed_positions:
+            # 삭제만 된 시트는 다시 검증할 행이 없음
+            return sheet_name, [], self._narrate(sheet_name, audit_results)
+        return sheet_name, self._build_sheet_prompts(sheet_name, delta_frame(df, delta), audit_results,
+                                                     changed_only=True), None
+    
+    def _finish_incremental(self, audit_results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+        """
+        발견 사항에 신규/유지 상태를 표시하고, 해결된 발견 사항과 다음 검증에 쓸 상태 정리
+
+        AI 검증에 실패한 시트는 행 해시를 저장하지 않아 다음 검증에서 전체를 다시 검증하고,
+        그 시트의 이전 AI 발견 사항은 해결로 표시하지 않고 다음 검증의 비교 기준으로 넘깁니다.
+        """
+        if not self.incremental:
+            return
+        state = audit_results["audit_state"]
+        failed = {entry["sheet"] for entry in audit_results["findings"] if entry.get("error")}
+        for sheet_name in failed:
+            state["sheets"].pop(sheet_name, None)
+
+        previous = (baseline or {}).get("findings", [])
+        held = [f for f in previous if f["sheet"] in failed and f.get("source") == "llm"]
+        previous = [f for f in previous if not (f["sheet"] in failed and f.get("source") == "llm")]
+        previous_sheets = (baseline or {}).get("sheets", {})
+        row_maps = {
+            sheet_name: SheetDelta(previous_sheets[sheet_name], sheet).row_map
+            for sheet_name, sheet in state["sheets"].items()
+            if sheet_name in previous_sheets
+        }
+        findings = audit_results["structured_findings"]
+        audit_results["resolved_findings"] = mark_statuses(findings, previous, row_maps)
+
+        saved = [{key: value for key, value in finding.items() if key != "status"} for finding in findings]
+        saved_keys = {status_key(finding) for finding in saved}
+        state["findings"] = saved + [f for f in held if status_key(f) not in saved_keys]
+    
+    def _record_result(self, audit_results: Dict[str, Any], sheet_name: str, result: Any) -> None:
+        """
+        시트 하나의 검증 결과(텍스트 또는 예외)를 검증 결과 딕셔너리에 추가
+        """
+        if isinstance(result, Exception):
+            error_msg = f"시트 '{sheet_name}' 검증 중 오류 발생: {str(result)}"
+            audit_results["findings"].append({
+                "sheet": sheet_name,
+                "result": error_msg,
+                "error": True
+            })
+            return
+        
+        audit_results["sheets_audited"].append(sheet_name)
+        audit_results["findings"].append({
+            "sheet": sheet_name,
+            "result": result
+        })
+    
+    def _build_sheet_prompts(self, sheet_name: str, df: pd.DataFrame,
+                             audit_results: Dict[str, Any], changed_only: bool = False) -> List[str]:
+        """
+        시트 전체를 LLM이 직접 검증하는 프롬프트 생성 (규칙 엔진 미사용 시)
+        
+        모든 행을 빠짐없이 보내기 위해 chunk_tokens 예산에 맞춰 행 단위 조각으로 나눕니다.
+        조각마다 헤더를 반복하므로 호출 수와 비용은 행 수에 비례합니다.
+        행마다 '엑셀 행' 번호를 첫 컬럼으로 보내 구조화된 발견 사항의 row가 원본 행을 가리키게 합니다.
+        
+        Args:
+            sheet_name: 시트명
+            df: 시트 DataFrame
+            audit_results: 직렬화 토큰 절감 내역을 기록할 검증 결과 딕셔너리
+            changed_only: True면 증분 검증에서 추린 변경 행만 담긴 df임을 프롬프트에 안내
+                (delta_frame()으로 추려 '엑셀 행' 컬럼이 이미 있음)
+            
+        Returns:
+            조각별 프롬프트 리스트 (시트가 작으면 1개)
+        """
+        if not changed_only:
+            df = df.reset_index(drop=True)
+            df.insert(0, "엑셀 행", [excel_row(p) for p in range(len(df))], allow_duplicates=True)
+        row_numbers = list(df.iloc[:, 0])
+        
+        header, rows = self._serialize(sheet_name, df, audit_results)
+        chunks = self._split_rows(header, rows)
+        
+        prompts = []
+        for i, (first, last, data_text) in enumerate(chunks, start=1):
+            # 프롬프트 작성
+            prompt = self._get_audit_prompt()
+            prompt += f"\n\n시트명: '{sheet_name}'\n"
+            if self.serializer_name == "text":
+                prompt += f"컬럼명: {list(df.columns)}\n"
+            if changed_only:
+                prompt += f"(지난 검증 이후 추가/수정된 {len(df)}행만 전달, '엑셀 행'은 원본 행 번호)\n"
+            if len(chunks) > 1:
+                prompt += (f"(전체 {len(df)}행 중 {first + 1}~{last + 1}번째 행, "
+                           f"엑셀 {row_numbers[first]}~{row_numbers[last]}행, 조각 {i}/{len(chunks)})\n")
+            prompt += f"데이터:\n{data_text}\n"
+            prompt += "\n위 데이터를 읽어보고 이상한 부분이 있으면 피드백을 작성하세요."
+            if self.structured:
+                prompt += structured_instructions(sheet_name)
+            prompts.append(prompt)
+        
+        return prompts
+    
+    def _serialize(self, sheet_name: str, df: pd.DataFrame, audit_results: Dict[str, Any]):
+        """
+        시트를 프롬프트용 텍스트 줄로 직렬화하고 df.to_string() 대비 토큰 수를 기록
+        
+        Returns:
+            (헤더 줄 리스트, 행별 줄 리스트) 튜플
+        """
+        header, rows = self.serializer.serialize_lines(df)
+        
+        if self.serializer_name != "text":
+            before, after = measure_savings(df, header, rows, self.model_name)
+            audit_results["serialization"].append({
+                "sheet": sheet_name,
+                "format": self.serializer_name,
+                "tokens_before": before,
+                "tokens_after": after
+            })
+            print(f"      - {sheet_name}: 프롬프트 데이터 {before:,} → {after:,} 토큰 "
+                  f"({self.serializer_name})")
+        
+        return header, rows
+    
+    def _split_rows(self, header: List[str], rows: List[str]) -> List[tuple]:
+        """
+        직렬화된 행들을 chunk_tokens 예산에 맞춰 조각으로 나누기
+        
+        Args:
+            header: 조각마다 반복할 헤더 줄 리스트
+            rows: 행별 줄 리스트 (한 행이 한 줄)
+            
+        Returns:
+            (첫 행 번호, 마지막 행 번호, 헤더를 포함한 조각 텍스트) 튜플 리스트
+        """
+        if not rows:
+            return [(0, 0, "\n".join(header))]
+        
+        header_tokens = count_tokens("\n".join(header), self.model_name)
+        budget = max(self.chunk_tokens - header_tokens, 1)
+        
+        chunks = []
+        start = 0
+        used = 0
+        for i, line in enumerate(rows):
+            tokens = count_tokens(line, self.model_name) + 1
+            # 한 행이 예산보다 커도 조각에는 최소 1행을 담음
+            if i > start and used + tokens > budget:
+                chunks.append((start, i - 1, "\n".join(header + rows[start:i])))
+                start = i
+                used = 0
+            used += tokens
+        chunks.append((start, len(rows) - 1, "\n".join(header + rows[start:])))
+        
+        return chunks
+    
+    def _plan_reduce(self, sheet_name: str, partials: List[str], audit_results: Dict[str, Any]):
+        """
+        조각별 검증 의견을 합치는 reduce 단계 준비
+        
+        같은 의견과 "문제 없음" 의견은 LLM 호출 없이 정리하고, 남은 의견이 여러 개면
+        chunk_tokens 예산에 맞춘 묶음별로 합치는 프롬프트를 만듭니다.
+        (묶음이 여러 개면 결과를 다시 합치는 단계를 반복)
+        
+        structured=True면 조각별 JSON 응답을 읽어 중복을 제거한 뒤 발견 사항에 더하고
+        LLM 호출 없이 바로 설명을 작성합니다.
+        
+        Args:
+            sheet_name: 시트명
+            partials: 조각별 의견(또는 JSON 응답) 리스트
+            audit_results: 구조화된 발견 사항을 모을 검증 결과 딕셔너리
+            
+        Returns:
+            (최종 의견, None) 또는 (None, reduce 프롬프트 리스트) 튜플
+        """
+        if self.structured:
+            parsed = [parse_findings(text, sheet_name) for text in partials]
+            audit_results["structured_findings"] = merge_findings(audit_results["structured_findings"], *parsed)
+            return self._narrate(sheet_name, audit_results), None
+        
+        opinions = []
+        for text in partials:
+            text = (text or "").strip()
+            if text and text not in opinions and "특별한 문제가 발견되지 않았습니다" not in text:
+                opinions.append(text)
+        
+        if not opinions:
+            return NO_ISSUE_MESSAGE, None
+        if len(opinions) == 1:
+            return opinions[0], None
+        
+        groups = [[]]
+        used = 0
+        for text in opinions:
+            tokens = count_tokens(text, self.model_name)
+            if groups[-1] and used + tokens > self.chunk_tokens:
+                groups.append([])
+                used = 0
+            groups[-1].append(text)
+            used += tokens
+        
+        # 더 이상 묶을 수 없으면 (의견 하나하나가 예산보다 큼) 두 개씩 합침
+        if len(groups) == len(opinions):
+            groups = [opinions[i:i + 2] for i in range(0, len(opinions), 2)]
+        
+        return None, [self._build_reduce_prompt(sheet_name, group) for group in groups]
+    
+    def _build_reduce_prompt(self, sheet_name: str, opinions: List[str]) -> str:
+        """
+        같은 시트를 나눠 검토한 의견들을 하나로 합치는 프롬프트 생성
+        
+        Args:
+            sheet_name: 시트명
+            opinions: 조각별 의견 리스트
+            
+        Returns:
+            프롬프트 문자열
+        """
+        opinion_text = "\n\n".join(f"[의견 {i}]\n{text}" for i, text in enumerate(opinions, start=1))
+        
+        prompt = "당신은 퇴직연금 계리사입니다.\n\n"
+        prompt += f"시트 '{sheet_name}'을(를) 여러 조각으로 나눠 검토한 의견들입니다:\n\n"
+        prompt += f"{opinion_text}\n\n"
+        prompt += ("위 의견들을 하나의 시트 의견으로 합쳐 담당자님께 드리는 구어체 피드백으로 작성하세요. "
+                   "같은 사원번호나 같은 문제를 지적한 내용은 한 번만 쓰고, "
+                   "사원번호, 날짜 등 구체적인 정보는 빠뜨리지 마세요. 의견에 없는 문제를 새로 만들지 마세요.")
+        
+        return prompt
+    
+    def _chunk_note(self, prompts: List[str]) -> str:
+        """진행 표시에 붙일 조각 수 안내"""
+        return f" ({len(prompts)}개 조각)" if len(prompts) > 1 else ""
+    
+    def _build_profile_prompt(self, sheet_name: str, df: pd.DataFrame,
+                              sheet_findings: List[Dict[str, Any]],
+                              audit_results: Dict[str, Any]) -> str:
+        """
+        시트 통계 프로파일과 예시 행만 담아 검증을 요청하는 프롬프트 생성
+        
+        예시 행은 이상치 행을 먼저, 나머지는 앞쪽 행으로 PROFILE_SAMPLE_ROWS개까지 채웁니다.
+        
+        Args:
+            sheet_name: 시트명
+            df: 시트 DataFrame
+            sheet_findings: 이 시트의 규칙 검증 발견 사항 (없으면 빈 리스트)
+            audit_results: 직렬화 토큰 절감 내역을 기록할 검증 결과 딕셔너리
+            
+        Returns:
+            프롬프트 문자열
+        """
+        profile = profile_sheet(df, self.valuation_date)
+        
+        positions = []
+        for anomaly in profile["anomalies"]:
+            if anomaly["position"] not in positions:
+                positions.append(anomaly["position"])
+        positions = positions[:PROFILE_SAMPLE_ROWS]
+        for position in range(len(df)):
+            if len(positions) >= PROFILE_SAMPLE_ROWS:
+                break
+            if position not in positions:
+                positions.append(position)
+        positions.sort()
+        
+        sample = df.iloc[positions].reset_index(drop=True)
+        sample.insert(0, "엑셀 행", [excel_row(p) for p in positions], allow_duplicates=True)
+        header, lines = self.serializer.serialize_lines(sample)
+        
+        prompt = self._get_audit_prompt()
+        prompt += f"\n\n시트명: '{sheet_name}'\n"
+        prompt += "시트 전체 행 대신 통계 요약을 드립니다.\n\n"
+        prompt += f"{format_profile(profile, self.valuation_date)}\n"
+        if sheet_findings:
+            findings = sheet_findings[:MAX_EXPLAIN_ROWS]
+            prompt += "\n규칙 검증으로 확인된 문제:\n"
+            prompt += "\n".join(f"- [{f['severity']}] {f['row']}행: {f['message']}" for f in findings) + "\n"
+            if len(sheet_findings) > len(findings):
+                prompt += f"- 외 {len(sheet_findings) - len(findings)}건\n"
+        prompt += f"\n예시 행 ({len(positions)}개):\n" + "\n".join(header + lines) + "\n"
+        prompt += ("\n위 통계와 예시 행을 보고 이상한 부분이 있으면 피드백을 작성하세요. "
+                   "통계에 근거가 없는 문제를 만들지 마세요.")
+        if self.structured:
+            prompt += structured_instructions(sheet_name)
+        
+        audit_results["serialization"].append({
+            "sheet": sheet_name,
+            "format": "profile",
+            "tokens_before": estimate_frame_tokens(df, self.model_name),
+            "tokens_after": count_tokens(prompt, self.model_name)
+        })
+        
+        return prompt
+    
+    def _build_explain_prompts(self, sheet_name: str, df: pd.DataFrame,
+                               sheet_findings: List[Dict[str, Any]],
+                               audit_results: Dict[str, Any]) -> List[str]:
+        """
+        규칙 엔진이 찾은 문제와 해당 행만 담아 구어체 설명을 요청하는 프롬프트 생성
+        
+        문제 행이 chunk_tokens 예산보다 많으면 행 단위 조각으로 나누고, 조각마다 그 조각 행의
+        문제만 담습니다 (조각별 설명은 reduce 단계에서 하나로 합침).
+        
+        Args:
+            sheet_name: 시트명
+            df: 시트 DataFrame
+            sheet_findings: 이 시트의 규칙 검증 발견 사항
+            audit_results: 직렬화 토큰 절감 내역을 기록할 검증 결과 딕셔너리
+            
+        Returns:
+            조각별 프롬프트 리스트 (문제 행이 적으면 1개)
+        """
+        findings = sheet_findings[:MAX_EXPLAIN_ROWS]
+        
+        # 문제가 발견된 행만 엑셀 행 번호와 함께 전달
+        rows = sorted({f["row"] for f in findings})
+        flagged = df.iloc[[row - excel_row(0) for row in rows]].reset_index(drop=True)
+        flagged.insert(0, "엑셀 행", rows, allow_duplicates=True)
+        header, lines = self._serialize(sheet_name, flagged, audit_results)
+        chunks = self._split_rows(header, lines)
+        
+        prompts = []
+        for i, (first, last, data_text) in enumerate(chunks, start=1):
+            chunk_rows = set(rows[first:last + 1])
+            finding_lines = "\n".join(
+                f"- [{f['severity']}] {f['row']}행: {f['message']}" for f in findings if f["row"] in chunk_rows
+            )
+            if len(sheet_findings) > len(findings) and i == len(chunks):
+                finding_lines += f"\n- 외 {len(sheet_findings) - len(findings)}건"
+            
+            prompt = self._get_audit_prompt()
+            prompt += f"\n\n시트명: '{sheet_name}'\n"
+            prompt += f"전체 {len(df)}행을 규칙으로 검증한 결과 다음 문제가 확인되었습니다:\n"
+            if len(chunks) > 1:
+                prompt += f"(문제 행 {len(rows)}개 중 {first + 1}~{last + 1}번째, 조각 {i}/{len(chunks)})\n"
+            prompt += f"{finding_lines}\n"
+            prompt += f"\n문제가 발견된 행:\n{data_text}\n"
+            prompt += ("\n위 문제들을 빠짐없이 담당자님께 설명하는 구어체 피드백을 작성하세요. "
+                       "목록에 없는 문제를 새로 만들지 마세요.")
+            prompts.append(prompt)
+        
+        return prompts
+    
+    def _narrate(self, sheet_name: str, audit_results: Dict[str, Any]) -> str:
+        """
+        구조화된 발견 사항으로 시트 설명 작성 (LLM 설명 방식이면 LLM 응답 전까지 쓰는 기본 설명)
+        """
+        findings = [f for f in audit_results["structured_findings"] if f["sheet"] == sheet_name]
+        return narrate_findings(sheet_name, findings, detailed=self.narrative != "none")
+    
+    def _plan_narratives(self, audit_results: Dict[str, Any]) -> List[tuple]:
+        """
+        LLM으로 구어체 설명을 작성할 시트와 프롬프트 준비 (narrative="llm"일 때만)
+        
+        Returns:
+            (audit_results["findings"] 항목, 프롬프트) 튜플 리스트
+        """
+        if not self.structured or self.narrative != "llm":
+            return []
+        
+        by_sheet: Dict[str, List[Dict[str, Any]]] = {}
+        for finding in audit_results["structured_findings"]:
+            by_sheet.setdefault(finding["sheet"], []).append(finding)
+        
+        return [
+            (entry, self._build_narrative_prompt(entry["sheet"], by_sheet[entry["sheet"]]))
+            for entry in audit_results["findings"]
+            if not entry.get("error") and entry["sheet"] in by_sheet
+        ]
+    
+    def _build_narrative_prompt(self, sheet_name: str, findings: List[Dict[str, Any]]) -> str:
+        """
+        구조화된 발견 사항을 구어체 피드백으로 풀어 쓰게 하는 프롬프트 생성
+        
+        Args:
+            sheet_name: 시트명
+            findings: 이 시트의 발견 사항
+            
+        Returns:
+            프롬프트 문자열
+        """
+        listed = findings[:MAX_EXPLAIN_ROWS]
+        lines = "\n".join(
+            f"- [{f['severity']}] {f['rule_id']} "
+            f"{str(f['row']) + '행 ' if f['row'] else ''}"
+            f"{'사원번호 ' + f['employee_id'] + ': ' if f['employee_id'] else ''}{f['message']}"
+            for f in listed
+        )
+        if len(findings) > len(listed):
+            lines += f"\n- 외 {len(findings) - len(listed)}건"
+        
+        prompt = self._get_audit_prompt()
+        prompt += f"\n\n시트명: '{sheet_name}'\n"
+        prompt += f"검증 결과 다음 {len(findings)}건의 문제가 확인되었습니다:\n{lines}\n"
+        prompt += ("\n위 문제들을 빠짐없이 담당자님께 설명하는 구어체 피드백을 작성하세요. "
+                   "목록에 없는 문제를 새로 만들지 마세요.")
+        
+        return prompt
     
     def _generate_summary(self, audit_results: Dict[str, Any]) -> str:
         """
@@ -136,4 +1049,26 @@ class AuditAgent:
         summary = f"총 {total_sheets}개 시트를 검증했습니다. "
         summary += f"{findings_count}개 시트에서 검증 결과를 확인했습니다."
         
+        cache_stats = audit_results.get("llm_cache", {})
+        if cache_stats.get("hits"):
+            summary += f" (AI 응답 {cache_stats['hits']}건은 캐시에서 재사용)"
+        
+        if self.rule_engine is not None:
+            summary += f" 규칙 검증에서 {len(audit_results.get('rule_findings', []))}건의 문제를 발견했습니다."
+        
+        if self.structured:
+            counts = count_by_severity(audit_results["structured_findings"])
+            summary += (f" 구조화된 발견 사항 {len(audit_results['structured_findings'])}건 ("
+                        + ", ".join(f"{severity} {count}건" for severity, count in counts.items()) + ").")
+        
+        if self.incremental:
+            statuses = [f["status"] for f in audit_results["structured_findings"]]
+            summary += (f" 이전 검증 대비 신규 {statuses.count(STATUS_NEW)}건, 유지 {statuses.count(STATUS_UNCHANGED)}건, "
+                        f"해결 {len(audit_results.get('resolved_findings', []))}건.")
+        
+        run = audit_results.get("metrics", {}).get("run")
+        if run and run["calls"]:
+            summary += (f" AI 호출 {run['calls']}건, 토큰 {run['prompt_tokens'] + run['completion_tokens']:,}개, "
+                        f"예상 비용 ${run['cost_usd']:.4f}.")
+        
         return summary
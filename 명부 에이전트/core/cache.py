@@ -0,0 +1,199 @@
+"""
+파싱된 워크북 캐시
+파일 내용 해시와 로더 옵션을 키로 시트별 DataFrame을 컬럼 기반 파일로 저장
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+# Arrow IPC 파일 저장은 pyarrow가 설치된 경우에만 사용 (없으면 pickle로 저장)
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pa_ipc = None
+
+
+# 캐시 파일 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+
+
+class SheetCache:
+    """파싱된 시트를 로컬 디렉토리에 저장하고 다시 읽어오는 캐시 클래스"""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉토리 경로
+            max_bytes: 캐시 디렉토리 최대 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def make_key(self, file_path: Path, options: Dict[str, Any]) -> str:
+        """
+        파일 내용 해시와 로더 옵션으로 캐시 키 생성
+
+        Args:
+            file_path: 엑셀 파일 경로
+            options: 로드 결과에 영향을 주는 로더 옵션
+
+        Returns:
+            캐시 키 (16진수 문자열)
+        """
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+
+        hasher.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+        hasher.update(f"v{CACHE_VERSION}".encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        캐시에서 시트 데이터 읽기
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+
+        Returns:
+            {시트명: DataFrame} 형태의 딕셔너리 (캐시에 없으면 None)
+        """
+        entry_dir = self.cache_dir / key
+        manifest_path = entry_dir / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            dataframes = {}
+            for sheet in manifest["sheets"]:
+                dataframes[sheet["name"]] = self._read_sheet(entry_dir / sheet["file"], sheet["format"])
+        except Exception as e:
+            # 손상된 항목은 삭제하고 캐시 미스로 처리
+            print(f"      ⚠️  캐시 항목 읽기 실패 (삭제 후 다시 로드): {str(e)}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        # LRU 순서 갱신
+        os.utime(manifest_path)
+
+        return dataframes
+
+    def put(self, key: str, dataframes: Dict[str, pd.DataFrame]) -> None:
+        """
+        시트 데이터를 캐시에 저장
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+            dataframes: {시트명: DataFrame} 형태의 딕셔너리
+        """
+        entry_dir = self.cache_dir / key
+        tmp_dir = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        try:
+            sheets = []
+            for i, (sheet_name, df) in enumerate(dataframes.items()):
+                file_name, file_format = self._write_sheet(tmp_dir, i, df)
+                sheets.append({"name": sheet_name, "file": file_name, "format": file_format})
+
+            with open(tmp_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "created": time.time(), "sheets": sheets},
+                          f, ensure_ascii=False)
+
+            # 완성된 항목만 보이도록 마지막에 이름 변경
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except Exception as e:
+            print(f"      ⚠️  캐시 저장 실패 (무시): {str(e)}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def clear(self) -> None:
+        """캐시 디렉토리의 모든 항목 삭제"""
+        for entry_dir in self.cache_dir.iterdir():
+            if entry_dir.is_dir():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _write_sheet(self, entry_dir: Path, index: int, df: pd.DataFrame):
+        """
+        시트 하나를 파일로 저장
+
+        컬럼명이 모두 문자열이고 기본 인덱스인 경우 Arrow IPC 파일로 저장하고,
+        Arrow로 표현할 수 없는 시트(혼합 타입 컬럼 등)는 pickle로 저장합니다.
+
+        Returns:
+            (파일명, 형식) 튜플
+        """
+        if pa is not None and self._arrow_compatible(df):
+            file_name = f"{index}.arrow"
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                with pa.OSFile(str(entry_dir / file_name), "wb") as sink:
+                    with pa_ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                return file_name, "arrow"
+            except (pa.ArrowException, TypeError, ValueError):
+                (entry_dir / file_name).unlink(missing_ok=True)
+
+        file_name = f"{index}.pkl"
+        df.to_pickle(entry_dir / file_name)
+        return file_name, "pickle"
+
+    def _read_sheet(self, path: Path, file_format: str) -> pd.DataFrame:
+        """저장된 시트 파일 하나를 DataFrame으로 읽기"""
+        if file_format == "arrow":
+            if pa is None:
+                raise ImportError("Arrow 캐시 항목을 읽으려면 pyarrow가 필요합니다")
+            # 메모리 매핑으로 읽어 파일 전체를 복사하지 않음
+            with pa.memory_map(str(path), "r") as source:
+                table = pa_ipc.open_file(source).read_all()
+            return table.to_pandas()
+
+        return pd.read_pickle(path)
+
+    def _arrow_compatible(self, df: pd.DataFrame) -> bool:
+        """컬럼명과 인덱스가 Arrow 변환 후에도 그대로 복원되는지 확인"""
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            return False
+        if not df.columns.is_unique:
+            return False
+        return all(isinstance(col, str) for col in df.columns)
+
+    def _evict(self) -> None:
+        """캐시 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        entries = []
+        total = 0
+        for entry_dir in self.cache_dir.iterdir():
+            manifest_path = entry_dir / MANIFEST_NAME
+            if not entry_dir.is_dir() or not manifest_path.exists():
+                continue
+            size = sum(p.stat().st_size for p in entry_dir.iterdir() if p.is_file())
+            entries.append((manifest_path.stat().st_mtime, size, entry_dir))
+            total += size
+
+        entries.sort()
+        for _, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
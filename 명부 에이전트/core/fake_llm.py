@@ -0,0 +1,308 @@
+"""
+로컬 가짜 채팅 모델
+API 키 없이 검증 흐름을 시험하거나 벤치마크하기 위한 ChatOpenAI 대체 모델
+- FakeChatModel: 응답 지연, 속도 제한(429)과 서버 오류를 흉내 내는 합성 모드
+- ReplayChatModel: 기록해 둔 실제 응답을 프롬프트별로 그대로 돌려주는 재생 모드
+- RecordingChatModel: 실제 모델 응답을 재생용 파일(JSONL)에 기록
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from .tokens import count_tokens
+
+
+FAKE_RESPONSE = "담당자님, 이 시트의 데이터를 검토한 결과 특별한 문제가 발견되지 않았습니다."
+
+
+def prompt_key(prompt: str) -> str:
+    """재생 파일에서 응답을 찾을 프롬프트 키 (SHA-256 16진수)"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _message(prompt: str, content: str,
+             input_tokens: Optional[int] = None, output_tokens: Optional[int] = None) -> AIMessage:
+    """토큰 사용량(usage_metadata)을 채운 응답 메시지 생성 (값이 없으면 토큰 수를 셈)"""
+    input_tokens = count_tokens(prompt) if input_tokens is None else int(input_tokens)
+    output_tokens = count_tokens(content) if output_tokens is None else int(output_tokens)
+    return AIMessage(
+        content=content,
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+    )
+
+
+def _chunks(message: AIMessage, size: int = 16):
+    """응답 메시지를 스트리밍 조각으로 나눔 (토큰 사용량은 마지막 조각에)"""
+    content = message.content
+    pieces = [content[i:i + size] for i in range(0, len(content), size)] or [""]
+    for i, piece in enumerate(pieces):
+        last = i == len(pieces) - 1
+        yield AIMessageChunk(content=piece, usage_metadata=message.usage_metadata if last else None)
+
+
+class FakeRateLimitError(Exception):
+    """가짜 모델이 발생시키는 속도 제한 오류 (HTTP 429)"""
+
+    status_code = 429
+
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FakeServerError(Exception):
+    """가짜 모델이 발생시키는 일시적 서버 오류 (HTTP 500)"""
+
+    status_code = 500
+
+
+class ReplayMissError(KeyError):
+    """재생 파일에 기록되지 않은 프롬프트로 호출됨"""
+
+
+class FakeChatModel:
+    """
+    ChatOpenAI 대신 AuditAgent에 넣을 수 있는 가짜 채팅 모델
+
+    invoke()/ainvoke()는 지정한 지연 시간만큼 기다린 뒤 응답하고,
+    rate_limit_every 또는 rate_limit_probability에 따라 FakeRateLimitError를,
+    error_probability에 따라 FakeServerError를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        jitter: float = 0.0,
+        rate_limit_every: Optional[int] = None,
+        rate_limit_probability: float = 0.0,
+        retry_after: Optional[float] = None,
+        responder: Optional[Callable[[str], str]] = None,
+        seed: Optional[int] = None,
+        error_probability: float = 0.0
+    ):
+        """
+        Args:
+            latency: 응답 지연 시간(초)
+            jitter: 지연 시간에 더할 무작위 편차의 최대값(초)
+            rate_limit_every: N번째 호출마다 429 오류 발생 (None이면 사용 안 함)
+            rate_limit_probability: 호출마다 429 오류가 발생할 확률
+            retry_after: 429 오류에 담을 재시도 대기 시간(초)
+            responder: 프롬프트를 받아 응답 텍스트를 만드는 함수 (None이면 고정 문구)
+            seed: 무작위 값 시드
+            error_probability: 호출마다 서버 오류(500)가 발생할 확률
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after = retry_after
+        self.responder = responder
+        self.error_probability = error_probability
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # 호출 기록 (시험에서 확인용)
+        self.calls = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    def _begin(self, prompt: str) -> float:
+        """호출 기록을 남기고 지연 시간 결정 (429/500을 흉내 내야 하면 오류 발생)"""
+        with self._lock:
+            self.calls += 1
+            limited = (
+                (self.rate_limit_every and self.calls % self.rate_limit_every == 0)
+                or self._random.random() < self.rate_limit_probability
+            )
+            if limited:
+                self.rate_limited += 1
+                raise FakeRateLimitError(retry_after=self.retry_after)
+            if self._random.random() < self.error_probability:
+                self.errors += 1
+                raise FakeServerError("Internal server error")
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def _end(self, prompt: str) -> AIMessage:
+        with self._lock:
+            self.active -= 1
+        content = self.responder(prompt) if self.responder is not None else FAKE_RESPONSE
+        return _message(prompt, content)
+
+    def invoke(self, prompt: str) -> AIMessage:
+        """동기 호출"""
+        delay = self._begin(prompt)
+        time.sleep(delay)
+        return self._end(prompt)
+
+    async def ainvoke(self, prompt: str) -> AIMessage:
+        """비동기 호출"""
+        delay = self._begin(prompt)
+        await asyncio.sleep(delay)
+        return self._end(prompt)
+
+    def stream(self, prompt: str):
+        """스트리밍 호출 (지연 시간 뒤 첫 조각, 나머지 조각은 바로 이어서 전달)"""
+        yield from _chunks(self.invoke(prompt))
+
+    async def astream(self, prompt: str):
+        """비동기 스트리밍 호출"""
+        for chunk in _chunks(await self.ainvoke(prompt)):
+            yield chunk
+
+
+def load_recording(recording_path: Path) -> Dict[str, Dict]:
+    """
+    재생 파일(JSONL) 읽기
+
+    Args:
+        recording_path: RecordingChatModel이 기록한 파일 경로
+
+    Returns:
+        {프롬프트 키: {"response", "input_tokens", "output_tokens", "latency"}} 딕셔너리
+        (같은 키가 여러 번 기록되었으면 마지막 응답 사용)
+    """
+    recordings = {}
+    with open(recording_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                recordings[record["key"]] = record
+            except (ValueError, KeyError) as e:
+                print(f"      ⚠️  재생 파일 {line_number}행을 건너뜁니다: {str(e)}")
+    return recordings
+
+
+class ReplayChatModel:
+    """
+    기록해 둔 응답을 재생하는 가짜 채팅 모델
+
+    같은 프롬프트에는 항상 같은 응답을 돌려주므로, 실제 API 없이 결과가 재현되는 벤치마크에 사용합니다.
+    기록에 없는 프롬프트는 strict=True면 ReplayMissError, 아니면 fallback 응답을 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        recording_path: Path,
+        strict: bool = True,
+        fallback: str = FAKE_RESPONSE,
+        replay_latency: bool = False
+    ):
+        """
+        Args:
+            recording_path: 재생 파일(JSONL) 경로
+            strict: True면 기록에 없는 프롬프트에서 오류 발생
+            fallback: strict=False일 때 기록에 없는 프롬프트에 돌려줄 응답
+            replay_latency: True면 기록된 응답 시간만큼 기다린 뒤 응답
+        """
+        self.recording_path = Path(recording_path)
+        self.recordings = load_recording(self.recording_path)
+        self.strict = strict
+        self.fallback = fallback
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.misses = 0
+        self.prompts = []
+
+    def _lookup(self, prompt: str):
+        """(응답 메시지, 지연 시간) 찾기"""
+        with self._lock:
+            self.calls += 1
+            self.prompts.append(prompt)
+            record = self.recordings.get(prompt_key(prompt))
+            if record is None:
+                self.misses += 1
+
+        if record is None:
+            if self.strict:
+                raise ReplayMissError(f"재생 파일에 없는 프롬프트입니다: {prompt_key(prompt)[:12]}")
+            return _message(prompt, self.fallback), 0.0
+
+        delay = float(record.get("latency", 0.0)) if self.replay_latency else 0.0
+        message = _message(prompt, record["response"],
+                           record.get("input_tokens"), record.get("output_tokens"))
+        return message, delay
+
+    def invoke(self, prompt: str) -> AIMessage:
+        """동기 호출"""
+        message, delay = self._lookup(prompt)
+        if delay:
+            time.sleep(delay)
+        return message
+
+    async def ainvoke(self, prompt: str) -> AIMessage:
+        """비동기 호출"""
+        message, delay = self._lookup(prompt)
+        if delay:
+            await asyncio.sleep(delay)
+        return message
+
+
+class RecordingChatModel:
+    """실제 채팅 모델을 감싸 응답을 재생 파일(JSONL)에 덧붙여 기록하는 모델"""
+
+    def __init__(self, llm, recording_path: Path):
+        """
+        Args:
+            llm: 실제로 호출할 채팅 모델 (ChatOpenAI 등)
+            recording_path: 기록할 재생 파일 경로 (없으면 생성, 있으면 이어서 기록)
+        """
+        self.llm = llm
+        self.temperature = getattr(llm, "temperature", 0)
+        self.recording_path = Path(recording_path)
+        self.recording_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.prompts = []
+
+    def _record(self, prompt: str, response, latency: float) -> None:
+        usage = getattr(response, "usage_metadata", None) or {}
+        record = {
+            "key": prompt_key(prompt),
+            "response": response.content,
+            "input_tokens": usage.get("input_tokens", count_tokens(prompt)),
+            "output_tokens": usage.get("output_tokens", count_tokens(response.content)),
+            "latency": round(latency, 3),
+        }
+        with self._lock:
+            self.calls += 1
+            self.prompts.append(prompt)
+            with open(self.recording_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def invoke(self, prompt: str):
+        """동기 호출"""
+        start = time.perf_counter()
+        response = self.llm.invoke(prompt)
+        self._record(prompt, response, time.perf_counter() - start)
+        return response
+
+    async def ainvoke(self, prompt: str):
+        """비동기 호출"""
+        start = time.perf_counter()
+        response = await self.llm.ainvoke(prompt)
+        self._record(prompt, response, time.perf_counter() - start)
+        return response
@@ -0,0 +1,249 @@
+"""
+구조화된 발견 사항
+LLM에 JSON 스키마로 발견 사항을 요청하고, 응답을 검증하여 규칙 검증 결과와 같은 형태로 변환
+(구어체 설명은 구조화된 발견 사항에서 템플릿 또는 LLM으로 생성)
+"""
+
+import json
+import re
+from typing import Dict, List, Any, Optional
+
+from .rules import RULES, SEVERITY_CRITICAL, SEVERITY_IMPORTANT, SEVERITY_MINOR
+
+
+# LLM이 쓸 수 있는 규칙 ID와 기본 심각도 (규칙 엔진 규칙 + knowledge.md의 나머지 항목)
+FINDING_RULES = {
+    **RULES,
+    "STAT_OUTLIER": SEVERITY_MINOR,       # 3.1 통계적 이상치
+    "MISSING_COLUMN": SEVERITY_IMPORTANT,  # 2.4.2 필수 컬럼 누락
+    "NUMBER_FORMAT": SEVERITY_MINOR,      # 2.4.3 숫자 형식 오류
+    "OTHER": SEVERITY_MINOR,              # 그 밖의 문제
+}
+
+SEVERITIES = (SEVERITY_CRITICAL, SEVERITY_IMPORTANT, SEVERITY_MINOR)
+
+# 발견 사항 필드 (규칙 엔진 발견 사항과 같은 키)
+FINDING_FIELDS = ("rule_id", "severity", "employee_id", "sheet", "row", "message")
+
+# 메시지 최대 길이 (긴 설명은 구어체 설명 단계에서 만듦)
+MAX_MESSAGE_CHARS = 300
+
+# 템플릿 설명에 나열할 최대 발견 사항 수
+MAX_NARRATIVE_ITEMS = 200
+
+FINDINGS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "findings": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "rule_id": {"type": "string", "enum": list(FINDING_RULES)},
+                    "severity": {"type": "string", "enum": list(SEVERITIES)},
+                    "employee_id": {"type": ["string", "null"]},
+                    "sheet": {"type": "string"},
+                    "row": {"type": ["integer", "null"]},
+                    "message": {"type": "string"},
+                },
+                "required": list(FINDING_FIELDS),
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["findings"],
+    "additionalProperties": False,
+}
+
+# ChatOpenAI.bind(response_format=...)에 넘길 구조화 출력 설정
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "audit_findings", "strict": True, "schema": FINDINGS_SCHEMA},
+}
+
+_CODE_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+
+class FindingsParseError(ValueError):
+    """LLM 응답을 발견 사항 JSON으로 읽을 수 없음"""
+
+
+def structured_instructions(sheet_name: str) -> str:
+    """
+    프롬프트 끝에 붙일 JSON 응답 형식 지침
+
+    Args:
+        sheet_name: 검증 중인 시트명
+
+    Returns:
+        지침 문자열
+    """
+    rules = ", ".join(f"{rule_id}({severity})" for rule_id, severity in FINDING_RULES.items())
+    return (
+        "\n\n응답 형식: 구어체 피드백 대신 아래 JSON 객체 하나만 출력하세요 (설명 문장, 코드 블록 없이).\n"
+        '{"findings": [{"rule_id": "...", "severity": "...", "employee_id": "사원번호 또는 null", '
+        f'"sheet": "{sheet_name}", "row": 엑셀 행 번호 또는 null, "message": "한 문장 설명"}}]}}\n'
+        f"- rule_id(기본 심각도): {rules}\n"
+        f"- severity: {', '.join(SEVERITIES)} 중 하나\n"
+        "- row는 데이터의 '엑셀 행' 값 또는 헤더를 1행으로 센 행 번호\n"
+        '- 문제가 없으면 {"findings": []}'
+    )
+
+
+def _clean_employee_id(value) -> Optional[str]:
+    """사원번호를 문자열로 정리 (100001.0 → 100001, 빈 값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    if re.fullmatch(r"\d+\.0+", text):
+        text = text.split(".")[0]
+    return text or None
+
+
+def _clean_row(value) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value == int(value) and value >= 1 else None
+    match = re.fullmatch(r"\s*(\d+)\s*(?:행)?\s*", str(value))
+    return int(match.group(1)) if match else None
+
+
+def validate_finding(item: Any, sheet_name: str) -> Optional[Dict[str, Any]]:
+    """
+    LLM이 돌려준 발견 사항 하나를 검증하고 정리
+
+    모르는 rule_id는 OTHER로, 잘못된 심각도는 규칙의 기본 심각도로 바꾸고,
+    시트명은 검증 중인 시트로 고정합니다.
+
+    Args:
+        item: JSON에서 읽은 항목
+        sheet_name: 검증 중인 시트명
+
+    Returns:
+        {"rule_id", "severity", "sheet", "row", "employee_id", "message", "source"} 딕셔너리
+        (메시지가 없는 등 쓸 수 없는 항목이면 None)
+    """
+    if not isinstance(item, dict):
+        return None
+    message = str(item.get("message") or "").strip()
+    if not message:
+        return None
+
+    rule_id = str(item.get("rule_id") or "").strip().upper()
+    if rule_id not in FINDING_RULES:
+        rule_id = "OTHER"
+    severity = str(item.get("severity") or "").strip()
+    if severity not in SEVERITIES:
+        severity = FINDING_RULES[rule_id]
+
+    return {
+        "rule_id": rule_id,
+        "severity": severity,
+        "sheet": sheet_name,
+        "row": _clean_row(item.get("row")),
+        "employee_id": _clean_employee_id(item.get("employee_id")),
+        "message": message[:MAX_MESSAGE_CHARS],
+        "source": "llm",
+    }
+
+
+def parse_findings(text: str, sheet_name: str) -> List[Dict[str, Any]]:
+    """
+    LLM 응답 JSON을 발견 사항 리스트로 변환
+
+    {"findings": [...]} 객체와 발견 사항 배열을 모두 받으며, 코드 블록 표시(```json)는 무시합니다.
+    형식에 맞지 않는 항목은 건너뜁니다.
+
+    Args:
+        text: LLM 응답 텍스트
+        sheet_name: 검증 중인 시트명
+
+    Returns:
+        validate_finding()으로 정리한 발견 사항 리스트
+
+    Raises:
+        FindingsParseError: JSON이 아니거나 발견 사항 목록이 없을 때
+    """
+    text = _CODE_FENCE.sub("", text or "")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        # 앞뒤에 설명 문장이 붙은 경우 가장 바깥 JSON 객체만 읽음
+        start, end = text.find("{"), text.rfind("}")
+        if start < 0 or end <= start:
+            raise FindingsParseError(f"시트 '{sheet_name}' 응답이 JSON 형식이 아닙니다: {text[:80]}")
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError as e:
+            raise FindingsParseError(f"시트 '{sheet_name}' 응답 JSON을 읽을 수 없습니다: {str(e)}")
+
+    items = data.get("findings") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise FindingsParseError(f"시트 '{sheet_name}' 응답에 findings 목록이 없습니다.")
+
+    findings = []
+    for item in items:
+        finding = validate_finding(item, sheet_name)
+        if finding is not None:
+            findings.append(finding)
+    return findings
+
+
+def finding_key(finding: Dict[str, Any]) -> tuple:
+    """중복 판단 키 (같은 시트, 같은 행, 같은 규칙이면 같은 발견 사항)"""
+    return finding["rule_id"], finding["sheet"], finding["row"], finding["employee_id"]
+
+
+def merge_findings(*finding_lists: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 발견 사항 리스트를 합치고 중복 제거 (먼저 나온 항목 유지)"""
+    merged = {}
+    for findings in finding_lists:
+        for finding in findings:
+            merged.setdefault(finding_key(finding), finding)
+    return list(merged.values())
+
+
+def count_by_severity(findings: List[Dict[str, Any]]) -> Dict[str, int]:
+    """심각도별 발견 사항 수 ({"심각": n, "중요": n, "경미": n})"""
+    counts = dict.fromkeys(SEVERITIES, 0)
+    for finding in findings:
+        counts[finding["severity"]] = counts.get(finding["severity"], 0) + 1
+    return counts
+
+
+def _count_text(counts: Dict[str, int]) -> str:
+    return ", ".join(f"{severity} {count}건" for severity, count in counts.items() if count)
+
+
+def narrate_findings(sheet_name: str, findings: List[Dict[str, Any]], detailed: bool = True) -> str:
+    """
+    구조화된 발견 사항으로 구어체 피드백 작성 (LLM 호출 없음)
+
+    Args:
+        sheet_name: 시트명
+        findings: 이 시트의 발견 사항
+        detailed: False면 건수만 안내
+
+    Returns:
+        피드백 텍스트
+    """
+    if not findings:
+        return "담당자님, 이 시트의 데이터를 검토한 결과 특별한 문제가 발견되지 않았습니다."
+
+    text = (f"담당자님, '{sheet_name}' 시트를 검토한 결과 {len(findings)}건의 문제가 확인되었습니다 "
+            f"({_count_text(count_by_severity(findings))}).")
+    if not detailed:
+        return text + " 상세 내용은 발견 사항 표를 확인 부탁드립니다."
+
+    order = {severity: i for i, severity in enumerate(SEVERITIES)}
+    ordered = sorted(findings, key=lambda f: (order.get(f["severity"], len(order)), f["row"] or 0))
+    lines = []
+    for finding in ordered[:MAX_NARRATIVE_ITEMS]:
+        where = f"{finding['row']}행 " if finding["row"] else ""
+        lines.append(f"- [{finding['severity']}] {where}{finding['message']}")
+    if len(ordered) > MAX_NARRATIVE_ITEMS:
+        lines.append(f"- 외 {len(ordered) - MAX_NARRATIVE_ITEMS}건")
+    return text + "\n" + "\n".join(lines) + "\n확인 부탁드립니다."
@@ -0,0 +1,249 @@
+"""
+증분 재검증
+시트별 행 내용 해시를 사원번호 기준으로 저장해 두고, 수정본 워크북에서 추가/삭제/수정된 행만 다시 검증
+(변경되지 않은 행의 AI 발견 사항은 이전 검증 결과를 이어 쓰고, 발견 사항마다 신규/해결/유지 상태 표시)
+"""
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import pandas as pd
+
+from .normalize import find_column, normalize_employee_id
+from .rules import excel_row
+
+
+# 상태 파일 형식이나 해시 방식이 바뀌면 올려서 기존 상태를 무효화 (전체 재검증)
+STATE_VERSION = 1
+
+STATUS_NEW = "신규"
+STATUS_RESOLVED = "해결"
+STATUS_UNCHANGED = "유지"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def column_signature(df: pd.DataFrame) -> str:
+    """컬럼 구성 해시 (컬럼이 바뀌면 행 해시를 비교할 수 없으므로 시트 전체를 다시 검증)"""
+    return _digest("\x1f".join(str(column) for column in df.columns))
+
+
+def row_hashes(df: pd.DataFrame) -> List[str]:
+    """
+    행별 내용 해시 (값을 문자열로 바꾼 뒤 행 단위로 한 번에 계산)
+
+    Returns:
+        DataFrame 행 순서대로 16진수 해시 문자열 리스트
+    """
+    if len(df) == 0:
+        return []
+    text = df.astype(str)
+    text.columns = range(text.shape[1])
+    return [f"{value:016x}" for value in pd.util.hash_pandas_object(text, index=False)]
+
+
+def row_keys(df: pd.DataFrame, hashes: List[str]) -> List[str]:
+    """
+    행을 수정본과 맞춰 볼 키
+
+    사원번호가 있는 행은 "사원번호", 같은 사원번호가 여러 번 나오면 "사원번호#2"처럼 순번을 붙이고,
+    사원번호가 없는 행은 내용 해시로 맞춥니다 (이런 행은 수정되면 삭제 + 추가로 보임).
+
+    Args:
+        df: 시트 DataFrame
+        hashes: row_hashes(df) 결과
+
+    Returns:
+        행 순서대로 키 리스트
+    """
+    column = find_column(df.columns, "employee_id")
+    if column is not None:
+        ids = df[column]
+        if isinstance(ids, pd.DataFrame):
+            ids = ids.iloc[:, 0]
+        ids = normalize_employee_id(ids).astype("string")
+    else:
+        ids = pd.Series(pd.NA, index=df.index, dtype="string")
+
+    keys = []
+    seen: Dict[str, int] = {}
+    for employee_id, row_hash in zip(ids, hashes):
+        base = f"행:{row_hash}" if pd.isna(employee_id) else str(employee_id)
+        seen[base] = seen.get(base, 0) + 1
+        keys.append(base if seen[base] == 1 else f"{base}#{seen[base]}")
+    return keys
+
+
+def sheet_state(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    시트 하나의 증분 검증 상태
+
+    Returns:
+        {"columns": 컬럼 구성 해시, "keys": 행 순서대로 키 리스트, "hashes": 행 순서대로 해시 리스트}
+    """
+    hashes = row_hashes(df)
+    return {"columns": column_signature(df), "keys": row_keys(df, hashes), "hashes": hashes}
+
+
+class SheetDelta:
+    """이전 검증 이후 시트 하나의 행 변경 내역"""
+
+    def __init__(self, previous: Optional[Dict[str, Any]], current: Dict[str, Any]):
+        """
+        Args:
+            previous: 이전 검증의 sheet_state() (없으면 시트 전체가 새 행)
+            current: 이번 검증의 sheet_state()
+        """
+        self.full = previous is None or previous["columns"] != current["columns"]
+        old = {} if self.full else dict(zip(previous["keys"], previous["hashes"]))
+        new_positions = {key: position for position, key in enumerate(current["keys"])}
+
+        self.inserted = [key for key in current["keys"] if key not in old]
+        self.modified = [key for key, row_hash in zip(current["keys"], current["hashes"])
+                         if key in old and old[key] != row_hash]
+        self.deleted = [key for key in old if key not in new_positions]
+
+        # 이전 엑셀 행 번호 → 이번 엑셀 행 번호 (변경되지 않은 행만)
+        changed = set(self.inserted) | set(self.modified)
+        self.row_map: Dict[int, int] = {}
+        if not self.full:
+            for position, key in enumerate(previous["keys"]):
+                if key in new_positions and key not in changed:
+                    self.row_map[excel_row(position)] = excel_row(new_positions[key])
+
+        self.changed_positions = sorted(new_positions[key] for key in changed)
+
+    @property
+    def changed(self) -> bool:
+        """다시 검증할 행이 있거나 삭제된 행이 있으면 True"""
+        return self.full or bool(self.changed_positions or self.deleted)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "full": self.full,
+            "inserted": len(self.inserted),
+            "deleted": len(self.deleted),
+            "modified": len(self.modified),
+        }
+
+    def carry_forward(self, finding: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        이전 AI 발견 사항을 이번 워크북 기준으로 옮김
+
+        변경되지 않은 행의 발견 사항은 새 행 번호로 옮기고, 행이 없는 시트 단위 발견 사항은
+        시트 전체를 다시 검증하지 않을 때만 유지합니다.
+
+        Returns:
+            옮긴 발견 사항 (다시 검증할 행이거나 삭제된 행이면 None)
+        """
+        if self.full:
+            return None
+        if finding["row"] is None:
+            return dict(finding)
+        row = self.row_map.get(finding["row"])
+        return None if row is None else {**finding, "row": row}
+
+
+def delta_frame(df: pd.DataFrame, delta: SheetDelta) -> pd.DataFrame:
+    """다시 검증할 행만 엑셀 행 번호와 함께 추림"""
+    changed = df.iloc[delta.changed_positions].copy()
+    changed.insert(0, "엑셀 행", [excel_row(p) for p in delta.changed_positions], allow_duplicates=True)
+    return changed
+
+
+def status_key(finding: Dict[str, Any], row_map: Optional[Dict[int, int]] = None) -> tuple:
+    """
+    실행 간 같은 발견 사항인지 판단하는 키
+
+    행 번호는 앞쪽 행이 추가/삭제되면 바뀌므로, 사원번호가 있으면 사원번호로 비교하고
+    없으면 row_map(이전 행 번호 → 이번 행 번호)으로 옮긴 행 번호로 비교합니다.
+    """
+    if finding.get("employee_id"):
+        return finding["rule_id"], finding["sheet"], finding["employee_id"]
+    row = finding["row"]
+    if row_map is not None and row is not None:
+        row = row_map.get(row, -row)  # 사라진 행은 이번 행 번호와 겹치지 않게 음수로
+    return finding["rule_id"], finding["sheet"], row, finding["message"]
+
+
+def mark_statuses(current: List[Dict[str, Any]], previous: List[Dict[str, Any]],
+                  row_maps: Optional[Dict[str, Dict[int, int]]] = None) -> List[Dict[str, Any]]:
+    """
+    이번 발견 사항에 신규/유지 상태를 표시하고 해결된(이전에만 있던) 발견 사항 반환
+
+    Args:
+        current: 이번 검증의 발견 사항 (status 키가 추가됨)
+        previous: 이전 검증의 발견 사항
+        row_maps: {시트명: SheetDelta.row_map} (없는 시트는 행 번호를 그대로 비교)
+
+    Returns:
+        해결된 발견 사항 리스트 (status="해결", 행 번호는 이전 워크북 기준)
+    """
+    row_maps = row_maps or {}
+    previous_keys = {status_key(finding, row_maps.get(finding["sheet"])) for finding in previous}
+    current_keys = set()
+    for finding in current:
+        key = status_key(finding)
+        finding["status"] = STATUS_UNCHANGED if key in previous_keys else STATUS_NEW
+        current_keys.add(key)
+
+    resolved = []
+    for finding in previous:
+        key = status_key(finding, row_maps.get(finding["sheet"]))
+        if key not in current_keys:
+            resolved.append({**finding, "status": STATUS_RESOLVED})
+            current_keys.add(key)
+    return resolved
+
+
+class AuditStateStore:
+    """워크북별 증분 검증 상태(행 해시와 발견 사항)를 JSON 파일로 저장하고 읽어오는 클래스"""
+
+    _lock = threading.Lock()
+
+    def __init__(self, state_dir: Path):
+        """
+        Args:
+            state_dir: 상태 파일을 저장할 디렉토리 경로
+        """
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, name: str) -> Path:
+        """상태 이름(보통 엑셀 파일 이름)의 상태 파일 경로"""
+        safe = re.sub(r'[\\/:*?"<>|\s]+', "_", Path(name).stem)
+        return self.state_dir / f"{safe}.json"
+
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        이전 검증 상태 읽기
+
+        Returns:
+            상태 딕셔너리 (없거나 형식 버전이 다르거나 읽을 수 없으면 None)
+        """
+        path = self.path_for(name)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"      ⚠️  이전 검증 상태를 읽을 수 없어 전체를 다시 검증합니다: {str(e)}")
+            return None
+        return state if state.get("version") == STATE_VERSION else None
+
+    def save(self, name: str, state: Dict[str, Any]) -> Path:
+        """검증 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = self.path_for(name)
+        temp_path = path.with_suffix(".tmp")
+        with self._lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            temp_path.replace(path)
+        return path
@@ -0,0 +1,110 @@
+"""
+필요할 때 시트를 읽는 지연 로드 시트 매핑
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+
+class LazySheets(Mapping):
+    """
+    {시트명: DataFrame} 딕셔너리처럼 동작하지만 시트를 처음 접근할 때 읽는 매핑
+
+    읽은 시트는 메모해 두었다가 다시 접근하면 그대로 반환하고,
+    max_resident를 지정하면 가장 오래 사용하지 않은 시트부터 메모리에서 내립니다.
+    내린 시트를 다시 접근하면 파일에서 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        sheet_names: List[str],
+        read_sheet: Callable[[str], pd.DataFrame],
+        max_resident: Optional[int] = None
+    ):
+        """
+        Args:
+            sheet_names: 매핑에 포함할 시트명 리스트 (워크북 순서)
+            read_sheet: 시트명을 받아 DataFrame을 반환하는 함수
+            max_resident: 메모리에 유지할 최대 시트 수 (None이면 제한 없음)
+        """
+        self._sheet_names = list(sheet_names)
+        self._read_sheet = read_sheet
+        self._max_resident = max_resident
+        self._resident: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._failed = set()
+
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        if sheet_name in self._resident:
+            self._resident.move_to_end(sheet_name)
+            return self._resident[sheet_name]
+
+        if sheet_name not in self._sheet_names or sheet_name in self._failed:
+            raise KeyError(sheet_name)
+
+        try:
+            df = self._read_sheet(sheet_name)
+        except Exception as e:
+            print(f"      ⚠️  시트 '{sheet_name}' 로드 실패: {str(e)}")
+            self._failed.add(sheet_name)
+            raise KeyError(sheet_name) from e
+
+        # 빈 시트는 즉시 로드 때와 같이 매핑에서 제외
+        if df.empty:
+            self._failed.add(sheet_name)
+            raise KeyError(sheet_name)
+
+        print(f"      - {sheet_name}: {len(df)}행 로드 완료")
+        self._resident[sheet_name] = df
+
+        if self._max_resident is not None:
+            while len(self._resident) > max(self._max_resident, 1):
+                self._resident.popitem(last=False)
+
+        return df
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self._sheet_names if name not in self._failed)
+
+    def __len__(self) -> int:
+        return len([name for name in self._sheet_names if name not in self._failed])
+
+    def __contains__(self, sheet_name) -> bool:
+        return sheet_name in self._sheet_names and sheet_name not in self._failed
+
+    def items(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        (시트명, DataFrame)을 순서대로 반환 (읽기에 실패한 시트는 건너뜀)
+        """
+        for sheet_name in list(self):
+            try:
+                yield sheet_name, self[sheet_name]
+            except KeyError:
+                continue
+
+    def values(self) -> Iterator[pd.DataFrame]:
+        """DataFrame을 순서대로 반환 (읽기에 실패한 시트는 건너뜀)"""
+        for _, df in self.items():
+            yield df
+
+    @property
+    def resident(self) -> List[str]:
+        """현재 메모리에 올라와 있는 시트명 리스트"""
+        return list(self._resident)
+
+    def evict(self, sheet_name: Optional[str] = None) -> None:
+        """
+        읽어 둔 시트를 메모리에서 내리기
+
+        Args:
+            sheet_name: 내릴 시트명 (None이면 모든 시트)
+        """
+        if sheet_name is None:
+            self._resident.clear()
+        else:
+            self._resident.pop(sheet_name, None)
+
+    def __repr__(self) -> str:
+        return f"LazySheets(sheets={list(self)}, resident={self.resident})"
@@ -0,0 +1,168 @@
+"""
+LLM 응답 캐시
+모델, temperature, 검증 지침, 시트 데이터가 같은 요청의 응답을 로컬 파일(SQLite)에 저장하여 재사용
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+# 캐시 키 구성이 바뀌면 올려서 기존 항목을 무효화
+LLM_CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class LLMCache:
+    """LLM 응답을 SQLite 파일에 저장하고 다시 읽어오는 캐시 클래스"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age_days: Optional[float] = 30
+    ):
+        """
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+            max_bytes: 저장된 응답의 최대 총 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+            max_age_days: 항목 유효 기간(일) (None이면 기간 제한 없음)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """작업마다 연결을 새로 열고 커밋 후 닫음 (여러 스레드에서 호출될 수 있음)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def make_key(self, model_name: str, temperature: float, instructions: str, payload: str) -> str:
+        """
+        요청 내용으로 캐시 키 생성
+
+        Args:
+            model_name: 모델 이름
+            temperature: 샘플링 temperature
+            instructions: 검증 지침 프롬프트 (_get_audit_prompt)
+            payload: 시트 데이터를 담은 요청 프롬프트
+
+        Returns:
+            캐시 키 (16진수 문자열)
+        """
+        hasher = hashlib.sha256()
+        header = json.dumps(
+            {"model": model_name, "temperature": temperature, "version": LLM_CACHE_VERSION},
+            sort_keys=True
+        )
+        for part in (header, instructions, payload):
+            data = part.encode("utf-8")
+            # 구분이 모호해지지 않도록 길이를 함께 기록
+            hasher.update(len(data).to_bytes(8, "big"))
+            hasher.update(data)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 응답 읽기
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+
+        Returns:
+            {"response", "prompt_tokens", "completion_tokens", "created"} 딕셔너리
+            (없거나 유효 기간이 지났으면 None)
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, prompt_tokens, completion_tokens, created FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if self.max_age_days is not None and now - row[3] > self.max_age_days * 86400:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            # LRU 순서 갱신
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+
+        return {
+            "response": row[0],
+            "prompt_tokens": row[1],
+            "completion_tokens": row[2],
+            "created": row[3],
+        }
+
+    def put(self, key: str, model_name: str, response: str,
+            prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        """
+        응답을 캐시에 저장
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+            model_name: 모델 이름
+            response: 응답 텍스트
+            prompt_tokens: 프롬프트 토큰 수
+            completion_tokens: 응답 토큰 수
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, model_name, response, int(prompt_tokens), int(completion_tokens), now, now, size)
+                )
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            print(f"      ⚠️  LLM 응답 캐시 저장 실패 (무시): {str(e)}")
+
+    def clear(self) -> None:
+        """캐시의 모든 항목 삭제"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """유효 기간이 지난 항목과 max_bytes를 넘는 오래 사용하지 않은 항목 삭제"""
+        if self.max_age_days is not None:
+            conn.execute("DELETE FROM responses WHERE created < ?", (now - self.max_age_days * 86400,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
@@ -2,20 +2,288 @@
 엑셀 파일 탐색 및 시트별 데이터 로드
 """
 
+import re
+import zipfile
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Iterable, Tuple, Any, Optional, Mapping
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string
+
+from .cache import SheetCache
+from .lazy_sheets import LazySheets
+from .xlsx_reader import XlsxReader, read_sheet_paths
+from .normalize import normalize_dataframe
+
+
+# 지원하는 로드 엔진
+# - openpyxl: pd.read_excel 기반 (기본값)
+# - streaming: read-only, values-only 행 스트림으로 DataFrame 직접 생성
+# - native: xlsx XML을 직접 읽어 컬럼별 배열로 변환 (openpyxl 셀 객체 미사용)
+LOADER_ENGINES = ("openpyxl", "streaming", "native")
+
+# 구버전 엑셀(.xls) 변환 등으로 dimension이 시트 최대 크기로 기록된 경우
+# 실제 데이터 범위로 볼 수 없으므로 행을 직접 세어서 확인
+SUSPECT_MAX_ROWS = (65536, 1048576)
+
+# 값이 있는 셀 태그 (<c r="B12" ...>로 열리는 태그, 빈 셀은 <c r="B12" ... />로 닫힘)
+_FILLED_CELL_PATTERN = re.compile(rb'<c\b[^>]*?\br="([A-Z]+)([0-9]+)"[^>]*?(?<!/)>')
+
+
+def _scan_sheet_extent(archive, sheet_path: str) -> Tuple[int, int]:
+    """
+    워크시트 XML을 바이트 단위로 훑어서 값이 있는 마지막 행 번호와 열 수 계산
+    
+    XML 파서나 셀 객체를 만들지 않고 셀 태그만 찾으므로,
+    빈 셀이 대량으로 기록된 시트에서도 빠르게 실제 데이터 범위를 확인할 수 있습니다.
+    
+    Args:
+        archive: xlsx 파일의 ZipFile 객체
+        sheet_path: zip 내부 워크시트 경로 (예: xl/worksheets/sheet1.xml)
+        
+    Returns:
+        (마지막 데이터 행 번호, 열 수) 튜플
+    """
+    last_row = 0
+    width = 0
+    tail = b""
+    
+    with archive.open(sheet_path) as src:
+        while True:
+            chunk = src.read(1024 * 1024)
+            buf = tail + chunk
+            if chunk:
+                # 태그가 청크 경계에서 잘리지 않도록 마지막 '<' 이후는 다음 청크로 넘김
+                cut = buf.rfind(b"<")
+                if cut < 0:
+                    cut = len(buf)
+                body, tail = buf[:cut], buf[cut:]
+            else:
+                body, tail = buf, b""
+            
+            for match in _FILLED_CELL_PATTERN.finditer(body):
+                row = int(match.group(2))
+                if row > last_row:
+                    last_row = row
+                column = column_index_from_string(match.group(1).decode("ascii"))
+                if column > width:
+                    width = column
+            
+            if not chunk:
+                break
+    
+    return last_row, width
+
+
+def _count_sheet_extent(file_path: Path, ws) -> Tuple[int, int]:
+    """
+    dimension을 믿을 수 없는 시트의 실제 데이터 범위 계산
+    
+    워크북 관계 파일에서 시트 XML 경로를 찾아 _scan_sheet_extent()로 훑고,
+    경로를 찾을 수 없으면 read-only 워크시트의 행을 끝까지 읽어서 셉니다.
+    
+    Args:
+        file_path: xlsx 파일 경로
+        ws: read_only=True로 연 openpyxl 워크시트
+        
+    Returns:
+        (마지막 데이터 행 번호, 열 수) 튜플
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        sheet_path = read_sheet_paths(archive).get(ws.title)
+        if sheet_path is not None and sheet_path in archive.namelist():
+            return _scan_sheet_extent(archive, sheet_path)
+    
+    last_row = 0
+    width = 0
+    ws.reset_dimensions()
+    for row_number, values in enumerate(ws.iter_rows(values_only=True), start=1):
+        filled = [column for column, value in enumerate(values, start=1) if value is not None]
+        if filled:
+            last_row = row_number
+            width = max(width, filled[-1])
+    
+    return last_row, width
+
+
+def _convert_value(value: Any) -> Any:
+    """
+    pd.read_excel(openpyxl 엔진)과 동일한 규칙으로 셀 값 변환
+    (빈 셀은 "", 정수로 떨어지는 실수는 int)
+    """
+    if value is None:
+        return ""
+    if type(value) is float and value.is_integer():
+        return int(value)
+    return value
+
+
+def rows_to_dataframe(rows: Iterable[Tuple[Any, ...]]) -> pd.DataFrame:
+    """
+    셀 값 행 스트림을 DataFrame으로 변환 (첫 행은 헤더)
+    
+    pd.read_excel과 같이 끝쪽의 빈 행/빈 열은 제거하고,
+    중간의 빈 행은 그대로 유지합니다. 헤더 정리와 타입 추론은
+    pd.read_excel이 내부적으로 사용하는 TextParser에 맡깁니다.
+    
+    Args:
+        rows: 셀 값 튜플의 반복자 (openpyxl iter_rows(values_only=True) 등)
+        
+    Returns:
+        첫 행을 헤더로 사용한 DataFrame
+    """
+    data = []
+    pending_blank = 0
+    width = 0
+    
+    for values in rows:
+        # 행의 마지막 값이 있는 열 위치 찾기
+        last = len(values)
+        while last > 0 and values[last - 1] is None:
+            last -= 1
+        
+        if last == 0:
+            # 빈 행은 뒤에 데이터가 있을 때만 추가 (끝쪽 빈 행 제거)
+            pending_blank += 1
+            continue
+        
+        if pending_blank:
+            data.extend([] for _ in range(pending_blank))
+            pending_blank = 0
+        
+        data.append([_convert_value(v) for v in values[:last]])
+        if last > width:
+            width = last
+    
+    if not data:
+        return pd.DataFrame()
+    
+    # 열 개수를 맞추기 위해 짧은 행은 빈 값으로 채움
+    for row in data:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+    
+    try:
+        parser = TextParser(data, header=0, skip_blank_lines=False)
+        return parser.read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+def _is_legacy_xls(file_path) -> bool:
+    """
+    구버전 엑셀(.xls) 파일 여부
+    
+    .xls는 zip/XML 형식이 아니므로 openpyxl과 XlsxReader로 열 수 없고,
+    엔진과 관계없이 pd.read_excel(엔진 자동 선택, xlrd 필요)로 읽습니다.
+    """
+    return Path(file_path).suffix.lower() == ".xls"
+
+
+def _read_sheet(file_path: str, sheet_name: str, engine: str) -> pd.DataFrame:
+    """
+    지정한 엔진으로 시트 하나만 읽기 (.xls는 엔진과 관계없이 pd.read_excel 사용)
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 읽을 시트명
+        engine: 시트 로드 엔진
+        
+    Returns:
+        시트 데이터 DataFrame
+    """
+    if _is_legacy_xls(file_path):
+        return pd.read_excel(file_path, sheet_name=sheet_name)
+    
+    if engine == "streaming":
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            return rows_to_dataframe(wb[sheet_name].iter_rows(values_only=True))
+        finally:
+            wb.close()
+    
+    if engine == "native":
+        with XlsxReader(file_path) as reader:
+            return reader.read_sheet(sheet_name)
+    
+    return pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
+
+
+def _parse_sheet_task(file_path: str, sheet_name: str, engine: str):
+    """
+    워커 프로세스에서 시트 하나를 읽어 전송하기 쉬운 형태로 반환
+    
+    DataFrame 대신 컬럼명과 컬럼별 배열만 돌려주어 프로세스 간 전송량을 줄이고,
+    시트별 오류는 예외 대신 결과로 돌려주어 다른 시트 로드에 영향을 주지 않습니다.
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 읽을 시트명
+        engine: 시트 로드 엔진
+        
+    Returns:
+        ("ok", (컬럼명 리스트, 컬럼 배열 리스트)) 또는 ("error", 오류 메시지) 튜플
+    """
+    try:
+        df = _read_sheet(file_path, sheet_name, engine)
+        columns = list(df.columns)
+        arrays = [df.iloc[:, i].array for i in range(df.shape[1])]
+        return "ok", (columns, arrays)
+    except Exception as e:
+        return "error", str(e)
+
+
+def _unpack_sheet(payload) -> pd.DataFrame:
+    """_parse_sheet_task()가 반환한 컬럼 배열을 DataFrame으로 재조립"""
+    columns, arrays = payload
+    if not columns:
+        return pd.DataFrame()
+    df = pd.DataFrame(dict(enumerate(arrays)), copy=False)
+    df.columns = columns
+    return df
 
 
 class ExcelLoader:
     """엑셀 파일을 탐색하고 시트별로 데이터를 로드하는 클래스"""
     
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        engine: str = "openpyxl",
+        cache_dir: Optional[Path] = None,
+        cache_max_bytes: int = 512 * 1024 * 1024,
+        sheet_workers: int = 1,
+        normalize: bool = False
+    ):
         """
         Args:
             data_dir: 엑셀 파일이 있는 디렉토리 경로
+            engine: 시트 로드 엔진 (기본값: openpyxl)
+                - "openpyxl": pd.read_excel로 시트별 로드
+                - "streaming": read-only 모드로 워크북을 한 번만 열고
+                  값만 행 단위로 읽어서 DataFrame을 직접 생성 (대용량 파일용)
+                - "native": xlsx 내부 XML을 직접 스트리밍하여 컬럼별 배열로 변환
+                  (openpyxl 셀 객체를 만들지 않음, .xlsx 전용)
+                .xls 파일은 엔진, lazy, sheet_workers 설정과 관계없이 pd.read_excel로 한 번에 로드
+            cache_dir: 파싱 결과 캐시 디렉토리 (None이면 캐시 사용 안 함)
+            cache_max_bytes: 캐시 디렉토리 최대 크기 (기본값: 512MB)
+            sheet_workers: 시트 파싱 워커 프로세스 수 (기본값: 1, 2 이상이면 시트별 병렬 로드)
+            normalize: True면 명부 컬럼(사원번호, 날짜, 코드, 금액)을 압축 타입으로 변환
+                (컬럼별 메모리 변화는 normalize_report에 기록)
         """
+        if engine not in LOADER_ENGINES:
+            raise ValueError(f"지원하지 않는 로드 엔진입니다: {engine} (사용 가능: {LOADER_ENGINES})")
+        
         self.data_dir = Path(data_dir)
+        self.engine = engine
+        self.cache = SheetCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None
+        self.sheet_workers = max(1, sheet_workers)
+        self.normalize = normalize
+        self.normalize_report: List[Dict[str, Any]] = []
     
     def find_excel_files(self) -> List[Path]:
         """
@@ -33,17 +301,140 @@ class ExcelLoader:
         
         return sorted(excel_files)
     
-    def load_excel(self, file_path: Path) -> Dict[str, pd.DataFrame]:
+    def load_excel(
+        self,
+        file_path: Path,
+        lazy: bool = False,
+        max_resident: Optional[int] = None
+    ) -> Mapping[str, pd.DataFrame]:
         """
         엑셀 파일의 모든 시트를 읽어서 딕셔너리로 반환
         
+        Args:
+            file_path: 엑셀 파일 경로
+            lazy: True면 시트를 바로 읽지 않고 처음 접근할 때 읽는 LazySheets 반환
+                (캐시에 있는 파일은 캐시에서 바로 읽은 딕셔너리 반환)
+            max_resident: lazy 모드에서 메모리에 유지할 최대 시트 수
+            
+        Returns:
+            {시트명: DataFrame} 형태의 딕셔너리 (lazy 모드에서는 같은 형태의 LazySheets)
+        """
+        # 파일 내용이 바뀌지 않았으면 캐시에서 바로 읽기
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(file_path, self._cache_options())
+            cached = self.cache.get(cache_key)
+            if cached:
+                for sheet_name, df in cached.items():
+                    print(f"      - {sheet_name}: {len(df)}행 로드 완료 (캐시)")
+                return self._normalize_sheets(cached)
+        
+        if _is_legacy_xls(file_path):
+            # .xls는 시트 목록/범위를 미리 확인할 수 없으므로 lazy/병렬 없이 바로 로드
+            dataframes = self._load_excel_openpyxl(file_path)
+        elif lazy:
+            return self._load_excel_lazy(file_path, max_resident)
+        elif self.sheet_workers > 1:
+            dataframes = self._load_excel_parallel(file_path)
+        elif self.engine == "streaming":
+            dataframes = self._load_excel_streaming(file_path)
+        elif self.engine == "native":
+            dataframes = self._load_excel_native(file_path)
+        else:
+            dataframes = self._load_excel_openpyxl(file_path)
+        
+        if not dataframes:
+            raise ValueError(f"엑셀 파일에서 유효한 데이터를 찾을 수 없습니다: {file_path}")
+        
+        if self.cache:
+            self.cache.put(cache_key, dataframes)
+        
+        return self._normalize_sheets(dataframes)
+    
+    def _normalize_sheets(self, dataframes: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        normalize 옵션이 켜져 있으면 명부 시트의 컬럼 타입을 정규화하고 메모리 변화 출력
+        
+        Args:
+            dataframes: {시트명: DataFrame} 형태의 딕셔너리
+            
+        Returns:
+            정규화된 {시트명: DataFrame} 딕셔너리
+        """
+        if not self.normalize:
+            return dataframes
+        
+        self.normalize_report = []
+        for sheet_name in list(dataframes):
+            dataframes[sheet_name] = self._normalize_sheet(sheet_name, dataframes[sheet_name])
+        
+        return dataframes
+    
+    def _normalize_sheet(self, sheet_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """시트 하나를 정규화하고 보고 내용을 normalize_report에 추가"""
+        normalized, report = normalize_dataframe(df, sheet_name)
+        if report:
+            before = sum(item["bytes_before"] for item in report)
+            after = sum(item["bytes_after"] for item in report)
+            print(f"      - {sheet_name}: 명부 컬럼 {len(report)}개 정규화 "
+                  f"({before / 1024:.1f}KB → {after / 1024:.1f}KB)")
+            self.normalize_report.extend(report)
+        return normalized
+    
+    def _read_sheet_lazy(self, file_path: str, sheet_name: str) -> pd.DataFrame:
+        """lazy 모드에서 시트 하나를 읽고 (옵션에 따라) 정규화"""
+        df = _read_sheet(file_path, sheet_name, self.engine)
+        if self.normalize and not df.empty:
+            df = self._normalize_sheet(sheet_name, df)
+        return df
+    
+    def _cache_options(self) -> Dict[str, Any]:
+        """
+        캐시 키에 포함할 로더 옵션 (로드 결과에 영향을 주는 옵션만)
+        
+        Returns:
+            옵션 딕셔너리
+        """
+        return {"engine": self.engine}
+    
+    def _load_excel_lazy(self, file_path: Path, max_resident: Optional[int]) -> LazySheets:
+        """
+        시트 목록만 확인하고 시트 데이터는 처음 접근할 때 읽는 매핑 생성
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            max_resident: 메모리에 유지할 최대 시트 수
+            
+        Returns:
+            LazySheets 매핑
+        """
+        metadata = self.get_sheet_metadata(file_path)
+        sheet_names = [
+            sheet_name for sheet_name, info in metadata.items()
+            if info["rows"] > 0 and info["columns"] > 0
+        ]
+        
+        if not sheet_names:
+            raise ValueError(f"엑셀 파일에서 유효한 데이터를 찾을 수 없습니다: {file_path}")
+        
+        return LazySheets(
+            sheet_names,
+            partial(self._read_sheet_lazy, str(file_path)),
+            max_resident=max_resident
+        )
+    
+    def _load_excel_openpyxl(self, file_path: Path) -> Dict[str, pd.DataFrame]:
+        """
+        pd.read_excel로 시트별 데이터 로드 (.xls는 pandas가 엔진을 자동 선택)
+        
         Args:
             file_path: 엑셀 파일 경로
             
         Returns:
             {시트명: DataFrame} 형태의 딕셔너리
         """
-        excel_file = pd.ExcelFile(file_path)
+        engine = None if _is_legacy_xls(file_path) else 'openpyxl'
+        excel_file = pd.ExcelFile(file_path, engine=engine)
         dataframes = {}
         
         for sheet_name in excel_file.sheet_names:
@@ -52,7 +443,7 @@ class ExcelLoader:
                 df = pd.read_excel(
                     excel_file,
                     sheet_name=sheet_name,
-                    engine='openpyxl'
+                    engine=engine
                 )
                 
                 # 빈 시트가 아닌 경우만 저장
@@ -63,8 +454,112 @@ class ExcelLoader:
                 print(f"      ⚠️  시트 '{sheet_name}' 로드 실패: {str(e)}")
                 continue
         
-        if not dataframes:
-            raise ValueError(f"엑셀 파일에서 유효한 데이터를 찾을 수 없습니다: {file_path}")
+        return dataframes
+    
+    def _load_excel_streaming(self, file_path: Path) -> Dict[str, pd.DataFrame]:
+        """
+        read-only 모드로 워크북을 한 번 열고 값만 행 단위로 읽어 시트별 DataFrame 생성
+        
+        셀 객체와 스타일 정보를 만들지 않으므로 대용량 명부에서
+        로드 시간과 메모리 사용량이 크게 줄어듭니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            
+        Returns:
+            {시트명: DataFrame} 형태의 딕셔너리
+        """
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        dataframes = {}
+        
+        try:
+            for ws in wb.worksheets:
+                sheet_name = ws.title
+                try:
+                    # 시트 데이터 읽기 (값만 행 단위로)
+                    df = rows_to_dataframe(ws.iter_rows(values_only=True))
+                    
+                    # 빈 시트가 아닌 경우만 저장
+                    if not df.empty:
+                        dataframes[sheet_name] = df
+                        print(f"      - {sheet_name}: {len(df)}행 로드 완료")
+                except Exception as e:
+                    print(f"      ⚠️  시트 '{sheet_name}' 로드 실패: {str(e)}")
+                    continue
+        finally:
+            wb.close()
+        
+        return dataframes
+    
+    def _load_excel_native(self, file_path: Path) -> Dict[str, pd.DataFrame]:
+        """
+        xlsx XML을 직접 읽는 XlsxReader로 시트별 DataFrame 생성
+        
+        공유 문자열과 스타일 정보는 파일당 한 번만 읽고, 시트 XML은
+        셀 값을 컬럼별 float64/날짜 배열에 바로 기록합니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            
+        Returns:
+            {시트명: DataFrame} 형태의 딕셔너리
+        """
+        dataframes = {}
+        
+        with XlsxReader(file_path) as reader:
+            for sheet_name in reader.sheet_names:
+                try:
+                    # 시트 데이터 읽기
+                    df = reader.read_sheet(sheet_name)
+                    
+                    # 빈 시트가 아닌 경우만 저장
+                    if not df.empty:
+                        dataframes[sheet_name] = df
+                        print(f"      - {sheet_name}: {len(df)}행 로드 완료")
+                except Exception as e:
+                    print(f"      ⚠️  시트 '{sheet_name}' 로드 실패: {str(e)}")
+                    continue
+        
+        return dataframes
+    
+    def _load_excel_parallel(self, file_path: Path) -> Dict[str, pd.DataFrame]:
+        """
+        시트별로 워커 프로세스에 나누어 파싱한 뒤 원래 시트 순서대로 재조립
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            
+        Returns:
+            {시트명: DataFrame} 형태의 딕셔너리
+        """
+        wb = load_workbook(file_path, read_only=True)
+        sheet_names = wb.sheetnames
+        wb.close()
+        
+        dataframes = {}
+        workers = min(self.sheet_workers, len(sheet_names)) or 1
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_parse_sheet_task, str(file_path), sheet_name, self.engine)
+                for sheet_name in sheet_names
+            ]
+            
+            for sheet_name, future in zip(sheet_names, futures):
+                try:
+                    status, payload = future.result()
+                    if status != "ok":
+                        raise RuntimeError(payload)
+                    
+                    df = _unpack_sheet(payload)
+                    
+                    # 빈 시트가 아닌 경우만 저장
+                    if not df.empty:
+                        dataframes[sheet_name] = df
+                        print(f"      - {sheet_name}: {len(df)}행 로드 완료")
+                except Exception as e:
+                    print(f"      ⚠️  시트 '{sheet_name}' 로드 실패: {str(e)}")
+                    continue
         
         return dataframes
     
@@ -78,14 +573,141 @@ class ExcelLoader:
         Returns:
             {시트명: 행 수} 형태의 딕셔너리
         """
+        try:
+            metadata = self.get_sheet_metadata(file_path)
+        except Exception as e:
+            print(f"   ⚠️  파일 '{Path(file_path).name}' 정보 확인 실패: {str(e)}")
+            return {}
+        
+        return {sheet_name: info["rows"] for sheet_name, info in metadata.items()}
+    
+    def get_sheet_metadata(self, file_path: Path) -> Dict[str, Dict[str, Any]]:
+        """
+        시트 데이터를 읽지 않고 시트별 행/열 수와 헤더 정보 반환
+        
+        워크시트의 dimension 기록과 첫 행만 읽습니다. dimension이 없거나
+        믿을 수 없는 경우(단일 셀, 구버전 최대 행 수)에만 행을 끝까지 세어서 확인합니다.
+        .xls 파일은 dimension을 따로 읽을 수 없으므로 시트를 pd.read_excel로 모두 읽어서 셉니다.
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            
+        Returns:
+            {시트명: {"rows": 데이터 행 수, "columns": 열 수,
+                     "header": 첫 행 값 리스트, "counted": 행을 직접 셌는지 여부}}
+            행 수는 load_excel()과 같이 헤더 행을 제외한 값입니다.
+        """
+        if _is_legacy_xls(file_path):
+            return self._read_xls_metadata(file_path)
+        
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        metadata = {}
+        
+        try:
+            for ws in wb.worksheets:
+                try:
+                    metadata[ws.title] = self._read_sheet_metadata(ws, file_path)
+                except Exception as e:
+                    print(f"      ⚠️  시트 '{ws.title}' 정보 확인 실패: {str(e)}")
+                    metadata[ws.title] = {"rows": 0, "columns": 0, "header": [], "counted": False}
+        finally:
+            wb.close()
+        
+        return metadata
+    
+    def scan_folder(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        data_dir의 모든 엑셀 파일에 대해 시트 메타데이터 반환 (빠른 사전 점검용)
+        
+        Returns:
+            {파일명: get_sheet_metadata() 결과} 형태의 딕셔너리
+        """
+        folder_info = {}
+        
+        for file_path in self.find_excel_files():
+            try:
+                folder_info[file_path.name] = self.get_sheet_metadata(file_path)
+            except Exception as e:
+                print(f"   ⚠️  파일 '{file_path.name}' 정보 확인 실패: {str(e)}")
+        
+        return folder_info
+    
+    def _read_xls_metadata(self, file_path: Path) -> Dict[str, Dict[str, Any]]:
+        """
+        .xls 파일의 시트별 메타데이터를 pd.read_excel로 시트를 읽어서 계산
+        
+        Args:
+            file_path: .xls 파일 경로
+            
+        Returns:
+            get_sheet_metadata()와 같은 형태의 딕셔너리 (counted는 항상 True)
+        """
         excel_file = pd.ExcelFile(file_path)
-        sheet_info = {}
+        metadata = {}
         
         for sheet_name in excel_file.sheet_names:
             try:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='openpyxl')
-                sheet_info[sheet_name] = len(df)
-            except:
-                sheet_info[sheet_name] = 0
+                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+            except Exception as e:
+                print(f"      ⚠️  시트 '{sheet_name}' 정보 확인 실패: {str(e)}")
+                metadata[sheet_name] = {"rows": 0, "columns": 0, "header": [], "counted": False}
+                continue
+            
+            header = [None if pd.isna(v) else v for v in df.iloc[0]] if len(df) else []
+            while header and header[-1] is None:
+                header.pop()
+            
+            metadata[sheet_name] = {
+                "rows": max(len(df) - 1, 0),
+                "columns": df.shape[1],
+                "header": header,
+                "counted": True
+            }
+        
+        return metadata
+    
+    def _read_sheet_metadata(self, ws, file_path: Path) -> Dict[str, Any]:
+        """
+        read-only 워크시트 하나의 메타데이터 계산
+        
+        Args:
+            ws: read_only=True로 연 openpyxl 워크시트
+            file_path: 워크시트가 있는 xlsx 파일 경로 (dimension을 믿을 수 없을 때 직접 셀 때 사용)
+            
+        Returns:
+            {"rows", "columns", "header", "counted"} 딕셔너리
+        """
+        # 헤더 (첫 행) - 첫 행만 읽고 중단
+        header = []
+        for values in ws.iter_rows(min_row=1, max_row=1, values_only=True):
+            header = list(values)
+        while header and header[-1] is None:
+            header.pop()
+        
+        max_row = ws.max_row
+        max_column = ws.max_column
+        
+        dimension_ok = (
+            max_row is not None
+            and max_column is not None
+            and max_row not in SUSPECT_MAX_ROWS
+            and not (max_row == 1 and max_column == 1 and len(header) <= 1 and ws.min_row == 1)
+        )
+        
+        if dimension_ok:
+            return {
+                "rows": max(max_row - 1, 0),
+                "columns": max(max_column, len(header)),
+                "header": header,
+                "counted": False
+            }
+        
+        # dimension을 믿을 수 없으면 시트 XML에서 값이 있는 셀 범위를 직접 확인
+        last_row, width = _count_sheet_extent(file_path, ws)
         
-        return sheet_info
+        return {
+            "rows": max(last_row - 1, 0),
+            "columns": width,
+            "header": header,
+            "counted": True
+        }
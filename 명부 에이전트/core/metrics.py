@@ -0,0 +1,178 @@
+"""
+LLM 호출 지표
+호출마다 토큰 수, 지연 시간, 첫 토큰까지 시간, 재시도 횟수, 예상 비용을 기록하고 시트별/실행별로 집계
+"""
+
+import json
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+
+# 모델별 100만 토큰당 가격 (USD, (입력, 출력)), 긴 이름부터 접두사로 비교
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+
+def estimate_cost(model_name: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """
+    토큰 수로 호출 비용 추정
+
+    Args:
+        model_name: 모델 이름 ("gpt-4o-mini-2024-07-18"처럼 날짜가 붙어도 됨)
+        prompt_tokens: 프롬프트 토큰 수
+        completion_tokens: 응답 토큰 수
+
+    Returns:
+        예상 비용(USD) (가격을 모르는 모델이면 None)
+    """
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model_name.startswith(name):
+            input_price, output_price = MODEL_PRICES[name]
+            return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return None
+
+
+def call_record(
+    sheet_name: str,
+    model_name: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    latency: float,
+    ttft: Optional[float] = None,
+    retries: int = 0,
+    cached: bool = False,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    LLM 호출 하나의 지표 딕셔너리 생성
+
+    Args:
+        sheet_name: 호출한 시트명
+        model_name: 응답한 모델 이름
+        prompt_tokens: 프롬프트 토큰 수
+        completion_tokens: 응답 토큰 수
+        latency: 재시도 대기를 포함한 호출 시간(초)
+        ttft: 마지막 시도에서 첫 토큰까지 걸린 시간(초) (스트리밍하지 않으면 None)
+        retries: 속도 제한으로 다시 시도한 횟수
+        cached: 응답 캐시에서 가져왔으면 True (비용 0)
+        error: 실패한 호출의 오류 메시지
+
+    Returns:
+        {"sheet", "model", "prompt_tokens", "completion_tokens", "latency", "ttft",
+         "retries", "cached", "cost_usd", "error"} 딕셔너리
+    """
+    cost = 0.0 if cached or error else estimate_cost(model_name, prompt_tokens, completion_tokens)
+    return {
+        "sheet": sheet_name,
+        "model": model_name,
+        "prompt_tokens": int(prompt_tokens),
+        "completion_tokens": int(completion_tokens),
+        "latency": round(latency, 4),
+        "ttft": None if ttft is None else round(ttft, 4),
+        "retries": retries,
+        "cached": cached,
+        "cost_usd": cost,
+        "error": error,
+    }
+
+
+def aggregate_calls(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    호출 지표 합계와 평균
+
+    Returns:
+        {"calls", "cached_calls", "failed_calls", "retries", "prompt_tokens", "completion_tokens",
+         "latency_seconds", "avg_latency", "avg_ttft", "cost_usd"} 딕셔너리
+        (평균 지연은 캐시를 쓰지 않은 성공 호출 기준, 가격을 모르는 모델의 비용은 합계에서 제외)
+    """
+    live = [c for c in calls if not c["cached"] and not c["error"]]
+    ttfts = [c["ttft"] for c in live if c["ttft"] is not None]
+    return {
+        "calls": len(calls),
+        "cached_calls": sum(1 for c in calls if c["cached"]),
+        "failed_calls": sum(1 for c in calls if c["error"]),
+        "retries": sum(c["retries"] for c in calls),
+        "prompt_tokens": sum(c["prompt_tokens"] for c in calls),
+        "completion_tokens": sum(c["completion_tokens"] for c in calls),
+        "latency_seconds": sum(c["latency"] for c in calls),
+        "avg_latency": sum(c["latency"] for c in live) / len(live) if live else None,
+        "avg_ttft": sum(ttfts) / len(ttfts) if ttfts else None,
+        "cost_usd": sum(c["cost_usd"] or 0.0 for c in calls),
+    }
+
+
+def summarize_metrics(calls: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """
+    호출 지표를 시트별/실행 전체로 집계
+
+    Args:
+        calls: call_record() 리스트
+        elapsed: 검증 전체 소요 시간(초)
+
+    Returns:
+        {"run": {...집계, "elapsed_seconds", "tokens_per_second"}, "sheets": {시트명: 집계}} 딕셔너리
+    """
+    by_sheet: Dict[str, List[Dict[str, Any]]] = {}
+    for call in calls:
+        by_sheet.setdefault(call["sheet"], []).append(call)
+
+    run = aggregate_calls(calls)
+    run["elapsed_seconds"] = elapsed
+    tokens = run["prompt_tokens"] + run["completion_tokens"]
+    run["tokens_per_second"] = tokens / elapsed if elapsed > 0 else None
+
+    return {
+        "run": run,
+        "sheets": {sheet_name: aggregate_calls(sheet_calls) for sheet_name, sheet_calls in by_sheet.items()},
+    }
+
+
+class MetricsLog:
+    """실행별 LLM 호출 지표를 로컬 JSONL 파일에 덧붙여 기록하는 클래스"""
+
+    # 일괄 검증에서 여러 파일을 동시에 검증해도 한 실행의 줄이 섞이지 않도록 함
+    _lock = threading.Lock()
+
+    def __init__(self, log_path: Path):
+        """
+        Args:
+            log_path: JSONL 파일 경로 (없으면 생성)
+        """
+        self.log_path = Path(log_path)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def append(self, calls: List[Dict[str, Any]], metrics: Dict[str, Any]) -> str:
+        """
+        실행 하나의 호출 지표와 집계를 기록
+
+        파일에는 호출마다 {"type": "call", ...} 한 줄, 마지막에 {"type": "run", ...} 한 줄을 씁니다.
+
+        Args:
+            calls: call_record() 리스트
+            metrics: summarize_metrics() 결과
+
+        Returns:
+            기록한 실행 ID
+        """
+        run_id = uuid.uuid4().hex[:12]
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        lines = [
+            json.dumps({"type": "call", "run_id": run_id, "timestamp": timestamp, **call}, ensure_ascii=False)
+            for call in calls
+        ]
+        lines.append(json.dumps({"type": "run", "run_id": run_id, "timestamp": timestamp, **metrics["run"]},
+                                ensure_ascii=False))
+        try:
+            with self._lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"      ⚠️  LLM 호출 지표 기록 실패 (무시): {str(e)}")
+        return run_id
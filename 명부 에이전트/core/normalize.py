@@ -0,0 +1,252 @@
+"""
+명부 컬럼 타입 정규화
+사원번호, 날짜, 코드, 금액 컬럼을 비교와 집계가 빠른 타입으로 변환
+"""
+
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 컬럼 종류별 헤더 키워드 (공백/줄바꿈을 제거한 헤더에 포함되는지로 판단, 위에서부터 우선)
+# 금액을 날짜보다 먼저 확인 ("사유발생일 시점 발생금액"은 금액 컬럼)
+ROSTER_COLUMN_KEYWORDS = [
+    ("money", ["기준급여", "퇴직금", "추계액", "중간정산액", "발생금액", "지급액"]),
+    ("date", ["생년월일", "입사일", "중간정산기준일", "중간정산일", "퇴직일", "DC전환일", "사유발생일"]),
+    ("employee_id", ["사원번호"]),
+    ("code", ["성별", "종업원구분", "직종구분", "제도구분", "적용제도번호", "사유"]),
+]
+
+# Excel 날짜 serial 범위 (1900-01-01 ~ 2173-10-14)
+_SERIAL_MIN = 1
+_SERIAL_MAX = 100000
+
+# yyyymmdd 숫자 범위
+_YYYYMMDD_MIN = 18000101
+_YYYYMMDD_MAX = 29991231
+
+_EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+
+
+def _compact_header(column: Any) -> str:
+    """헤더에서 공백과 줄바꿈 제거"""
+    return re.sub(r"\s+", "", str(column))
+
+
+def classify_roster_columns(columns) -> Dict[Any, str]:
+    """
+    헤더 이름으로 명부 컬럼 종류 판별
+
+    Args:
+        columns: DataFrame 컬럼 목록
+
+    Returns:
+        {컬럼명: 종류} 딕셔너리 (종류: employee_id, date, code, money)
+    """
+    kinds = {}
+    for column in columns:
+        header = _compact_header(column)
+        for kind, keywords in ROSTER_COLUMN_KEYWORDS:
+            if any(keyword in header for keyword in keywords):
+                kinds[column] = kind
+                break
+    return kinds
+
+
+def find_column(columns, kind: str, keyword: Optional[str] = None) -> Optional[Any]:
+    """
+    특정 종류(및 키워드)에 해당하는 첫 번째 컬럼명 찾기
+
+    Args:
+        columns: DataFrame 컬럼 목록
+        kind: 컬럼 종류 (employee_id, date, code, money)
+        keyword: 헤더에 포함되어야 하는 추가 키워드
+
+    Returns:
+        컬럼명 (없으면 None)
+    """
+    for column, column_kind in classify_roster_columns(columns).items():
+        if column_kind != kind:
+            continue
+        if keyword is None or keyword in _compact_header(column):
+            return column
+    return None
+
+
+def normalize_employee_id(series: pd.Series) -> pd.Series:
+    """
+    사원번호를 비교 가능한 키로 정규화
+
+    모든 값이 정수로 표현되면 Int64, 그렇지 않으면 앞뒤 공백을 제거한 문자열
+    (정수로 떨어지는 실수 190001.0은 "190001")로 변환합니다.
+
+    Args:
+        series: 사원번호 컬럼
+
+    Returns:
+        정규화된 사원번호 Series
+    """
+    numeric = pd.to_numeric(series, errors="coerce")
+    present = series.notna() & (series.astype(str).str.strip() != "")
+    integral = numeric.notna() & (numeric == np.floor(numeric))
+
+    if (integral | ~present).all():
+        return numeric.where(present).astype("Int64")
+
+    text = series.astype("string").str.strip()
+    as_int = numeric.where(integral).astype("Int64").astype("string")
+    text = as_int.where(integral, text)
+    return text.where(present)
+
+
+def to_datetime_column(series: pd.Series) -> pd.Series:
+    """
+    여러 형식이 섞인 날짜 컬럼을 datetime64로 변환
+
+    - datetime / Timestamp: 그대로
+    - 8자리 숫자 또는 문자열 (yyyymmdd, 구분자 . - / 허용): yyyymmdd로 해석
+    - 1 ~ 100000 사이 숫자: Excel 날짜 serial로 해석
+    - 그 외 문자열: pandas 날짜 파싱 (실패하면 NaT)
+
+    Args:
+        series: 날짜 컬럼
+
+    Returns:
+        datetime64 Series (변환할 수 없는 값은 NaT)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    result = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+
+    # datetime 객체 (숫자 컬럼에는 없음)
+    if pd.api.types.is_numeric_dtype(series):
+        is_datetime = pd.Series(False, index=series.index)
+    else:
+        is_datetime = series.map(lambda v: isinstance(v, np.datetime64) or
+                                 (hasattr(v, "year") and hasattr(v, "month")))
+    if is_datetime.any():
+        result[is_datetime] = pd.to_datetime(series[is_datetime], errors="coerce")
+
+    # 숫자 (serial 또는 yyyymmdd)
+    numeric = pd.to_numeric(series.where(~is_datetime), errors="coerce")
+    is_yyyymmdd = numeric.between(_YYYYMMDD_MIN, _YYYYMMDD_MAX) & (numeric == np.floor(numeric))
+    if is_yyyymmdd.any():
+        result[is_yyyymmdd] = pd.to_datetime(
+            numeric[is_yyyymmdd].astype("int64").astype(str), format="%Y%m%d", errors="coerce"
+        )
+    is_serial = numeric.between(_SERIAL_MIN, _SERIAL_MAX, inclusive="neither")
+    if is_serial.any():
+        result[is_serial] = _EXCEL_EPOCH + pd.to_timedelta(np.floor(numeric[is_serial]), unit="D")
+
+    # 숫자로 해석되지 않은 문자열
+    is_text = series.notna() & ~is_datetime & numeric.isna()
+    if is_text.any():
+        text = series[is_text].astype(str).str.strip()
+        digits = text.str.replace(r"[.\-/\s]", "", regex=True)
+        is_compact = digits.str.fullmatch(r"\d{8}")
+        if is_compact.any():
+            result[is_compact[is_compact].index] = pd.to_datetime(
+                digits[is_compact], format="%Y%m%d", errors="coerce"
+            )
+        rest = text[~is_compact & (text != "")]
+        if not rest.empty:
+            result[rest.index] = pd.to_datetime(rest, errors="coerce", format="mixed")
+
+    return result
+
+
+def to_money_column(series: pd.Series) -> pd.Series:
+    """
+    금액 컬럼을 float64로 변환 (문자열의 천 단위 구분 기호 제거)
+
+    Args:
+        series: 금액 컬럼
+
+    Returns:
+        float64 Series (변환할 수 없는 값은 NaN)
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+
+    text = series.where(series.map(lambda v: not isinstance(v, str)),
+                        series.astype(str).str.replace(",", "", regex=False).str.strip())
+    return pd.to_numeric(text, errors="coerce").astype("float64")
+
+
+def to_code_column(series: pd.Series) -> pd.Series:
+    """
+    코드 컬럼(성별, 종업원구분 등)을 category로 변환 (정수 코드는 정수 카테고리)
+
+    Args:
+        series: 코드 컬럼
+
+    Returns:
+        category Series
+    """
+    numeric = pd.to_numeric(series, errors="coerce")
+    if (numeric.notna() == series.notna()).all() and (numeric.dropna() == np.floor(numeric.dropna())).all():
+        return numeric.astype("Int64").astype("category")
+
+    return series.astype("string").str.strip().astype("category")
+
+
+_CONVERTERS = {
+    "employee_id": normalize_employee_id,
+    "date": to_datetime_column,
+    "code": to_code_column,
+    "money": to_money_column,
+}
+
+
+def normalize_dataframe(df: pd.DataFrame, sheet_name: str = "") -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """
+    명부 시트의 알려진 컬럼을 정규화하고 컬럼별 메모리 변화를 보고
+
+    사원번호 컬럼이 있는 시트만 명부로 보고 변환하며, 그 외 시트는 그대로 반환합니다.
+    변환에 실패한 컬럼은 원래 값을 유지합니다.
+
+    Args:
+        df: 시트 DataFrame
+        sheet_name: 보고서에 기록할 시트명
+
+    Returns:
+        (정규화된 DataFrame, 컬럼별 보고 리스트) 튜플
+        보고 항목: {"sheet", "column", "kind", "dtype_before", "dtype_after",
+                   "bytes_before", "bytes_after", "invalid"}
+    """
+    kinds = classify_roster_columns(df.columns)
+    if "employee_id" not in kinds.values():
+        return df, []
+
+    normalized = df.copy()
+    report = []
+
+    for column, kind in kinds.items():
+        # 중복 컬럼명은 건너뜀 (df[column]이 DataFrame이 되는 경우)
+        if not isinstance(df[column], pd.Series):
+            continue
+
+        before = df[column]
+        try:
+            after = _CONVERTERS[kind](before)
+        except Exception as e:
+            print(f"      ⚠️  컬럼 '{column}' 정규화 실패 (원래 값 유지): {str(e)}")
+            continue
+
+        normalized[column] = after
+        report.append({
+            "sheet": sheet_name,
+            "column": column,
+            "kind": kind,
+            "dtype_before": str(before.dtype),
+            "dtype_after": str(after.dtype),
+            "bytes_before": int(before.memory_usage(deep=True, index=False)),
+            "bytes_after": int(after.memory_usage(deep=True, index=False)),
+            # 값이 있었는데 변환 후 비어 버린 셀 수 (데이터 이상 후보)
+            "invalid": int((before.notna() & after.isna()).sum()),
+        })
+
+    return normalized, report
@@ -0,0 +1,229 @@
+"""
+여러 엑셀 파일 일괄 검증 파이프라인
+로드 → AI 검증 → 리포트 생성 단계를 겹쳐서 실행
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+from .findings import count_by_severity
+from .loader import ExcelLoader
+
+
+# 단계 종료 신호
+_STOP = object()
+
+
+def _load_file(loader: ExcelLoader, file_path: Path) -> Tuple[Dict[str, Any], float]:
+    """
+    워커 프로세스에서 엑셀 파일 하나를 로드 (프로세스 풀에서 호출되므로 모듈 최상위 함수)
+
+    Returns:
+        ({시트명: DataFrame} 딕셔너리, 로드 소요 시간(초)) 튜플
+    """
+    started = time.perf_counter()
+    dataframes = loader.load_excel(file_path)
+    return dataframes, time.perf_counter() - started
+
+
+class BatchPipeline:
+    """
+    여러 엑셀 파일을 생산자/소비자 방식으로 검증하는 클래스
+
+    파일 N+1의 로드(워커 프로세스), 파일 N의 AI 검증, 파일 N-1의 리포트 생성이
+    동시에 진행됩니다. 단계 사이의 큐 크기를 제한하여 로드된 데이터가
+    메모리에 무한정 쌓이지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        loader: ExcelLoader,
+        agent,
+        reporter,
+        load_workers: int = 2,
+        audit_workers: int = 1,
+        report_workers: int = 1,
+        queue_size: int = 2,
+        state_store=None
+    ):
+        """
+        Args:
+            loader: 엑셀 로더 (워커 프로세스로 전달됨)
+            agent: AuditAgent 인스턴스
+            reporter: ReportGenerator 인스턴스
+            load_workers: 파일 로드 워커 프로세스 수
+            audit_workers: 동시에 검증할 파일 수
+            report_workers: 동시에 리포트를 생성할 파일 수
+            queue_size: 단계 사이 대기열 최대 크기
+            state_store: 증분 검증 상태 저장소 (AuditStateStore, None이면 매번 전체 검증)
+        """
+        self.loader = loader
+        self.agent = agent
+        self.reporter = reporter
+        self.load_workers = max(1, load_workers)
+        self.audit_workers = max(1, audit_workers)
+        self.report_workers = max(1, report_workers)
+        self.queue_size = max(1, queue_size)
+        self.state_store = state_store
+
+    def run(self, files: List[Path]) -> Dict[str, Any]:
+        """
+        모든 파일을 파이프라인으로 처리
+
+        Args:
+            files: 검증할 엑셀 파일 경로 리스트
+
+        Returns:
+            실행 요약 딕셔너리
+            {"files": 파일별 결과 리스트, "total", "succeeded", "failed", "elapsed"}
+        """
+        started = time.perf_counter()
+        results = {
+            str(file_path): {
+                "file": file_path.name,
+                "status": "대기",
+                "error": None,
+                "report_path": None,
+                "sheets": 0,
+                "severity_counts": None,
+                "load_seconds": None,
+                "audit_seconds": None,
+                "report_seconds": None
+            }
+            for file_path in files
+        }
+        lock = threading.Lock()
+
+        load_queue = queue.Queue(maxsize=self.queue_size)
+        report_queue = queue.Queue(maxsize=self.queue_size)
+
+        def fail(file_path: Path, stage: str, error: Exception) -> None:
+            with lock:
+                results[str(file_path)]["status"] = "실패"
+                results[str(file_path)]["error"] = f"[{stage}] {str(error)}"
+            print(f"   ❌ {file_path.name}: {stage} 중 오류 - {str(error)}")
+
+        def produce() -> None:
+            queued = set()
+            try:
+                # 워커 수만큼만 로드를 미리 진행 (큐가 가득 차면 대기)
+                with ProcessPoolExecutor(max_workers=self.load_workers) as pool:
+                    pending = deque()
+                    for file_path in files:
+                        pending.append((file_path, pool.submit(_load_file, self.loader, file_path)))
+                        if len(pending) >= self.load_workers:
+                            item = pending.popleft()
+                            load_queue.put(item)
+                            queued.add(str(item[0]))
+                    while pending:
+                        item = pending.popleft()
+                        load_queue.put(item)
+                        queued.add(str(item[0]))
+            except Exception as e:
+                # 프로세스 풀 오류 등으로 검증 단계에 넘기지 못한 파일은 로드 실패로 기록
+                for file_path in files:
+                    if str(file_path) not in queued:
+                        fail(file_path, "로드", e)
+            finally:
+                # 생산자가 실패해도 검증 워커가 끝나도록 종료 신호는 항상 보냄
+                for _ in range(self.audit_workers):
+                    load_queue.put(_STOP)
+
+        def audit_worker() -> None:
+            while True:
+                item = load_queue.get()
+                if item is _STOP:
+                    break
+
+                file_path, future = item
+                try:
+                    dataframes, load_seconds = future.result()
+                except Exception as e:
+                    fail(file_path, "로드", e)
+                    continue
+
+                with lock:
+                    results[str(file_path)]["sheets"] = len(dataframes)
+                    results[str(file_path)]["load_seconds"] = load_seconds
+                print(f"   - {file_path.name}: 로드 완료 ({len(dataframes)}개 시트), 검증 시작")
+
+                audit_started = time.perf_counter()
+                try:
+                    baseline = self.state_store.load(file_path.name) if self.state_store else None
+                    audit_results = self.agent.audit_data(dataframes, baseline)
+                    # 요약 표에 쓸 심각도별 건수 (구조화된 발견 사항이 없으면 규칙 검증 결과 기준)
+                    findings = audit_results.get("structured_findings") or audit_results.get("rule_findings", [])
+                    severity_counts = count_by_severity(findings)
+                except Exception as e:
+                    fail(file_path, "검증", e)
+                    continue
+
+                with lock:
+                    results[str(file_path)]["audit_seconds"] = time.perf_counter() - audit_started
+                    results[str(file_path)]["severity_counts"] = severity_counts
+                report_queue.put((file_path, audit_results))
+
+        def report_worker() -> None:
+            while True:
+                item = report_queue.get()
+                if item is _STOP:
+                    break
+
+                file_path, audit_results = item
+                report_started = time.perf_counter()
+                try:
+                    report_path = self.reporter.generate_report(
+                        audit_results=audit_results,
+                        source_file=file_path.name
+                    )
+                except Exception as e:
+                    fail(file_path, "리포트 생성", e)
+                    continue
+
+                # 리포트까지 만든 검증만 다음 증분 검증의 기준으로 저장
+                # (저장 오류로 리포트 워커가 멈추면 검증 워커가 대기열에서 막히므로 실패로 기록하고 계속)
+                try:
+                    if self.state_store and "audit_state" in audit_results:
+                        self.state_store.save(file_path.name, audit_results["audit_state"])
+                except Exception as e:
+                    fail(file_path, "검증 상태 저장", e)
+                    continue
+
+                with lock:
+                    results[str(file_path)]["status"] = "완료"
+                    results[str(file_path)]["report_path"] = str(report_path)
+                    results[str(file_path)]["report_seconds"] = time.perf_counter() - report_started
+                print(f"   - {file_path.name}: 리포트 생성 완료 ({report_path.name})")
+
+        producer = threading.Thread(target=produce, name="batch-load")
+        auditors = [threading.Thread(target=audit_worker, name=f"batch-audit-{i}")
+                    for i in range(self.audit_workers)]
+        reporters = [threading.Thread(target=report_worker, name=f"batch-report-{i}")
+                     for i in range(self.report_workers)]
+
+        for thread in [producer] + auditors + reporters:
+            thread.start()
+
+        producer.join()
+        for thread in auditors:
+            thread.join()
+        for _ in reporters:
+            report_queue.put(_STOP)
+        for thread in reporters:
+            thread.join()
+
+        file_results = [results[str(file_path)] for file_path in files]
+        succeeded = len([r for r in file_results if r["status"] == "완료"])
+
+        return {
+            "files": file_results,
+            "total": len(file_results),
+            "succeeded": succeeded,
+            "failed": len(file_results) - succeeded,
+            "elapsed": time.perf_counter() - started
+        }
@@ -0,0 +1,242 @@
+"""
+시트 통계 프로파일
+행을 그대로 보내지 않고 컬럼별 통계와 이상치 행만 요약하여 프롬프트 크기를 일정하게 유지
+"""
+
+from typing import Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .normalize import classify_roster_columns, normalize_dataframe
+from .rules import VALUATION_DATE, excel_row
+
+
+# robust z-score 이상치 기준 (|z| > 3.5, Iglewicz & Hoaglin)
+ROBUST_Z_THRESHOLD = 3.5
+
+# 날짜로 보기 어려운 이른 날짜
+MIN_PLAUSIBLE_DATE = pd.Timestamp("1900-01-01")
+
+# 숫자 컬럼으로 볼 최소 숫자 비율 (값이 있는 셀 기준)
+NUMERIC_RATIO = 0.9
+
+
+def _typed_columns(df: pd.DataFrame) -> Dict[int, tuple]:
+    """
+    컬럼 위치별 (종류, 값 Series) 판별
+
+    명부 컬럼은 normalize 규칙으로 변환하고, 그 외 컬럼은 대부분이 숫자면 숫자로 봅니다.
+
+    Returns:
+        {컬럼 위치: (종류, Series)} (종류: date, numeric, code, id, text)
+    """
+    normalized, _ = normalize_dataframe(df)
+    roster_kinds = classify_roster_columns(df.columns) if normalized is not df else {}
+    kind_names = {"date": "date", "money": "numeric", "code": "code", "employee_id": "id"}
+
+    typed = {}
+    for i in range(df.shape[1]):
+        series = normalized.iloc[:, i]
+        kind = kind_names.get(roster_kinds.get(df.columns[i]))
+        if kind is None:
+            if pd.api.types.is_datetime64_any_dtype(series):
+                kind = "date"
+            elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                kind = "numeric"
+            else:
+                numeric = pd.to_numeric(series, errors="coerce")
+                filled = series.notna() & (series.astype(str).str.strip() != "")
+                if filled.any() and numeric[filled].notna().mean() >= NUMERIC_RATIO:
+                    kind, series = "numeric", numeric
+                else:
+                    kind = "text"
+        typed[i] = (kind, series)
+    return typed
+
+
+def _format_stat(value) -> str:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y%m%d")
+    if isinstance(value, (float, np.floating)):
+        return str(int(value)) if float(value).is_integer() else format(float(value), ".15g")
+    return str(value)
+
+
+def robust_z_scores(values: np.ndarray) -> np.ndarray:
+    """
+    열별 robust z-score (0.6745 × (x - 중앙값) / MAD)
+
+    MAD가 0인 열은 평균 절대 편차(× 1.2533)를 사용하고, 그것도 0이면 0으로 둡니다.
+
+    Args:
+        values: (행 수, 열 수) 실수 배열 (NaN 허용)
+
+    Returns:
+        같은 모양의 z-score 배열 (NaN 셀은 0)
+    """
+    if values.size == 0:
+        return np.zeros_like(values)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        median = np.nanmedian(values, axis=0)
+        deviation = np.abs(values - median)
+        mad = np.nanmedian(deviation, axis=0)
+        mean_ad = np.nanmean(deviation, axis=0)
+
+        z = np.where(mad > 0, 0.6745 * (values - median) / mad,
+                     np.where(mean_ad > 0, (values - median) / (1.2533 * mean_ad), 0.0))
+    return np.nan_to_num(z, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def profile_sheet(
+    df: pd.DataFrame,
+    valuation_date: pd.Timestamp = VALUATION_DATE,
+    top_anomalies: int = 10
+) -> Dict[str, Any]:
+    """
+    시트 하나의 통계 프로파일 계산 (벡터 연산)
+
+    Args:
+        df: 시트 DataFrame
+        valuation_date: 평가기준일 (날짜 범위 확인 기준)
+        top_anomalies: 보고할 최대 이상치 셀 수
+
+    Returns:
+        {"rows", "columns", "empty_columns", "column_stats", "duplicate_keys", "anomalies"} 딕셔너리
+        - column_stats: [{"column", "kind", "null_rate", "distinct", "min", "max", "out_of_range"}]
+        - duplicate_keys: {"column", "duplicated_rows", "examples"} (사원번호 컬럼이 없으면 None)
+        - anomalies: [{"position", "row", "column", "value", "z"}] (|z| 큰 순서)
+    """
+    typed = _typed_columns(df)
+    rows = len(df)
+
+    column_stats = []
+    empty_columns = []
+    numeric_positions = []
+    duplicate_keys: Optional[Dict[str, Any]] = None
+
+    for i, (kind, series) in typed.items():
+        column = str(df.columns[i]).replace("\n", " ")
+        present = series.notna()
+        if kind == "text":
+            present &= series.astype(str).str.strip() != ""
+        filled = int(present.sum())
+        if filled == 0:
+            empty_columns.append(column)
+            continue
+
+        values = series[present]
+        stat = {
+            "column": column,
+            "kind": kind,
+            "null_rate": 1 - filled / rows if rows else 0.0,
+            "distinct": int(values.nunique()),
+            "min": None,
+            "max": None,
+            "out_of_range": 0,
+        }
+
+        if kind == "date":
+            stat["min"], stat["max"] = values.min(), values.max()
+            stat["out_of_range"] = int(((values > valuation_date) | (values < MIN_PLAUSIBLE_DATE)).sum())
+        elif kind in ("numeric", "id", "code"):
+            numbers = pd.to_numeric(values.astype(object), errors="coerce")
+            if numbers.notna().any():
+                stat["min"], stat["max"] = numbers.min(), numbers.max()
+            if kind == "numeric":
+                stat["out_of_range"] = int((numbers < 0).sum())
+                numeric_positions.append(i)
+
+        if kind == "id" and duplicate_keys is None:
+            duplicated = series.notna() & series.duplicated(keep=False)
+            counts = series[duplicated].value_counts()
+            duplicate_keys = {
+                "column": column,
+                "duplicated_rows": int(duplicated.sum()),
+                "examples": [f"{key}({count}회)" for key, count in counts.head(5).items()],
+            }
+
+        column_stats.append(stat)
+
+    anomalies = []
+    if numeric_positions and rows:
+        matrix = np.column_stack([
+            pd.to_numeric(typed[i][1], errors="coerce").astype("float64").to_numpy()
+            for i in numeric_positions
+        ])
+        z = robust_z_scores(matrix)
+        magnitude = np.abs(z)
+        flat = magnitude.ravel()
+        candidates = np.flatnonzero(flat > ROBUST_Z_THRESHOLD)
+        if candidates.size:
+            top = candidates[np.argsort(-flat[candidates], kind="stable")[:top_anomalies]]
+            for cell in top:
+                position, k = divmod(int(cell), len(numeric_positions))
+                anomalies.append({
+                    "position": position,
+                    "row": excel_row(position),
+                    "column": str(df.columns[numeric_positions[k]]).replace("\n", " "),
+                    "value": float(matrix[position, k]),
+                    "z": float(z[position, k]),
+                })
+
+    return {
+        "rows": rows,
+        "columns": df.shape[1],
+        "empty_columns": empty_columns,
+        "column_stats": column_stats,
+        "duplicate_keys": duplicate_keys,
+        "anomalies": anomalies,
+    }
+
+
+def format_profile(profile: Dict[str, Any], valuation_date: pd.Timestamp = VALUATION_DATE) -> str:
+    """
+    프로파일을 프롬프트용 텍스트로 변환
+
+    Args:
+        profile: profile_sheet() 결과
+        valuation_date: 평가기준일
+
+    Returns:
+        프로파일 텍스트
+    """
+    lines = [f"행 수: {profile['rows']}, 컬럼 수: {profile['columns']}"]
+    if profile["empty_columns"]:
+        lines.append(f"비어 있는 컬럼 {len(profile['empty_columns'])}개 생략")
+
+    lines.append("")
+    lines.append(f"컬럼별 통계 (범위 밖: 날짜는 1900년 이전 또는 평가기준일 "
+                 f"{valuation_date.strftime('%Y%m%d')} 이후, 금액은 음수):")
+    lines.append("컬럼|종류|빈 값 비율|고유값 수|최소|최대|범위 밖")
+    for stat in profile["column_stats"]:
+        lines.append("|".join([
+            stat["column"],
+            stat["kind"],
+            f"{stat['null_rate']:.1%}",
+            str(stat["distinct"]),
+            _format_stat(stat["min"]),
+            _format_stat(stat["max"]),
+            str(stat["out_of_range"]),
+        ]))
+
+    duplicate_keys = profile["duplicate_keys"]
+    if duplicate_keys is not None:
+        lines.append("")
+        if duplicate_keys["duplicated_rows"]:
+            lines.append(f"{duplicate_keys['column']} 중복: {duplicate_keys['duplicated_rows']}행 "
+                         f"(예: {', '.join(duplicate_keys['examples'])})")
+        else:
+            lines.append(f"{duplicate_keys['column']} 중복: 없음")
+
+    if profile["anomalies"]:
+        lines.append("")
+        lines.append(f"robust z-score 이상치 (|z| > {ROBUST_Z_THRESHOLD}, 상위 {len(profile['anomalies'])}건):")
+        for anomaly in profile["anomalies"]:
+            lines.append(f"- {anomaly['row']}행 {anomaly['column']}="
+                         f"{_format_stat(anomaly['value'])} (z={anomaly['z']:.1f})")
+
+    return "\n".join(lines)
@@ -0,0 +1,175 @@
+"""
+LLM 호출 속도 제한
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 예산을 토큰 버킷으로 관리
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+# 잠시 후 다시 시도하면 성공할 수 있는 HTTP 상태 코드
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# 상태 코드가 없는 일시적 오류 (openai/httpx 예외 클래스 이름)
+TRANSIENT_ERROR_NAMES = {
+    "APIConnectionError", "APITimeoutError", "InternalServerError",
+    "ConnectError", "ReadTimeout", "ConnectTimeout", "RemoteProtocolError",
+}
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    속도 제한(HTTP 429) 오류인지 확인
+
+    openai.RateLimitError와 status_code가 429인 예외(가짜 모델 포함)를 속도 제한으로 봅니다.
+    """
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return type(error).__name__ == "RateLimitError"
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    다시 시도할 만한 일시적 오류인지 확인
+
+    속도 제한(429), 서버 오류(5xx), 요청 시간 초과, 연결 오류를 재시도 대상으로 봅니다.
+    """
+    if is_rate_limit_error(error):
+        return True
+    if getattr(error, "status_code", None) in TRANSIENT_STATUS_CODES:
+        return True
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return type(error).__name__ in TRANSIENT_ERROR_NAMES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    오류에 담긴 재시도 대기 시간(초) 추출
+
+    예외의 retry_after 속성이나 HTTP 응답의 Retry-After 헤더를 확인합니다.
+
+    Returns:
+        대기 시간 (알 수 없으면 None)
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("retry-after")
+    try:
+        return max(0.0, float(retry_after)) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """일정 속도로 채워지는 용량 제한 버킷"""
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: 분당 허용량 (버킷 용량이자 1분 동안 채워지는 양)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 쓸 수 있을 때까지 기다려야 하는 시간(초)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """amount만큼 사용 (용량보다 큰 요청은 용량만큼으로 계산)"""
+        self._refill()
+        self.available -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    RPM/TPM 예산을 지키도록 비동기 LLM 호출을 지연시키는 클래스
+
+    acquire()는 요청 1건과 예상 토큰 수를 예산에서 차감할 수 있을 때까지 기다립니다.
+    대기 중인 요청은 도착 순서대로 처리됩니다. 동기 호출에서는 acquire_blocking()을 사용합니다.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (None이면 제한 없음)
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock: Optional[asyncio.Lock] = None
+        self._thread_lock = threading.Lock()
+
+    def _wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def _consume(self, tokens: int) -> None:
+        if self.requests is not None:
+            self.requests.consume(1)
+        if self.tokens is not None:
+            self.tokens.consume(tokens)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1건과 토큰 예산 확보
+
+        Args:
+            tokens: 이번 요청의 예상 토큰 수
+
+        Returns:
+            예산 확보를 위해 기다린 시간(초)
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        async with self._lock:
+            while True:
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+                waited += wait
+            self._consume(tokens)
+
+        return waited
+
+    def acquire_blocking(self, tokens: int = 0) -> float:
+        """
+        acquire()의 동기 버전 (예산을 확보할 때까지 현재 스레드를 멈춤)
+
+        Returns:
+            예산 확보를 위해 기다린 시간(초)
+        """
+        waited = 0.0
+        with self._thread_lock:
+            while True:
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+                waited += wait
+            self._consume(tokens)
+
+        return waited
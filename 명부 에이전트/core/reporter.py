@@ -33,9 +33,9 @@ class ReportGenerator:
         Returns:
             생성된 리포트 파일 경로
         """
-        # 파일명 생성
+        # 파일명 생성 (일괄 처리 시 파일별 리포트가 겹치지 않도록 원본 파일명 포함)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_filename = f"감사_의견서_{timestamp}.xlsx"
+        report_filename = f"감사_의견서_{Path(source_file).stem}_{timestamp}.xlsx"
         report_path = self.output_dir / report_filename
         
         # 워크북 생성
@@ -127,11 +127,222 @@ class ReportGenerator:
         ws.column_dimensions['C'].width = 30
         ws.column_dimensions['D'].width = 30
         
+        # 발견 사항 표 (구조화된 발견 사항이 있으면 규칙 검증 결과를 포함한 전체 목록)
+        # (증분 검증이면 해결된 이전 발견 사항도 상태와 함께 표시)
+        structured_findings = audit_results.get("structured_findings", [])
+        resolved_findings = audit_results.get("resolved_findings", [])
+        rule_findings = audit_results.get("rule_findings", [])
+        if structured_findings or resolved_findings:
+            self._write_findings(wb, structured_findings + resolved_findings, header_font, header_fill,
+                                 title="발견 사항", show_source=True,
+                                 show_status="resolved_findings" in audit_results)
+        elif rule_findings:
+            self._write_findings(wb, rule_findings, header_font, header_fill)
+        
+        # AI 호출 지표 표
+        metrics = audit_results.get("metrics")
+        if metrics and metrics["run"]["calls"]:
+            self._write_metrics(wb, metrics, header_font, header_fill)
+        
         # 파일 저장
         wb.save(report_path)
         
         return report_path
     
+    def _write_findings(self, wb: Workbook, findings, header_font, header_fill,
+                        title: str = "규칙 검증", show_source: bool = False,
+                        show_status: bool = False) -> None:
+        """
+        발견 사항을 별도 시트에 표로 작성
+        
+        Args:
+            wb: 리포트 워크북
+            findings: agent.audit_data()의 rule_findings 또는 structured_findings 리스트
+            header_font: 헤더 글꼴
+            header_fill: 헤더 배경색
+            title: 시트 이름
+            show_source: True면 출처(규칙/AI) 컬럼 추가
+            show_status: True면 증분 검증 상태(신규/유지/해결) 컬럼 추가
+        """
+        ws = wb.create_sheet(title)
+        
+        headers = ["심각도", "규칙", "시트", "행", "사원번호", "내용"]
+        if show_source:
+            headers.append("출처")
+        if show_status:
+            headers.append("상태")
+        for col, header in enumerate(headers, start=1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal="center")
+        
+        sources = {"rule": "규칙", "llm": "AI"}
+        for row, finding in enumerate(findings, start=2):
+            values = [
+                finding.get("severity"),
+                finding.get("rule_id"),
+                finding.get("sheet"),
+                finding.get("row"),
+                finding.get("employee_id"),
+                finding.get("message"),
+            ]
+            if show_source:
+                values.append(sources.get(finding.get("source"), finding.get("source")))
+            if show_status:
+                values.append(finding.get("status"))
+            for col, value in enumerate(values, start=1):
+                cell = ws.cell(row=row, column=col, value=value)
+                if finding.get("status") == "해결":
+                    cell.font = Font(color="808080")
+            if finding.get("severity") == "심각" and finding.get("status") != "해결":
+                ws.cell(row=row, column=1).font = Font(color="FF0000", bold=True)
+        
+        ws.freeze_panes = "A2"
+        widths = [8, 22, 30, 8, 12, 90, 8, 8]
+        for col, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+    
+    def _write_metrics(self, wb: Workbook, metrics: Dict[str, Any], header_font, header_fill) -> None:
+        """
+        시트별/전체 AI 호출 지표를 별도 시트에 표로 작성
+        
+        Args:
+            wb: 리포트 워크북
+            metrics: agent.audit_data()의 metrics 딕셔너리
+            header_font: 헤더 글꼴
+            header_fill: 헤더 배경색
+        """
+        ws = wb.create_sheet("AI 호출 지표")
+        
+        headers = ["시트", "호출 수", "캐시 재사용", "실패", "재시도", "프롬프트 토큰", "응답 토큰",
+                   "호출 시간 합계(초)", "평균 지연(초)", "평균 첫 토큰(초)", "예상 비용(USD)"]
+        for col, header in enumerate(headers, start=1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal="center")
+        
+        rows = list(metrics["sheets"].items()) + [("전체", metrics["run"])]
+        for row, (sheet_name, stats) in enumerate(rows, start=2):
+            values = [
+                sheet_name,
+                stats["calls"],
+                stats["cached_calls"],
+                stats["failed_calls"],
+                stats["retries"],
+                stats["prompt_tokens"],
+                stats["completion_tokens"],
+                round(stats["latency_seconds"], 2),
+                None if stats["avg_latency"] is None else round(stats["avg_latency"], 2),
+                None if stats["avg_ttft"] is None else round(stats["avg_ttft"], 2),
+                round(stats["cost_usd"], 6),
+            ]
+            for col, value in enumerate(values, start=1):
+                ws.cell(row=row, column=col, value=value)
+        
+        total_row = len(rows) + 1
+        for col in range(1, len(headers) + 1):
+            ws.cell(row=total_row, column=col).font = Font(bold=True)
+        
+        run = metrics["run"]
+        ws.cell(row=total_row + 2, column=1, value="검증 소요 시간(초)")
+        ws.cell(row=total_row + 2, column=2, value=round(run["elapsed_seconds"], 2))
+        ws.cell(row=total_row + 3, column=1, value="처리량(토큰/초)")
+        ws.cell(row=total_row + 3, column=2,
+                value=None if run["tokens_per_second"] is None else round(run["tokens_per_second"], 1))
+        
+        ws.freeze_panes = "A2"
+        widths = [30, 9, 11, 7, 8, 13, 11, 17, 13, 15, 14]
+        for col, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+    
+    def generate_run_summary(self, run_summary: Dict[str, Any]) -> Path:
+        """
+        일괄 검증 실행 결과를 하나의 요약 엑셀 파일로 생성
+        
+        Args:
+            run_summary: BatchPipeline.run()에서 반환된 실행 요약
+            
+        Returns:
+            생성된 요약 파일 경로
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_filename = f"일괄검증_요약_{timestamp}.xlsx"
+        report_path = self.output_dir / report_filename
+        
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "실행 요약"
+        
+        # 스타일 정의
+        header_font = Font(bold=True, size=11, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        title_font = Font(bold=True, size=14)
+        
+        # 제목 행
+        ws.merge_cells('A1:K1')
+        ws['A1'] = "확정급여채무평가 데이터 일괄 검증 요약"
+        ws['A1'].font = title_font
+        ws['A1'].alignment = Alignment(horizontal="center", vertical="center")
+        
+        # 메타 정보
+        row = 3
+        meta = [
+            ("검증 일시:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ("전체 파일:", f"{run_summary.get('total', 0)}개"),
+            ("완료:", f"{run_summary.get('succeeded', 0)}개"),
+            ("실패:", f"{run_summary.get('failed', 0)}개"),
+            ("소요 시간:", f"{run_summary.get('elapsed', 0):.1f}초"),
+        ]
+        for label, value in meta:
+            ws[f'A{row}'] = label
+            ws[f'B{row}'] = value
+            ws[f'A{row}'].font = Font(bold=True)
+            row += 1
+        
+        # 파일별 결과 표
+        row += 1
+        headers = ["파일명", "상태", "시트 수", "심각", "중요", "경미",
+                   "로드(초)", "검증(초)", "리포트(초)", "리포트 파일", "오류"]
+        for col, header in enumerate(headers, start=1):
+            cell = ws.cell(row=row, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal="center")
+        
+        for file_result in run_summary.get("files", []):
+            row += 1
+            severity_counts = file_result.get("severity_counts") or {}
+            values = [
+                file_result.get("file"),
+                file_result.get("status"),
+                file_result.get("sheets"),
+                severity_counts.get("심각"),
+                severity_counts.get("중요"),
+                severity_counts.get("경미"),
+                file_result.get("load_seconds"),
+                file_result.get("audit_seconds"),
+                file_result.get("report_seconds"),
+                Path(file_result["report_path"]).name if file_result.get("report_path") else "",
+                file_result.get("error") or "",
+            ]
+            for col, value in enumerate(values, start=1):
+                cell = ws.cell(row=row, column=col, value=value)
+                if isinstance(value, float):
+                    cell.number_format = "0.0"
+            if file_result.get("status") != "완료":
+                ws.cell(row=row, column=2).font = Font(color="FF0000", bold=True)
+        
+        # 열 너비 조정
+        widths = [40, 8, 8, 7, 7, 7, 10, 10, 10, 50, 50]
+        for col, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        
+        wb.save(report_path)
+        
+        return report_path
+    
     def generate_text_report(self, audit_results: Dict[str, Any], source_file: str) -> Path:
         """
         검증 결과를 텍스트 파일로도 생성 (추가 옵션)
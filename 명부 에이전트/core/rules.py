@@ -0,0 +1,447 @@
+"""
+결정적 규칙 검증 엔진
+brain/knowledge.md의 핵심 검증 규칙을 pandas 벡터 연산으로 전체 명부에 적용
+"""
+
+import re
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .normalize import (
+    classify_roster_columns,
+    find_column,
+    normalize_employee_id,
+    to_datetime_column,
+    to_money_column,
+)
+
+
+# 평가기준일 (knowledge.md 7.1)
+VALUATION_DATE = pd.Timestamp("2022-12-31")
+
+# 심각도 (knowledge.md 5장)
+SEVERITY_CRITICAL = "심각"
+SEVERITY_IMPORTANT = "중요"
+SEVERITY_MINOR = "경미"
+
+# 규칙 ID와 심각도
+RULES = {
+    "DUP_IN_ROSTER": SEVERITY_CRITICAL,       # 2.1.2 명부 내부 사원번호 중복
+    "DUP_ACROSS_ROSTERS": SEVERITY_CRITICAL,  # 2.1.1 재직자/퇴직자 명부 간 사원번호 중복
+    "INTERIM_IN_RETIREES": SEVERITY_CRITICAL, # 2.2.1 중간정산자가 퇴직자 명부에 있음
+    "DATE_ORDER": SEVERITY_IMPORTANT,         # 2.3.1 날짜 순서 오류
+    "DATE_AFTER_VALUATION": SEVERITY_CRITICAL,  # 2.3.2 평가기준일 이후 날짜
+    "ZERO_SEVERANCE": SEVERITY_IMPORTANT,     # 2.4.1 근속 1년 이상인데 퇴직금 0원
+}
+
+# 날짜 역할 (필수 순서대로: 생년월일 < 입사일 < 중간정산일 < 퇴직일)
+DATE_ROLES = [
+    ("birth", "생년월일", ["생년월일"]),
+    ("hire", "입사일", ["입사일"]),
+    ("interim", "중간정산일", ["중간정산"]),
+    ("retire", "퇴직일", ["퇴직일", "DC전환일"]),
+]
+
+# 명부 종류 (시트명 키워드로 판별)
+ROSTER_ACTIVE = "재직자"
+ROSTER_RETIREE = "퇴직자"
+ROSTER_OTHER = "기타"
+
+
+def roster_role(sheet_name: str) -> str:
+    """
+    시트명으로 명부 종류 판별
+
+    Returns:
+        "재직자", "퇴직자" 또는 "기타"
+    """
+    name = re.sub(r"\s+", "", sheet_name)
+    if "퇴직자" in name or "DC전환" in name:
+        return ROSTER_RETIREE
+    if "재직자" in name:
+        return ROSTER_ACTIVE
+    return ROSTER_OTHER
+
+
+def excel_row(index_label) -> int:
+    """DataFrame 행 위치를 엑셀 행 번호로 변환 (1행은 헤더)"""
+    return int(index_label) + 2
+
+
+def _format_date(value) -> str:
+    return f"{value.year}년 {value.month}월 {value.day}일"
+
+
+class Roster:
+    """규칙 검증에 필요한 컬럼만 타입을 맞춰 뽑아 둔 명부 시트"""
+
+    def __init__(self, sheet_name: str, df: pd.DataFrame):
+        """
+        Args:
+            sheet_name: 시트명
+            df: 시트 DataFrame (사원번호 컬럼이 있어야 함)
+        """
+        columns = df.columns
+        kinds = classify_roster_columns(columns)
+
+        self.sheet = sheet_name
+        self.role = roster_role(sheet_name)
+
+        id_column = find_column(columns, "employee_id")
+        self.ids = normalize_employee_id(df[id_column])
+        # 명부 간 비교용 문자열 키 (정수 사원번호와 문자열 사원번호를 같은 값으로 비교)
+        self.keys = self.ids.astype("string")
+
+        self.dates: Dict[str, pd.Series] = {}
+        self.date_labels: Dict[str, str] = {}
+        for role, label, keywords in DATE_ROLES:
+            column = next(
+                (c for c, kind in kinds.items()
+                 if kind == "date" and any(k in re.sub(r"\s+", "", str(c)) for k in keywords)),
+                None
+            )
+            if column is not None:
+                self.dates[role] = to_datetime_column(df[column])
+                self.date_labels[role] = label
+
+        severance_column = find_column(columns, "money", "퇴직금")
+        self.severance = to_money_column(df[severance_column]) if severance_column is not None else None
+
+        interim_amount_column = find_column(columns, "money", "중간정산액")
+        interim_amount = (to_money_column(df[interim_amount_column])
+                          if interim_amount_column is not None else None)
+
+        # 중간정산 이력이 있는 행 (중간정산일 또는 0이 아닌 중간정산액)
+        has_interim = pd.Series(False, index=df.index)
+        if "interim" in self.dates:
+            has_interim |= self.dates["interim"].notna()
+        if interim_amount is not None:
+            has_interim |= interim_amount.fillna(0) != 0
+        self.has_interim = has_interim & self.ids.notna()
+
+
+def _key_codes(rosters: List[Roster]) -> Dict[str, np.ndarray]:
+    """
+    명부 간 비교용 사원번호 정수 코드
+
+    모든 명부의 사원번호를 한 번에 factorize하여 같은 사원번호는 명부가 달라도 같은 코드가 되고,
+    빈 사원번호는 -1입니다. 문자열 컬럼끼리 isin()하는 것보다 정수 배열 비교가 훨씬 빠릅니다.
+
+    Returns:
+        {시트명: 행 순서대로 코드 배열}
+    """
+    if not rosters:
+        return {}
+    codes, _ = pd.factorize(pd.concat([roster.keys for roster in rosters], ignore_index=True))
+    result = {}
+    start = 0
+    for roster in rosters:
+        result[roster.sheet] = codes[start:start + len(roster.keys)]
+        start += len(roster.keys)
+    return result
+
+
+class Posting(NamedTuple):
+    """사원번호 색인의 항목 하나: 사원번호가 나타난 시트와 행"""
+
+    sheet: str
+    role: str
+    label: Any          # DataFrame 행 라벨
+    row: int            # 엑셀 행 번호
+    has_interim: bool   # 이 행에 중간정산 이력이 있는지
+
+
+class EmployeeIndex:
+    """
+    워크북 전체의 사원번호 색인 (정규화한 사원번호 → 나타난 (시트, 행) 목록)
+
+    워크북마다 한 번 만들어 두면 사원 한 명이 명부 안에서 중복인지, 재직자/퇴직자 명부에
+    동시에 있는지, 중간정산자인데 퇴직자 명부에 있는지를 사원마다 O(1)로 확인할 수 있습니다.
+    """
+
+    def __init__(self, rosters: List[Roster]):
+        """
+        Args:
+            rosters: 색인할 명부 (시트 순서대로)
+        """
+        self.sheets = [roster.sheet for roster in rosters]
+        self.postings: Dict[str, List[Posting]] = {}
+        for roster in rosters:
+            present = roster.ids.notna()
+            keys = roster.keys[present]
+            for key, label, has_interim in zip(keys.tolist(), keys.index.tolist(),
+                                               roster.has_interim[present].tolist()):
+                self.postings.setdefault(key, []).append(
+                    Posting(roster.sheet, roster.role, label, excel_row(label), bool(has_interim))
+                )
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def __contains__(self, employee_id) -> bool:
+        return self.normalize(employee_id) in self.postings
+
+    @staticmethod
+    def normalize(employee_id) -> Optional[str]:
+        """사원번호 값을 색인 키로 변환 (명부의 사원번호와 같은 규칙으로 정규화)"""
+        key = normalize_employee_id(pd.Series([employee_id], dtype=object)).astype("string").iloc[0]
+        return None if pd.isna(key) else key
+
+    def lookup(self, employee_id) -> List[Posting]:
+        """사원번호가 나타난 모든 (시트, 행) (없으면 빈 리스트)"""
+        return self.postings.get(self.normalize(employee_id), [])
+
+    def classify(self, employee_id) -> Dict[str, bool]:
+        """
+        사원번호 한 명의 명부 간 상태
+
+        Returns:
+            {"duplicated_in_roster", "across_rosters", "interim_in_retirees"} 딕셔너리
+        """
+        return self.classify_postings(self.lookup(employee_id))
+
+    @classmethod
+    def classify_postings(cls, postings: List[Posting]) -> Dict[str, bool]:
+        """사원번호 한 명의 항목 목록으로 명부 간 상태 판단 (classify() 참고)"""
+        sheets = [p.sheet for p in postings]
+        roles = {p.role for p in postings}
+        return {
+            "duplicated_in_roster": len(sheets) != len(set(sheets)),
+            "across_rosters": ROSTER_ACTIVE in roles and ROSTER_RETIREE in roles,
+            "interim_in_retirees": bool(cls.interim_retiree_postings(postings)),
+        }
+
+    @staticmethod
+    def interim_retiree_postings(postings: List[Posting]) -> List[Posting]:
+        """
+        중간정산자인데 퇴직자 명부에 있는 항목
+
+        퇴직자 명부 행 자체에 중간정산 이력이 있거나, 같은 사원번호가 다른 명부에서
+        중간정산 이력과 함께 나타나면 해당 퇴직자 명부 행을 돌려줍니다.
+        """
+        retirees = [p for p in postings if p.role == ROSTER_RETIREE]
+        if not retirees:
+            return []
+        interim_elsewhere = any(p.has_interim for p in postings if p.role != ROSTER_RETIREE)
+        return [p for p in retirees if p.has_interim or interim_elsewhere]
+
+    def summary(self) -> Dict[str, int]:
+        """
+        색인 통계
+
+        Returns:
+            {"employees", "postings", "duplicated_in_roster", "across_rosters", "interim_in_retirees"}
+            (뒤의 세 값은 해당하는 사원 수)
+        """
+        stats = {"employees": len(self.postings), "postings": 0,
+                 "duplicated_in_roster": 0, "across_rosters": 0, "interim_in_retirees": 0}
+        for postings in self.postings.values():
+            stats["postings"] += len(postings)
+            for name, flagged in self.classify_postings(postings).items():
+                stats[name] += flagged
+        return stats
+
+
+class RuleEngine:
+    """명부 시트 전체에 핵심 검증 규칙을 적용하여 구조화된 발견 사항을 만드는 클래스"""
+
+    def __init__(self, valuation_date: pd.Timestamp = VALUATION_DATE):
+        """
+        Args:
+            valuation_date: 평가기준일 (기본값: 2022.12.31)
+        """
+        self.valuation_date = pd.Timestamp(valuation_date)
+
+    def run(self, dataframes: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
+        """
+        모든 명부 시트에 규칙 적용
+
+        Args:
+            dataframes: {시트명: DataFrame} 형태의 딕셔너리
+
+        Returns:
+            발견 사항 리스트
+            항목: {"rule_id", "severity", "sheet", "row", "employee_id", "message"}
+            (row는 엑셀 행 번호, 시트 순서와 행 순서대로 정렬)
+        """
+        return self.run_indexed(dataframes)[0]
+
+    def run_indexed(self, dataframes: Dict[str, pd.DataFrame]) -> Tuple[List[Dict[str, Any]], EmployeeIndex]:
+        """
+        run()과 같지만 검증에 사용한 사원번호 색인도 함께 반환
+
+        Returns:
+            (발견 사항 리스트, EmployeeIndex) 튜플
+        """
+        rosters = self.prepare(dataframes)
+        index = EmployeeIndex(rosters)
+
+        findings = []
+        for roster in rosters:
+            findings.extend(self.check_duplicates_in_roster(roster))
+            findings.extend(self.check_date_order(roster))
+            findings.extend(self.check_zero_severance(roster))
+        findings.extend(self.check_duplicates_across_rosters(rosters))
+        findings.extend(self.check_interim_in_retirees(rosters))
+
+        sheet_order = {sheet_name: i for i, sheet_name in enumerate(dataframes)}
+        findings.sort(key=lambda f: (sheet_order.get(f["sheet"], len(sheet_order)), f["row"]))
+        return findings, index
+
+    def prepare(self, dataframes: Dict[str, pd.DataFrame]) -> List[Roster]:
+        """사원번호 컬럼이 있는 시트만 Roster로 변환"""
+        rosters = []
+        for sheet_name, df in dataframes.items():
+            if find_column(df.columns, "employee_id") is None:
+                continue
+            try:
+                rosters.append(Roster(sheet_name, df))
+            except Exception as e:
+                print(f"      ⚠️  시트 '{sheet_name}' 규칙 검증 준비 실패: {str(e)}")
+        return rosters
+
+    def check_duplicates_in_roster(self, roster: Roster) -> List[Dict[str, Any]]:
+        """같은 명부 안에서 사원번호가 2번 이상 나타나는 행"""
+        keys = roster.keys[roster.ids.notna()]
+        duplicated = keys[keys.duplicated(keep=False)]
+        if duplicated.empty:
+            return []
+
+        # 사원번호별 나타난 횟수와 행 번호 목록 (행 순서대로)
+        rows = pd.Series([str(excel_row(label)) for label in duplicated.index], index=duplicated.index)
+        groups = rows.groupby(duplicated, sort=False)
+        counts = groups.size()
+        row_lists = groups.agg(", ".join)
+
+        findings = []
+        for index_label, key in duplicated.items():
+            findings.append(self._finding(
+                "DUP_IN_ROSTER", roster.sheet, index_label, key,
+                f"사원번호 {key}이(가) '{roster.sheet}' 시트에 {counts[key]}번 나타납니다 "
+                f"(행 {row_lists[key]})."
+            ))
+        return findings
+
+    def check_duplicates_across_rosters(self, rosters: List[Roster]) -> List[Dict[str, Any]]:
+        """재직자 명부와 퇴직자 명부에 동시에 존재하는 사원번호"""
+        codes = _key_codes(rosters)
+
+        findings = []
+        for roster in rosters:
+            if roster.role not in (ROSTER_ACTIVE, ROSTER_RETIREE):
+                continue
+            other_role = ROSTER_RETIREE if roster.role == ROSTER_ACTIVE else ROSTER_ACTIVE
+            present = codes[roster.sheet] >= 0
+            # 상대 명부가 여러 개면 명부마다 하나씩 보고 (시트 순서대로)
+            for other in rosters:
+                if other.role != other_role:
+                    continue
+                shared = present & np.isin(codes[roster.sheet], codes[other.sheet])
+                for index_label, key in roster.keys[shared].items():
+                    findings.append(self._finding(
+                        "DUP_ACROSS_ROSTERS", roster.sheet, index_label, key,
+                        f"사원번호 {key}이(가) '{roster.sheet}' 시트와 "
+                        f"'{other.sheet}' 시트에 동시에 존재합니다."
+                    ))
+        return findings
+
+    def check_interim_in_retirees(self, rosters: List[Roster]) -> List[Dict[str, Any]]:
+        """
+        중간정산 이력이 있는 사원이 퇴직자 명부에 있는 행
+
+        퇴직자 명부 행 자체에 중간정산 이력이 있거나, 같은 사원번호가 다른 명부에서
+        중간정산 이력과 함께 나타나는 행입니다 (EmployeeIndex.interim_retiree_postings()와 같은 기준).
+        """
+        codes = _key_codes(rosters)
+        interim_elsewhere = np.concatenate(
+            [codes[roster.sheet][roster.has_interim.to_numpy()] for roster in rosters
+             if roster.role != ROSTER_RETIREE] + [np.array([], dtype=np.intp)]
+        )
+
+        findings = []
+        for roster in rosters:
+            if roster.role != ROSTER_RETIREE:
+                continue
+            sheet_codes = codes[roster.sheet]
+            flagged = roster.has_interim.to_numpy() | ((sheet_codes >= 0) & np.isin(sheet_codes, interim_elsewhere))
+            for index_label, key in roster.keys[flagged].items():
+                findings.append(self._finding(
+                    "INTERIM_IN_RETIREES", roster.sheet, index_label, key,
+                    f"사원번호 {key}은(는) 중간정산 이력이 있는데 퇴직자 명부 "
+                    f"'{roster.sheet}'에 들어 있습니다. 중간정산자는 재직자 명부에 있어야 합니다."
+                ))
+        return findings
+
+    def check_date_order(self, roster: Roster) -> List[Dict[str, Any]]:
+        """생년월일 < 입사일 < 중간정산일 < 퇴직일 순서와 평가기준일 이후 날짜 확인"""
+        roles = [role for role, _, _ in DATE_ROLES if role in roster.dates]
+        present = roster.ids.notna()
+
+        # 행마다 처음 어긋난 날짜 쌍 하나만 보고
+        violation = pd.Series("", index=roster.ids.index, dtype=object)
+        for i, earlier in enumerate(roles):
+            for later in roles[i + 1:]:
+                a = roster.dates[earlier]
+                b = roster.dates[later]
+                bad = present & a.notna() & b.notna() & (a >= b) & (violation == "")
+                violation[bad] = f"{earlier}>{later}"
+
+        findings = []
+        for index_label, pair in violation[violation != ""].items():
+            earlier, later = pair.split(">")
+            a = roster.dates[earlier][index_label]
+            b = roster.dates[later][index_label]
+            findings.append(self._finding(
+                "DATE_ORDER", roster.sheet, index_label, roster.ids[index_label],
+                f"사원번호 {roster.ids[index_label]}의 {roster.date_labels[earlier]}"
+                f"({_format_date(a)})이(가) {roster.date_labels[later]}({_format_date(b)})보다 "
+                f"늦거나 같습니다."
+            ))
+
+        for role in roles:
+            dates = roster.dates[role]
+            after = present & (dates > self.valuation_date)
+            for index_label, value in dates[after].items():
+                findings.append(self._finding(
+                    "DATE_AFTER_VALUATION", roster.sheet, index_label, roster.ids[index_label],
+                    f"사원번호 {roster.ids[index_label]}의 {roster.date_labels[role]}"
+                    f"({_format_date(value)})이(가) 평가기준일({_format_date(self.valuation_date)}) "
+                    f"이후입니다."
+                ))
+        return findings
+
+    def check_zero_severance(self, roster: Roster) -> List[Dict[str, Any]]:
+        """근속기간 1년 이상인데 퇴직금(추계액)이 0원인 행"""
+        if roster.severance is None or "hire" not in roster.dates:
+            return []
+
+        hire = roster.dates["hire"]
+        end = pd.Series(self.valuation_date, index=hire.index)
+        if "retire" in roster.dates:
+            end = roster.dates["retire"].fillna(self.valuation_date)
+
+        one_year = hire.notna() & (end >= hire + pd.DateOffset(years=1))
+        zero = roster.severance.notna() & (roster.severance == 0)
+        flagged = roster.ids.notna() & one_year & zero
+
+        findings = []
+        for index_label, employee_id in roster.ids[flagged].items():
+            findings.append(self._finding(
+                "ZERO_SEVERANCE", roster.sheet, index_label, employee_id,
+                f"사원번호 {employee_id}은(는) 입사일({_format_date(hire[index_label])}) 기준 "
+                f"근속기간이 1년 이상인데 퇴직금이 0원입니다."
+            ))
+        return findings
+
+    def _finding(self, rule_id: str, sheet: str, index_label, employee_id, message: str) -> Dict[str, Any]:
+        """발견 사항 딕셔너리 생성"""
+        return {
+            "rule_id": rule_id,
+            "severity": RULES[rule_id],
+            "sheet": sheet,
+            "row": excel_row(index_label),
+            "employee_id": str(employee_id),
+            "message": message,
+        }
@@ -0,0 +1,228 @@
+"""
+LLM 요청 스케줄러
+우선순위 대기열에 쌓인 요청을 RPM/TPM 예산 안에서 동시에 처리하고, 일시적 오류는 지터를 섞은
+지수 백오프(또는 Retry-After)로 대기열에 다시 넣어 재시도 (속도 제한이면 그동안 모든 요청을 멈춤)
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .ratelimit import RateLimiter, is_rate_limit_error, is_retryable_error, retry_after_seconds
+
+
+# 재시도 요청이 새 요청보다 먼저 처리되도록 하는 우선순위 등급
+PRIORITY_RETRY = 0
+PRIORITY_NEW = 1
+
+
+class RetryPolicy:
+    """재시도 여부와 대기 시간을 정하는 클래스"""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            max_retries: 최대 재시도 횟수
+            base_delay: 첫 재시도 대기 시간의 기준(초, 시도마다 2배)
+            max_delay: 대기 시간 상한(초)
+            seed: 지터 무작위 값 시드
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random = random.Random(seed)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """attempt번째 시도(0부터)가 error로 실패했을 때 다시 시도할지 여부"""
+        return attempt < self.max_retries and is_retryable_error(error)
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        """
+        재시도 전 대기 시간(초)
+
+        오류에 Retry-After가 있으면 그 값을 따르고, 없으면 base_delay × 2^attempt를 상한으로
+        절반은 고정, 절반은 무작위로 기다립니다 (동시에 실패한 요청이 한꺼번에 다시 몰리지 않도록).
+        """
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return cap / 2 + self._random.uniform(0, cap / 2)
+
+
+class ScheduledRequest:
+    """스케줄러에 제출된 요청 하나의 상태와 결과"""
+
+    def __init__(self, prompt: str, tokens: int, sequence: int, options: Dict[str, Any]):
+        self.prompt = prompt
+        self.tokens = tokens
+        self.sequence = sequence
+        self.options = options
+        self.retries = 0
+        self.response: Any = None
+        self.ttft: Optional[float] = None
+        self.error: Optional[Exception] = None
+        self.started = time.perf_counter()
+        self.latency = 0.0
+        self.done = asyncio.Event()
+
+    def priority(self) -> tuple:
+        """대기열 정렬 키: 재시도 요청 → 토큰 수가 적은 요청 → 먼저 제출된 요청"""
+        grade = PRIORITY_RETRY if self.retries else PRIORITY_NEW
+        return grade, self.tokens, self.sequence
+
+
+class RequestScheduler:
+    """
+    LLM 요청을 우선순위 대기열로 모아 제한된 수의 워커가 처리하는 비동기 스케줄러
+
+    큰 시트의 조각이 한꺼번에 제출되어도 작은 시트의 요청과 재시도 요청이 뒤로 밀리지 않도록
+    (재시도 여부, 예상 토큰 수, 제출 순서) 순으로 꺼냅니다. 재시도 대기 중에는 워커를 점유하지 않습니다.
+
+    속도 제한(429)은 요청 하나가 아니라 API 키 전체에 걸리므로, 429를 받으면 Retry-After(또는 백오프)
+    동안 모든 워커가 새 요청을 보내지 않고, 실패한 요청은 바로 대기열에 넣어 재개 후 가장 먼저 보냅니다.
+
+    사용 예:
+        async with RequestScheduler(call, max_concurrency=4, limiter=limiter) as scheduler:
+            request = await scheduler.submit(prompt, tokens)
+    """
+
+    def __init__(
+        self,
+        call: Callable[[str], Awaitable[tuple]],
+        max_concurrency: int = 1,
+        limiter: Optional[RateLimiter] = None,
+        policy: Optional[RetryPolicy] = None,
+        on_retry: Optional[Callable[[ScheduledRequest, Exception, float], None]] = None
+    ):
+        """
+        Args:
+            call: 프롬프트(와 submit()에 넘긴 옵션)를 받아 (응답, 첫 토큰까지 시간)을 돌려주는 비동기 함수
+            max_concurrency: 동시에 진행할 요청 수 (워커 수)
+            limiter: RPM/TPM 예산 (None이면 제한 없음)
+            policy: 재시도 정책 (None이면 기본값)
+            on_retry: 재시도를 예약할 때 호출할 함수 (요청, 오류, 대기 시간)
+        """
+        self.call = call
+        self.max_concurrency = max(1, max_concurrency)
+        self.limiter = limiter or RateLimiter()
+        self.policy = policy or RetryPolicy()
+        self.on_retry = on_retry
+        self._sequence = itertools.count()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers = []
+        self._pending_retries = set()
+        self._resume_at = 0.0  # 속도 제한으로 멈춘 요청을 다시 보내기 시작할 시각 (이벤트 루프 시간)
+
+        # 처리 기록 (시험에서 확인용)
+        self.dispatched = []
+        self.rate_limited = 0
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self) -> None:
+        """워커 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)]
+
+    async def close(self) -> None:
+        """워커와 예약된 재시도 중지"""
+        for handle in self._pending_retries:
+            handle.cancel()
+        self._pending_retries.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def submit(self, prompt: str, tokens: int = 0, **options) -> ScheduledRequest:
+        """
+        요청을 대기열에 넣고 끝날 때까지 대기
+
+        Args:
+            prompt: 프롬프트 문자열
+            tokens: 예상 프롬프트 토큰 수 (예산 차감과 우선순위에 사용)
+            **options: call에 그대로 넘길 키워드 인자
+
+        Returns:
+            ScheduledRequest (성공하면 response, 실패하면 error가 채워짐, 예외는 발생시키지 않음)
+        """
+        self.start()
+        request = ScheduledRequest(prompt, tokens, next(self._sequence), options)
+        self._enqueue(request)
+        await request.done.wait()
+        return request
+
+    def _enqueue(self, request: ScheduledRequest) -> None:
+        self._queue.put_nowait((request.priority(), request))
+
+    def _schedule_retry(self, request: ScheduledRequest, delay: float) -> None:
+        """delay초 뒤에 요청을 대기열에 다시 넣음 (기다리는 동안 워커는 다른 요청 처리)"""
+        loop = asyncio.get_running_loop()
+
+        def requeue():
+            self._pending_retries.discard(handle)
+            self._enqueue(request)
+
+        handle = loop.call_later(delay, requeue)
+        self._pending_retries.add(handle)
+
+    def _pause(self, delay: float) -> None:
+        """delay초 동안 모든 워커가 새 요청을 보내지 않도록 멈춤"""
+        loop = asyncio.get_running_loop()
+        self._resume_at = max(self._resume_at, loop.time() + delay)
+
+    async def _wait_until_resumed(self) -> None:
+        """속도 제한으로 멈춘 동안 대기"""
+        loop = asyncio.get_running_loop()
+        while self._resume_at > loop.time():
+            await asyncio.sleep(self._resume_at - loop.time())
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wait_until_resumed()
+            _, request = await self._queue.get()
+            if self._resume_at > loop.time():
+                # 요청을 기다리는 동안 속도 제한으로 멈췄으면 돌려놓고, 재개 후 우선순위대로 다시 꺼냄
+                self._enqueue(request)
+                continue
+            await self.limiter.acquire(request.tokens)
+            self.dispatched.append(request.sequence)
+            try:
+                request.response, request.ttft = await self.call(request.prompt, **request.options)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.rate_limited += 1
+                if self.policy.should_retry(e, request.retries):
+                    delay = self.policy.delay(e, request.retries)
+                    if self.on_retry is not None:
+                        self.on_retry(request, e, delay)
+                    request.retries += 1
+                    if is_rate_limit_error(e):
+                        self._pause(delay)
+                        self._enqueue(request)
+                    else:
+                        self._schedule_retry(request, delay)
+                    continue
+                request.error = e
+            request.latency = time.perf_counter() - request.started
+            request.done.set()
@@ -0,0 +1,274 @@
+"""
+프롬프트용 시트 직렬화
+df.to_string() 대신 정보가 없는 토큰(인덱스, 공백 패딩, NaN, 빈/상수 컬럼)을 뺀 압축 텍스트로 변환
+"""
+
+from functools import reduce
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .tokens import count_tokens
+
+
+# 직렬화 전후 토큰 수를 잴 때 쓰는 최대 행 수 (이보다 큰 시트는 고르게 뽑은 행으로 추정)
+SAVINGS_SAMPLE_ROWS = 200
+
+
+def _clean_text(values: pd.Series, separator: str) -> pd.Series:
+    """셀 안의 줄바꿈과 구분자를 공백/대체 문자로 바꿔 한 행이 한 줄이 되도록 함"""
+    values = values.str.replace(r"\s*[\r\n]+\s*", " ", regex=True).str.strip()
+    if separator:
+        values = values.str.replace(separator, "/", regex=False)
+    return values
+
+
+def _format_value(value: Any) -> str:
+    """object 컬럼의 값 하나를 문자열로 변환 (날짜는 yyyymmdd, 정수로 떨어지는 실수는 정수)"""
+    if value is None or value is pd.NaT:
+        return ""
+    if isinstance(value, float):
+        if np.isnan(value):
+            return ""
+        return str(int(value)) if value.is_integer() else format(value, ".15g")
+    if hasattr(value, "strftime") and hasattr(value, "year"):
+        try:
+            return value.strftime("%Y%m%d")
+        except ValueError:
+            return str(value)
+    return str(value)
+
+
+def format_column(series: pd.Series) -> pd.Series:
+    """
+    컬럼 값을 프롬프트용 문자열로 변환
+
+    - 날짜: yyyymmdd
+    - 정수로 떨어지는 실수: 소수점 없이 (9170000.0 → 9170000)
+    - 빈 값(NaN, None, NaT): 빈 문자열
+
+    Args:
+        series: DataFrame 컬럼
+
+    Returns:
+        문자열 Series
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y%m%d").fillna("").astype(object)
+
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype(object).map(_format_value)
+
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.astype("float64").to_numpy()
+        missing = np.isnan(values)
+        integral = ~missing & (np.floor(values) == values) & (np.abs(values) < 2 ** 53)
+        text = np.full(len(values), "", dtype=object)
+        if integral.any():
+            text[integral] = values[integral].astype(np.int64).astype(str)
+        rest = ~missing & ~integral
+        if rest.any():
+            text[rest] = [format(v, ".15g") for v in values[rest]]
+        return pd.Series(text, index=series.index, dtype=object)
+
+    return series.map(_format_value).astype(object)
+
+
+def compact_columns(df: pd.DataFrame, separator: str = "") -> Tuple[Dict[str, pd.Series], Dict[str, str], List[str]]:
+    """
+    DataFrame을 문자열 컬럼으로 바꾸고 정보가 없는 컬럼 분리
+
+    Args:
+        df: 시트 DataFrame
+        separator: 셀 값에서 바꿔 둘 구분자
+
+    Returns:
+        ({헤더: 문자열 Series}, {헤더: 모든 행 공통 값}, [비어 있는 헤더]) 튜플
+        (헤더의 줄바꿈은 공백으로 변환)
+    """
+    columns: Dict[str, pd.Series] = {}
+    constants: Dict[str, str] = {}
+    empty: List[str] = []
+
+    for i in range(df.shape[1]):
+        header = _clean_text(pd.Series([str(df.columns[i])]), separator).iloc[0]
+        values = _clean_text(format_column(df.iloc[:, i]).astype(str), separator)
+
+        filled = values[values != ""]
+        if filled.empty:
+            empty.append(header)
+        elif len(df) > 1 and len(filled) == len(values) and (values == values.iloc[0]).all():
+            constants[header] = values.iloc[0]
+        else:
+            columns[header] = values
+
+    return columns, constants, empty
+
+
+def _dropped_notes(constants: Dict[str, str], empty: List[str]) -> List[str]:
+    notes = []
+    if constants:
+        notes.append("모든 행 공통 값: " + ", ".join(f"{k}={v}" for k, v in constants.items()))
+    if empty:
+        notes.append(f"비어 있는 컬럼 {len(empty)}개 생략")
+    return notes
+
+
+class TextSerializer:
+    """기존 방식: df.to_string() (인덱스와 공백 패딩 포함)"""
+
+    name = "text"
+
+    def serialize_lines(self, df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+        """
+        Returns:
+            (헤더 줄 리스트, 행별 줄 리스트) 튜플
+        """
+        lines = df.to_string().split("\n")
+        header_count = len(lines) - len(df)
+        if len(df) == 0 or header_count < 1:
+            return lines, []
+        return lines[:header_count], lines[header_count:]
+
+
+class DelimitedSerializer:
+    """구분자로 나눈 표 형식 (인덱스, 빈 컬럼, 상수 컬럼 제외)"""
+
+    name = "delimited"
+
+    def __init__(self, separator: str = "|"):
+        """
+        Args:
+            separator: 컬럼 구분자
+        """
+        self.separator = separator
+
+    def serialize_lines(self, df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+        columns, constants, empty = compact_columns(df, self.separator)
+
+        header = _dropped_notes(constants, empty)
+        if not columns:
+            return header, []
+
+        header.append(self.separator.join(columns))
+        rows = reduce(lambda left, right: left + self.separator + right, columns.values())
+        return header, rows.tolist()
+
+
+class KeyedSerializer:
+    """
+    키 압축 형식: 컬럼을 짧은 키(A, B, ...)로 바꾸고 행마다 값이 있는 셀만 "키=값"으로 나열
+
+    빈 셀이 많은 넓은 명부에서 구분자 형식보다 짧아집니다.
+    """
+
+    name = "keyed"
+
+    def __init__(self, separator: str = ";"):
+        """
+        Args:
+            separator: 셀 구분자
+        """
+        self.separator = separator
+
+    def serialize_lines(self, df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+        columns, constants, empty = compact_columns(df, self.separator)
+
+        header = _dropped_notes(constants, empty)
+        if not columns:
+            return header, []
+
+        keys = [self._key(i) for i in range(len(columns))]
+        header.append("컬럼 키: " + ", ".join(f"{key}={name}" for key, name in zip(keys, columns)))
+
+        pieces = [
+            pd.Series(np.where(values != "", self.separator + key + "=" + values, ""), index=values.index)
+            for key, values in zip(keys, columns.values())
+        ]
+        rows = reduce(lambda left, right: left + right, pieces).str[len(self.separator):]
+        return header, rows.tolist()
+
+    @staticmethod
+    def _key(index: int) -> str:
+        """0 → A, 25 → Z, 26 → AA (엑셀 열 이름과 같은 방식)"""
+        key = ""
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            key = chr(65 + remainder) + key
+        return key
+
+
+SERIALIZERS = {
+    TextSerializer.name: TextSerializer,
+    DelimitedSerializer.name: DelimitedSerializer,
+    KeyedSerializer.name: KeyedSerializer,
+}
+
+
+def get_serializer(serializer) -> Any:
+    """
+    이름 또는 serialize_lines(df)를 가진 객체로 직렬화 도구 얻기
+
+    Args:
+        serializer: "text", "delimited", "keyed" 또는 직렬화 객체
+
+    Returns:
+        직렬화 객체
+    """
+    if isinstance(serializer, str):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"지원하지 않는 직렬화 형식입니다: {serializer} "
+                             f"(사용 가능: {', '.join(SERIALIZERS)})")
+        return SERIALIZERS[serializer]()
+    return serializer
+
+
+def _sample_positions(length: int, sample_rows: int) -> np.ndarray:
+    """0~length-1에서 고르게 뽑은 sample_rows개 행 위치"""
+    return np.unique(np.linspace(0, length - 1, sample_rows).astype(int))
+
+
+def estimate_frame_tokens(df: pd.DataFrame, model_name: str,
+                          sample_rows: int = SAVINGS_SAMPLE_ROWS) -> int:
+    """
+    df.to_string()의 토큰 수 (행이 sample_rows보다 많으면 고르게 뽑은 행으로 추정)
+
+    시트 전체를 문자열로 만들지 않으므로 행 수와 관계없이 거의 일정한 시간이 걸립니다.
+
+    Returns:
+        토큰 수 (추정값일 수 있음)
+    """
+    if len(df) <= sample_rows:
+        return count_tokens(df.to_string(), model_name)
+    lines = df.iloc[_sample_positions(len(df), sample_rows)].to_string().split("\n")
+    body_start = len(lines) - min(len(lines) - 1, sample_rows)
+    body = lines[body_start:]
+    header_tokens = count_tokens("\n".join(lines[:body_start]), model_name)
+    body_tokens = count_tokens("\n".join(body), model_name)
+    return header_tokens + round(body_tokens * len(df) / len(body))
+
+
+def measure_savings(df: pd.DataFrame, header: List[str], rows: List[str],
+                    model_name: str, sample_rows: int = SAVINGS_SAMPLE_ROWS) -> Tuple[int, int]:
+    """
+    기존 df.to_string() 대비 직렬화 결과의 토큰 수 비교
+
+    행이 sample_rows보다 많으면 고르게 뽑은 행으로 두 값을 모두 추정합니다
+    (검증할 때마다 시트 전체를 to_string()으로 다시 만들지 않음).
+
+    Returns:
+        (기존 토큰 수, 직렬화 후 토큰 수) 튜플
+    """
+    before = estimate_frame_tokens(df, model_name, sample_rows)
+    if len(rows) <= sample_rows or len(rows) != len(df):
+        after = count_tokens("\n".join(header + rows), model_name)
+    else:
+        sampled = [rows[i] for i in _sample_positions(len(rows), sample_rows)]
+        after = (count_tokens("\n".join(header), model_name)
+                 + round(count_tokens("\n".join(sampled), model_name) * len(rows) / len(sampled)))
+    return before, after
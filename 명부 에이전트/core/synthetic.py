@@ -0,0 +1,231 @@
+"""
+합성 명부 워크북 생성
+실제 명부와 같은 시트/컬럼 구성의 워크북을 원하는 직원 수로 만들고, 위치를 아는 오류를 심어 둠
+(벤치마크에서 규칙 검증의 재현율/정밀도 측정용)
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+import numpy as np
+from openpyxl import Workbook
+
+from .rules import VALUATION_DATE, excel_row
+
+
+ACTIVE_SHEET = "(2-2) 재직자 명부"
+RETIREE_SHEET = "(2-3) 퇴직자 및 DC전환자 명부"
+EXTRA_SHEET = "(2-4) 추가 명부"
+
+# 실제 명부 양식과 같은 컬럼 (줄바꿈 포함)
+ACTIVE_COLUMNS = [
+    "참고사항", "사원번호", "생년월일", "성별\n(1:남자, 2:여자)", "입사일자", "기준급여",
+    "당년도\n퇴직금추계액", "차년도\n퇴직금추계액", "종업원 구분\n(1:직원, 3:임원, \n4:계약직)",
+    "중간정산기준일", "중간정산액", "제도구분\n(1,2,3)", "적용배수",
+]
+RETIREE_COLUMNS = [
+    "참고사항", "사원번호", "생년월일", "성별\n(1:남자, 2:여자)", "입사일자", "퇴직일\n또는 DC전환일",
+    "퇴직금\n또는 DC전환금", "종업원 구분\n(1:직원, 3:임원, \n4:계약직)", "사유\n(1: 퇴직, 2: DC전환)",
+    "제도구분\n(1,2,3)",
+]
+EXTRA_COLUMNS = [
+    "참고사항", "사원번호", "생년월일", "성별\n(1:남자, 2:여자)", "입사일자", "기준급여",
+    "사유발생일 시점\n발생금액", "종업원 구분\n(1:직원, 3:임원, \n4:계약직)", "중간정산기준일",
+    "사유\n(1:관계사전입, 2:관계사전출, \n3:사업결합, 4:사업처분\n5:기타장기종업원)", "사유발생일",
+]
+
+# 심는 오류 종류 (규칙 ID)
+PLANTED_RULES = [
+    "DUP_IN_ROSTER",
+    "DUP_ACROSS_ROSTERS",
+    "INTERIM_IN_RETIREES",
+    "DATE_ORDER",
+    "DATE_AFTER_VALUATION",
+    "ZERO_SEVERANCE",
+]
+
+_DAY = np.timedelta64(1, "D")
+
+
+def _random_dates(rng: np.random.Generator, start: str, end: str, size: int) -> np.ndarray:
+    """[start, end] 구간의 무작위 날짜 (datetime64[D])"""
+    start, end = np.datetime64(start, "D"), np.datetime64(end, "D")
+    return start + rng.integers(0, int((end - start) / _DAY) + 1, size) * _DAY
+
+
+def _birth_and_hire(rng: np.random.Generator, size: int, last_hire: str):
+    """생년월일과 그보다 20~35년 뒤의 입사일 (입사일은 last_hire 이전으로 제한)"""
+    birth = _random_dates(rng, "1960-01-01", "1995-12-31", size)
+    hire = birth + rng.integers(20 * 365, 35 * 365, size) * _DAY
+    latest = np.datetime64(last_hire, "D")
+    hire = np.where(hire > latest, latest - rng.integers(0, 365, size) * _DAY, hire)
+    return birth, hire
+
+
+def _cell(value):
+    """numpy 값을 엑셀 셀 값으로 변환 (NaT/NaN은 빈 셀)"""
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else value.astype("datetime64[s]").astype(datetime)
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def _write_sheet(wb: Workbook, title: str, columns: List[str], data: Dict[str, np.ndarray]) -> None:
+    ws = wb.create_sheet(title)
+    ws.append(columns)
+    values = [data.get(column) for column in columns]
+    rows = len(data["사원번호"])
+    for i in range(rows):
+        ws.append([None if column is None else _cell(column[i]) for column in values])
+
+
+def generate_roster_workbook(
+    output_path: Path,
+    employees: int,
+    anomaly_rate: float = 0.01,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    재직자/퇴직자/추가 명부로 된 합성 워크북을 만들고 오류를 심음
+
+    오류는 종류별로 max(1, 재직자 수 × anomaly_rate)건씩 서로 다른 행에 심습니다.
+    오류를 심지 않은 행은 규칙 검증에 걸리지 않도록 만듭니다.
+
+    Args:
+        output_path: 저장할 .xlsx 파일 경로
+        employees: 재직자 수 (퇴직자는 1/5, 추가 명부는 1/50)
+        anomaly_rate: 종류별로 오류를 심을 재직자 비율
+        seed: 무작위 값 시드 (같은 시드면 같은 워크북)
+
+    Returns:
+        심은 오류 리스트
+        항목: {"rule_id", "sheet", "row", "employee_id"} (row는 엑셀 행 번호)
+        (규칙 엔진이 같은 오류를 두 시트/두 행에 보고하는 경우 각각 하나의 항목)
+    """
+    rng = np.random.default_rng(seed)
+    per_rule = max(1, int(round(employees * anomaly_rate)))
+    if employees < 6 * per_rule:
+        raise ValueError(f"오류를 심기에 재직자 수가 너무 적습니다: {employees}명 (최소 {6 * per_rule}명)")
+
+    retirees = max(2 * per_rule, employees // 5)
+    extras = max(per_rule + 3, employees // 50)
+    valuation = np.datetime64(VALUATION_DATE.date(), "D")
+
+    # 재직자 명부
+    birth, hire = _birth_and_hire(rng, employees, "2022-06-30")
+    salary = rng.integers(250, 900, employees) * 10000.0
+    tenure_years = (valuation - hire) / _DAY / 365
+    severance = np.round(salary * np.maximum(tenure_years, 0.1), -3)
+    interim = np.full(employees, np.datetime64("NaT"), dtype="datetime64[D]")
+    interim_amount = np.full(employees, np.nan)
+    has_interim = (rng.random(employees) < 0.1) & (hire < np.datetime64("2019-01-01"))
+    gap = ((np.datetime64("2021-12-31") - hire[has_interim]) / _DAY).astype(int)
+    interim[has_interim] = hire[has_interim] + (365 + rng.integers(0, np.maximum(gap - 365, 1))) * _DAY
+    interim_amount[has_interim] = np.round(salary[has_interim] * 3, -3)
+    active = {
+        "사원번호": np.arange(100001, 100001 + employees),
+        "생년월일": birth,
+        "성별\n(1:남자, 2:여자)": rng.integers(1, 3, employees),
+        "입사일자": hire,
+        "기준급여": salary,
+        "당년도\n퇴직금추계액": severance,
+        "차년도\n퇴직금추계액": np.round(severance + salary, -3),
+        "종업원 구분\n(1:직원, 3:임원, \n4:계약직)": rng.choice([1, 1, 1, 3, 4], employees),
+        "중간정산기준일": interim,
+        "중간정산액": interim_amount,
+        "제도구분\n(1,2,3)": rng.integers(1, 4, employees),
+        "적용배수": np.ones(employees),
+    }
+
+    # 퇴직자 명부
+    retiree_birth, retiree_hire = _birth_and_hire(rng, retirees, "2020-12-31")
+    retire = _random_dates(rng, "2022-01-01", "2022-12-30", retirees)
+    retiree = {
+        "사원번호": np.arange(900001, 900001 + retirees),
+        "생년월일": retiree_birth,
+        "성별\n(1:남자, 2:여자)": rng.integers(1, 3, retirees),
+        "입사일자": retiree_hire,
+        "퇴직일\n또는 DC전환일": retire,
+        "퇴직금\n또는 DC전환금": rng.integers(500, 9000, retirees) * 10000.0,
+        "종업원 구분\n(1:직원, 3:임원, \n4:계약직)": np.ones(retirees, dtype=int),
+        "사유\n(1: 퇴직, 2: DC전환)": rng.integers(1, 3, retirees),
+        "제도구분\n(1,2,3)": rng.integers(1, 4, retirees),
+    }
+
+    # 추가 명부 (중간정산 이력은 오류를 심는 행에만)
+    extra_birth, extra_hire = _birth_and_hire(rng, extras, "2020-12-31")
+    extra = {
+        "사원번호": np.arange(500001, 500001 + extras),
+        "생년월일": extra_birth,
+        "성별\n(1:남자, 2:여자)": rng.integers(1, 3, extras),
+        "입사일자": extra_hire,
+        "기준급여": rng.integers(250, 900, extras) * 10000.0,
+        "사유발생일 시점\n발생금액": rng.integers(100, 5000, extras) * 10000.0,
+        "종업원 구분\n(1:직원, 3:임원, \n4:계약직)": np.ones(extras, dtype=int),
+        "중간정산기준일": np.full(extras, np.datetime64("NaT"), dtype="datetime64[D]"),
+        "사유\n(1:관계사전입, 2:관계사전출, \n3:사업결합, 4:사업처분\n5:기타장기종업원)": rng.integers(1, 6, extras),
+        "사유발생일": _random_dates(rng, "2022-01-01", "2022-12-30", extras),
+    }
+
+    planted: List[Dict[str, Any]] = []
+
+    def plant(rule_id: str, sheet: str, position: int, employee_id) -> None:
+        planted.append({"rule_id": rule_id, "sheet": sheet,
+                        "row": excel_row(position), "employee_id": str(int(employee_id))})
+
+    # 오류를 심을 행을 겹치지 않게 고름 (중간정산 이력은 지워 다른 규칙에 걸리지 않게 함)
+    active_rows = iter(rng.permutation(employees)[:6 * per_rule].tolist())
+    retiree_rows = iter(rng.permutation(retirees)[:2 * per_rule].tolist())
+    extra_rows = iter(rng.permutation(extras)[:per_rule].tolist())
+
+    def take_active() -> int:
+        position = next(active_rows)
+        active["중간정산기준일"][position] = np.datetime64("NaT")
+        active["중간정산액"][position] = np.nan
+        return position
+
+    ids = active["사원번호"]
+    for _ in range(per_rule):
+        original, copy = take_active(), take_active()
+        ids[copy] = ids[original]
+        plant("DUP_IN_ROSTER", ACTIVE_SHEET, original, ids[original])
+        plant("DUP_IN_ROSTER", ACTIVE_SHEET, copy, ids[copy])
+
+        position, retiree_position = take_active(), next(retiree_rows)
+        retiree["사원번호"][retiree_position] = ids[position]
+        plant("DUP_ACROSS_ROSTERS", ACTIVE_SHEET, position, ids[position])
+        plant("DUP_ACROSS_ROSTERS", RETIREE_SHEET, retiree_position, ids[position])
+
+        retiree_position, extra_position = next(retiree_rows), next(extra_rows)
+        employee_id = retiree["사원번호"][retiree_position]
+        extra["사원번호"][extra_position] = employee_id
+        extra["중간정산기준일"][extra_position] = extra["입사일자"][extra_position] + 400 * _DAY
+        plant("INTERIM_IN_RETIREES", RETIREE_SHEET, retiree_position, employee_id)
+
+        position = take_active()
+        active["생년월일"][position] = active["입사일자"][position] + 30 * _DAY
+        plant("DATE_ORDER", ACTIVE_SHEET, position, ids[position])
+
+        position = take_active()
+        active["입사일자"][position] = valuation + 60 * _DAY
+        plant("DATE_AFTER_VALUATION", ACTIVE_SHEET, position, ids[position])
+
+        position = take_active()
+        active["입사일자"][position] = min(active["입사일자"][position], valuation - 800 * _DAY)
+        active["당년도\n퇴직금추계액"][position] = 0.0
+        plant("ZERO_SEVERANCE", ACTIVE_SHEET, position, ids[position])
+
+    wb = Workbook(write_only=True)
+    _write_sheet(wb, ACTIVE_SHEET, ACTIVE_COLUMNS, active)
+    _write_sheet(wb, RETIREE_SHEET, RETIREE_COLUMNS, retiree)
+    _write_sheet(wb, EXTRA_SHEET, EXTRA_COLUMNS, extra)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(output_path)
+
+    return planted
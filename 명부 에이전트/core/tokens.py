@@ -0,0 +1,62 @@
+"""
+프롬프트 토큰 수 계산
+tiktoken이 설치되어 있으면 모델 토크나이저로 정확히 세고, 없으면 문자 수로 추정
+"""
+
+from functools import lru_cache
+
+# tiktoken은 선택 의존성 (없으면 추정값 사용)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model_name: str):
+    """
+    모델 이름에 맞는 tiktoken 인코딩 (모르는 모델은 o200k_base)
+
+    인코딩 파일을 내려받을 수 없는 환경(오프라인 등)에서는 None을 반환합니다.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print(f"      ⚠️  토크나이저를 불러올 수 없어 토큰 수를 추정합니다: {str(e)[:80]}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수 추정
+
+    영문/숫자/기호는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰으로 계산합니다.
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_chars = len(text) - non_ascii
+    return non_ascii + (ascii_chars + 3) // 4
+
+
+def count_tokens(text: str, model_name: str = DEFAULT_MODEL) -> int:
+    """
+    텍스트의 토큰 수 계산
+
+    Args:
+        text: 프롬프트 등 텍스트
+        model_name: 토크나이저를 고를 모델 이름
+
+    Returns:
+        토큰 수 (tiktoken이 없으면 추정값)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model_name) if tiktoken is not None else None
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
@@ -0,0 +1,428 @@
+"""
+xlsx 파일을 직접 읽는 스트리밍 리더
+openpyxl 셀 객체를 만들지 않고 시트 XML을 컬럼별 배열로 바로 변환
+"""
+
+import posixpath
+import zipfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+from xml.etree.ElementTree import iterparse, fromstring
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH, MAC_EPOCH
+
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_C = f"{{{SHEET_MAIN_NS}}}c"
+_V = f"{{{SHEET_MAIN_NS}}}v"
+_T = f"{{{SHEET_MAIN_NS}}}t"
+_R = f"{{{SHEET_MAIN_NS}}}r"
+_IS = f"{{{SHEET_MAIN_NS}}}is"
+_SI = f"{{{SHEET_MAIN_NS}}}si"
+_ROW = f"{{{SHEET_MAIN_NS}}}row"
+_SHEET_DATA = f"{{{SHEET_MAIN_NS}}}sheetData"
+
+# 컬럼 버퍼의 셀 종류 코드
+_EMPTY = 0
+_NUMBER = 1
+_DATE = 2
+_OBJECT = 3
+
+# 1900 윤년 버그 보정이 필요 없는 최소 날짜 serial (1900-03-01)
+_MIN_PLAIN_DATE_SERIAL = 61
+
+
+def _rich_text(element) -> str:
+    """<si>/<is> 요소의 텍스트 (서식 run은 이어붙이고 윗주(rPh)는 제외)"""
+    snippets = []
+    for child in element:
+        if child.tag == _T:
+            snippets.append(child.text or "")
+        elif child.tag == _R:
+            snippets.append(child.findtext(_T) or "")
+    return "".join(snippets)
+
+
+def read_sheet_paths(archive: zipfile.ZipFile, workbook_root=None) -> Dict[str, str]:
+    """
+    workbook.xml과 관계 파일에서 시트명 → zip 내부 시트 XML 경로 매핑 읽기
+
+    Args:
+        archive: xlsx 파일의 ZipFile 객체
+        workbook_root: 이미 읽은 workbook.xml 루트 요소 (None이면 archive에서 읽음)
+
+    Returns:
+        {시트명: 시트 XML 경로} 딕셔너리 (워크북 순서)
+    """
+    rels_root = fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    for rel in rels_root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id")] = path
+
+    if workbook_root is None:
+        workbook_root = fromstring(archive.read("xl/workbook.xml"))
+
+    sheet_paths = {}
+    for sheet in workbook_root.iter(f"{{{SHEET_MAIN_NS}}}sheet"):
+        rel_id = sheet.get(f"{{{REL_NS}}}id")
+        if rel_id in targets:
+            sheet_paths[sheet.get("name")] = targets[rel_id]
+    return sheet_paths
+
+
+class _ColumnBuffer:
+    """
+    한 컬럼의 셀 값을 행 순서대로 모으는 버퍼
+
+    숫자와 날짜 serial은 float64 배열에, 그 외 값(문자열, 불리언 등)은
+    행 번호별 딕셔너리에 저장하고 셀 종류 코드를 함께 기록합니다.
+    """
+
+    __slots__ = ("numbers", "kinds", "objects")
+
+    def __init__(self):
+        self.numbers = array("d")
+        self.kinds = bytearray()
+        self.objects = {}
+
+    def put(self, index: int, kind: int, number: float = np.nan, obj: Any = None) -> None:
+        gap = index - len(self.kinds)
+        if gap > 0:
+            self.numbers.extend([np.nan] * gap)
+            self.kinds.extend(bytes(gap))
+        self.numbers.append(number)
+        self.kinds.append(kind)
+        if kind == _OBJECT:
+            self.objects[index] = obj
+
+    def pad(self, length: int) -> None:
+        gap = length - len(self.kinds)
+        if gap > 0:
+            self.numbers.extend([np.nan] * gap)
+            self.kinds.extend(bytes(gap))
+
+
+class XlsxReader:
+    """xlsx 파일의 시트를 DataFrame으로 읽는 클래스 (openpyxl 셀 객체를 사용하지 않음)"""
+
+    def __init__(self, file_path: Path):
+        """
+        Args:
+            file_path: xlsx 파일 경로
+        """
+        self.file_path = Path(file_path)
+        self.archive = zipfile.ZipFile(self.file_path)
+
+        self._sheet_paths = self._read_workbook()
+        self._shared_strings = self._read_shared_strings()
+        self._date_styles, self._timedelta_styles = self._read_styles()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """워크북의 시트명 리스트 (워크북 순서)"""
+        return list(self._sheet_paths)
+
+    def close(self) -> None:
+        """zip 파일 닫기"""
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        시트 하나를 DataFrame으로 읽기 (첫 행은 헤더)
+
+        pd.read_excel(engine='openpyxl')과 같은 결과가 나오도록
+        끝쪽의 빈 행/빈 열을 제거하고 컬럼별 타입을 결정합니다.
+
+        Args:
+            sheet_name: 읽을 시트명
+
+        Returns:
+            시트 데이터 DataFrame
+        """
+        if sheet_name not in self._sheet_paths:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+
+        header = {}
+        buffers: Dict[int, _ColumnBuffer] = {}
+        last_row = 0
+        width = 0
+
+        shared_strings = self._shared_strings
+        date_styles = self._date_styles
+        column_cache = {}
+        row_counter = 0
+        col_counter = 0
+        sheet_data = None
+
+        with self.archive.open(self._sheet_paths[sheet_name]) as src:
+            for event, element in iterparse(src, events=("start", "end")):
+                tag = element.tag
+
+                if event == "start":
+                    if tag == _ROW:
+                        r = element.get("r")
+                        row_counter = int(r) if r else row_counter + 1
+                        col_counter = 0
+                    elif tag == _SHEET_DATA:
+                        sheet_data = element
+                    continue
+
+                if tag != _C:
+                    if tag == _ROW and sheet_data is not None:
+                        # 처리가 끝난 행은 트리에서 제거하여 메모리 사용량 유지
+                        sheet_data.clear()
+                    continue
+
+                # 셀 위치
+                ref = element.get("r")
+                if ref:
+                    letters = ref.rstrip("0123456789")
+                    row = int(ref[len(letters):])
+                    column = column_cache.get(letters)
+                    if column is None:
+                        column = column_index_from_string(letters)
+                        column_cache[letters] = column
+                    col_counter = column
+                else:
+                    col_counter += 1
+                    row, column = row_counter, col_counter
+
+                # 셀 값과 종류
+                cell_type = element.get("t", "n")
+                kind = _EMPTY
+                number = np.nan
+                obj = None
+
+                if cell_type == "n":
+                    text = element.findtext(_V)
+                    if text:
+                        number = float(text)
+                        style = element.get("s")
+                        if style and int(style) in date_styles:
+                            if int(style) in self._timedelta_styles:
+                                kind = _OBJECT
+                                obj = self._convert_date(number, int(style))
+                            else:
+                                kind = _DATE
+                        else:
+                            kind = _NUMBER
+                elif cell_type == "s":
+                    text = element.findtext(_V)
+                    if text:
+                        kind = _OBJECT
+                        obj = shared_strings[int(text)]
+                elif cell_type == "inlineStr":
+                    inline = element.find(_IS)
+                    if inline is not None:
+                        kind = _OBJECT
+                        obj = _rich_text(inline)
+                elif cell_type == "str":
+                    text = element.findtext(_V)
+                    if text:
+                        kind = _OBJECT
+                        obj = text
+                elif cell_type == "b":
+                    text = element.findtext(_V)
+                    if text:
+                        kind = _OBJECT
+                        obj = bool(int(text))
+                elif cell_type == "e":
+                    if element.findtext(_V):
+                        # 오류 셀은 pd.read_excel과 같이 NaN (값이 있는 셀로 취급)
+                        kind = _NUMBER
+                elif cell_type == "d":
+                    text = element.findtext(_V)
+                    if text:
+                        kind = _OBJECT
+                        obj = from_ISO8601(text)
+
+                element.clear()
+
+                if kind == _EMPTY or (kind == _OBJECT and obj == ""):
+                    continue
+
+                if row > last_row:
+                    last_row = row
+                if column > width:
+                    width = column
+
+                if row == 1:
+                    header[column] = self._to_python(kind, number, obj)
+                    continue
+
+                buffer = buffers.get(column)
+                if buffer is None:
+                    buffer = buffers[column] = _ColumnBuffer()
+                buffer.put(row - 2, kind, number, obj)
+
+        if last_row == 0:
+            return pd.DataFrame()
+
+        names = self._column_names([header.get(c, "") for c in range(1, width + 1)])
+        n_rows = last_row - 1
+        if n_rows == 0:
+            return pd.DataFrame(columns=names)
+
+        return self._build_frame(names, buffers, width, n_rows)
+
+    def _build_frame(self, names: List[Any], buffers: Dict[int, _ColumnBuffer],
+                     width: int, n_rows: int) -> pd.DataFrame:
+        """컬럼 버퍼를 타입별로 변환하여 DataFrame 조립"""
+        arrays: Dict[int, Any] = {}
+        object_columns = []
+
+        for column in range(1, width + 1):
+            buffer = buffers.get(column) or _ColumnBuffer()
+            buffer.pad(n_rows)
+            kinds = np.frombuffer(bytes(buffer.kinds), dtype=np.uint8)
+            numbers = np.frombuffer(buffer.numbers, dtype=np.float64)
+
+            if not (kinds >= _DATE).any():
+                # 숫자 컬럼: 빈 값이 없고 모두 정수면 int64
+                if (kinds == _NUMBER).all() and np.isfinite(numbers).all() \
+                        and (numbers == np.floor(numbers)).all():
+                    arrays[column] = numbers.astype(np.int64)
+                else:
+                    arrays[column] = numbers.copy()
+                continue
+
+            date_mask = kinds == _DATE
+            if self.epoch == WINDOWS_EPOCH and not (kinds == _NUMBER).any() \
+                    and not (kinds == _OBJECT).any() \
+                    and (numbers[date_mask] >= _MIN_PLAIN_DATE_SERIAL).all():
+                arrays[column] = self._serials_to_datetime(numbers, date_mask)
+                continue
+
+            # 혼합 컬럼: 셀별 파이썬 값으로 변환 후 pandas 타입 추론에 맡김
+            values = [
+                self._to_python(kind, number, buffer.objects.get(i))
+                for i, (kind, number) in enumerate(zip(buffer.kinds, buffer.numbers))
+            ]
+            object_columns.append(column)
+            arrays[column] = values
+
+        if object_columns:
+            rows = [list(row) for row in zip(*(arrays[c] for c in object_columns))]
+            parsed = TextParser(rows, header=None, skip_blank_lines=False).read()
+            for i, column in enumerate(object_columns):
+                arrays[column] = parsed.iloc[:, i].array
+
+        df = pd.DataFrame({column - 1: arrays[column] for column in range(1, width + 1)}, copy=False)
+        df.columns = names
+        return df
+
+    def _serials_to_datetime(self, numbers: np.ndarray, date_mask: np.ndarray) -> np.ndarray:
+        """
+        날짜 serial 배열을 datetime64[us] 배열로 변환 (openpyxl from_excel과 같은 밀리초 반올림)
+        """
+        serials = np.where(date_mask, numbers, 0.0)
+        days = np.floor(serials)
+        millis = np.round((serials - days) * 86400 * 1000)
+        epoch = np.datetime64(self.epoch.replace(tzinfo=None), "us")
+        result = (epoch
+                  + days.astype(np.int64) * np.timedelta64(1, "D")
+                  + millis.astype(np.int64) * np.timedelta64(1, "ms"))
+        result[~date_mask] = np.datetime64("NaT")
+        return result.astype("datetime64[us]")
+
+    def _to_python(self, kind: int, number: float, obj: Any) -> Any:
+        """버퍼 값을 pd.read_excel(openpyxl 엔진)이 보는 셀 값으로 변환"""
+        if kind == _EMPTY:
+            return ""
+        if kind == _OBJECT:
+            return obj
+        if kind == _DATE:
+            return self._convert_date(number, None)
+        if number == number and number.is_integer():
+            return int(number)
+        return number
+
+    def _convert_date(self, number: float, style: Optional[int]) -> Any:
+        """날짜 서식 셀의 serial 값을 datetime/time/timedelta로 변환"""
+        timedelta = style is not None and style in self._timedelta_styles
+        try:
+            return from_excel(number, self.epoch, timedelta=timedelta)
+        except (OverflowError, ValueError):
+            return np.nan
+
+    def _column_names(self, header: List[Any]) -> List[Any]:
+        """헤더 행을 pd.read_excel과 같은 규칙으로 컬럼명 변환 (빈 헤더, 중복 헤더 처리)"""
+        try:
+            return list(TextParser([header], header=0).read().columns)
+        except EmptyDataError:
+            return [f"Unnamed: {i}" for i in range(len(header))]
+
+    def _read_workbook(self) -> Dict[str, str]:
+        """시트명 → 시트 XML 경로 매핑을 읽고 날짜 기준(1900/1904년) 확인"""
+        workbook_root = fromstring(self.archive.read("xl/workbook.xml"))
+        workbook_pr = workbook_root.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+        date1904 = workbook_pr is not None and workbook_pr.get("date1904") in ("1", "true")
+        self.epoch = MAC_EPOCH if date1904 else WINDOWS_EPOCH
+
+        return read_sheet_paths(self.archive, workbook_root)
+
+    def _read_shared_strings(self) -> List[str]:
+        """공유 문자열 테이블을 한 번만 읽어서 리스트로 반환"""
+        try:
+            src = self.archive.open("xl/sharedStrings.xml")
+        except KeyError:
+            return []
+
+        strings = []
+        with src:
+            for _, element in iterparse(src):
+                if element.tag == _SI:
+                    strings.append(_rich_text(element).replace("x005F_", ""))
+                    element.clear()
+        return strings
+
+    def _read_styles(self):
+        """
+        styles.xml에서 날짜 서식을 사용하는 셀 스타일 번호 집합 읽기
+
+        Returns:
+            (날짜 서식 스타일 번호 집합, 시간 간격 서식 스타일 번호 집합) 튜플
+        """
+        try:
+            root = fromstring(self.archive.read("xl/styles.xml"))
+        except KeyError:
+            return set(), set()
+
+        formats = dict(BUILTIN_FORMATS)
+        num_fmts = root.find(f"{{{SHEET_MAIN_NS}}}numFmts")
+        if num_fmts is not None:
+            for num_fmt in num_fmts:
+                formats[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode")
+
+        date_styles = set()
+        timedelta_styles = set()
+        cell_xfs = root.find(f"{{{SHEET_MAIN_NS}}}cellXfs")
+        if cell_xfs is not None:
+            for index, xf in enumerate(cell_xfs):
+                fmt = formats.get(int(xf.get("numFmtId", 0)))
+                if is_date_format(fmt):
+                    date_styles.add(index)
+                if is_timedelta_format(fmt):
+                    timedelta_styles.add(index)
+        return date_styles, timedelta_styles
@@ -5,6 +5,7 @@
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,8 +18,126 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 # core 모듈 import
 from core.loader import ExcelLoader
-from core.agent import AuditAgent
+from core.agent import AuditAgent, DEFAULT_CHUNK_TOKENS
 from core.reporter import ReportGenerator
+from core.pipeline import BatchPipeline
+from core.incremental import AuditStateStore
+
+
+def parse_args():
+    """
+    명령행 인자 파싱
+    
+    Returns:
+        파싱된 인자 (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description="확정급여채무평가 데이터 검증 AI Agent")
+    parser.add_argument("--batch", action="store_true",
+                        help="data/ 폴더의 모든 엑셀 파일을 일괄 검증")
+    parser.add_argument("--load-workers", type=int, default=2,
+                        help="일괄 검증 시 파일 로드 워커 프로세스 수 (기본값: 2)")
+    parser.add_argument("--audit-workers", type=int, default=1,
+                        help="일괄 검증 시 동시에 검증할 파일 수 (기본값: 1)")
+    parser.add_argument("--report-workers", type=int, default=1,
+                        help="일괄 검증 시 동시에 리포트를 생성할 파일 수 (기본값: 1)")
+    parser.add_argument("--queue-size", type=int, default=2,
+                        help="일괄 검증 단계 사이 대기열 크기 (기본값: 2)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="동시에 진행할 시트별 AI 검증 호출 수 (기본값: 1)")
+    parser.add_argument("--rpm", type=int, default=None,
+                        help="분당 최대 AI 요청 수 (기본값: 제한 없음)")
+    parser.add_argument("--tpm", type=int, default=None,
+                        help="분당 최대 프롬프트 토큰 수 (기본값: 제한 없음)")
+    parser.add_argument("--serializer", choices=["delimited", "keyed", "text"], default="delimited",
+                        help="시트 데이터를 AI에 보내는 형식 (기본값: delimited)")
+    parser.add_argument("--profile", action="store_true",
+                        help="행 데이터 대신 시트 통계 프로파일만 AI에 보냄 (대용량 명부용)")
+    parser.add_argument("--structured", action="store_true",
+                        help="AI 검증 결과를 JSON 발견 사항(규칙, 심각도, 사원번호, 행)으로 받아 표로 정리")
+    parser.add_argument("--narrative", choices=["template", "llm", "none"], default="template",
+                        help="--structured 사용 시 시트별 구어체 설명 방식 "
+                             "(template: 발견 사항으로 바로 작성, llm: AI가 작성, none: 건수만, 기본값: template)")
+    parser.add_argument("--chunk-tokens", type=int, default=DEFAULT_CHUNK_TOKENS,
+                        help="AI에 보내는 데이터 조각 하나의 최대 토큰 수, 넘으면 조각별로 검증한 뒤 의견을 합침 "
+                             f"(기본값: {DEFAULT_CHUNK_TOKENS})")
+    parser.add_argument("--no-rules", action="store_true",
+                        help="규칙 검증 없이 시트 전체 행을 AI가 직접 검증 (큰 시트는 조각으로 나눠 검증한 뒤 의견을 합침)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="지난 검증 이후 추가/삭제/수정된 행만 AI로 다시 검증하고 발견 사항을 신규/해결/유지로 표시 "
+                             "(--structured 포함, 규칙 검증은 명부 간 비교를 위해 매번 전체 행으로 수행하므로 "
+                             "AI 행 단위 증분 검증은 --no-rules 또는 --profile과 함께 사용)")
+    parser.add_argument("--state-name", default=None,
+                        help="--incremental 비교 기준 이름 (기본값: 엑셀 파일 이름, 수정본 파일 이름이 다를 때 원본 이름 지정)")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="AI 응답 캐시를 사용하지 않고 항상 새로 검증")
+    return parser.parse_args()
+
+
+def create_agent(args, api_key):
+    """
+    명령행 인자에 맞춰 AuditAgent 생성
+    
+    Args:
+        args: 명령행 인자
+        api_key: OpenAI API 키
+        
+    Returns:
+        AuditAgent 인스턴스
+    """
+    return AuditAgent(
+        api_key=api_key,
+        use_rules=not args.no_rules,
+        chunk_tokens=args.chunk_tokens,
+        max_concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        serializer=args.serializer,
+        profile_mode=args.profile,
+        structured=args.structured,
+        narrative=args.narrative,
+        incremental=args.incremental,
+        cache_path=None if args.no_llm_cache else PROJECT_ROOT / ".cache" / "llm_responses.sqlite3",
+        metrics_log=PROJECT_ROOT / "output" / "llm_metrics.jsonl"
+    )
+
+
+def run_batch(args, loader, excel_files, api_key, output_dir):
+    """
+    발견된 모든 엑셀 파일을 파이프라인으로 일괄 검증
+    
+    Args:
+        args: 명령행 인자
+        loader: ExcelLoader 인스턴스
+        excel_files: 검증할 엑셀 파일 경로 리스트
+        api_key: OpenAI API 키
+        output_dir: 리포트 저장 디렉토리
+    """
+    print(f"\n[2단계] {len(excel_files)}개 파일 일괄 검증 중...")
+    print(f"   로드 워커: {args.load_workers}, 검증 워커: {args.audit_workers}, "
+          f"리포트 워커: {args.report_workers}, 대기열 크기: {args.queue_size}")
+    
+    agent = create_agent(args, api_key)
+    reporter = ReportGenerator(output_dir)
+    pipeline = BatchPipeline(
+        loader,
+        agent,
+        reporter,
+        load_workers=args.load_workers,
+        audit_workers=args.audit_workers,
+        report_workers=args.report_workers,
+        queue_size=args.queue_size,
+        state_store=AuditStateStore(PROJECT_ROOT / ".cache" / "audit_state") if args.incremental else None
+    )
+    run_summary = pipeline.run(excel_files)
+    
+    print("\n[3단계] 일괄 검증 요약 생성 중...")
+    summary_path = reporter.generate_run_summary(run_summary)
+    
+    print("\n" + "=" * 60)
+    print(f"✅ 일괄 검증 완료: {run_summary['succeeded']}/{run_summary['total']}개 파일 "
+          f"({run_summary['elapsed']:.1f}초)")
+    print(f"   요약 파일: {summary_path}")
+    print("=" * 60)
 
 
 def main():
@@ -28,6 +147,8 @@ def main():
     - 데이터 로드 및 검증 수행
     - 결과를 output/ 폴더에 저장
     """
+    args = parse_args()
+    
     print("=" * 60)
     print("확정급여채무평가 데이터 검증 AI Agent 시작")
     print("=" * 60)
@@ -42,13 +163,14 @@ def main():
     # 폴더 구조 확인 및 생성
     data_dir = PROJECT_ROOT / "data"
     output_dir = PROJECT_ROOT / "output"
+    cache_dir = PROJECT_ROOT / ".cache"
     
     data_dir.mkdir(exist_ok=True)
     output_dir.mkdir(exist_ok=True)
     
     # 1. 엑셀 파일 탐색 및 로드
     print("\n[1단계] 엑셀 파일 탐색 중...")
-    loader = ExcelLoader(data_dir)
+    loader = ExcelLoader(data_dir, cache_dir=cache_dir)
     excel_files = loader.find_excel_files()
     
     if not excel_files:
@@ -60,7 +182,12 @@ def main():
     for file in excel_files:
         print(f"   - {file.name}")
     
-    # 첫 번째 엑셀 파일 사용 (또는 여러 파일 처리 로직 추가 가능)
+    # 일괄 검증 모드: 모든 파일을 파이프라인으로 처리
+    if args.batch:
+        run_batch(args, loader, excel_files, api_key, output_dir)
+        return
+    
+    # 첫 번째 엑셀 파일 사용 (여러 파일은 --batch 옵션으로 처리)
     target_file = excel_files[0]
     print(f"\n   분석 대상: {target_file.name}")
     
@@ -74,11 +201,18 @@ def main():
         print(f"   {str(e)}")
         return
     
+    # 증분 검증: 같은 이름으로 저장된 이전 검증 상태와 비교
+    state_store = AuditStateStore(cache_dir / "audit_state") if args.incremental else None
+    state_name = args.state_name or target_file.name
+    baseline = state_store.load(state_name) if state_store else None
+    if state_store:
+        print(f"   증분 검증 기준: {'이전 검증 상태 있음' if baseline else '없음 (전체 검증)'}")
+    
     # 2. AI 에이전트로 데이터 검증
     print("\n[3단계] AI 에이전트로 데이터 검증 수행 중...")
     try:
-        agent = AuditAgent(api_key=api_key)
-        audit_results = agent.audit_data(dataframes)
+        agent = create_agent(args, api_key)
+        audit_results = agent.audit_data(dataframes, baseline)
         print("   검증 완료")
     except Exception as e:
         print(f"❌ 오류: 데이터 검증 중 문제가 발생했습니다.")
@@ -94,6 +228,8 @@ def main():
             source_file=target_file.name
         )
         print(f"   리포트 생성 완료: {report_path}")
+        if state_store:
+            state_store.save(state_name, audit_results["audit_state"])
     except Exception as e:
         print(f"❌ 오류: 리포트 생성 중 문제가 발생했습니다.")
         print(f"   {str(e)}")
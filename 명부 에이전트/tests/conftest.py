@@ -0,0 +1,11 @@
+"""
+테스트에서 core 패키지를 import할 수 있도록 프로젝트 디렉토리를 경로에 추가
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
@@ -0,0 +1,51 @@
+"""
+AuditAgent 동시 검증(audit_data_async) 검증: 결과 순서와 동시 호출 수 제한
+"""
+
+import re
+
+import pandas as pd
+import pytest
+
+from core.agent import AuditAgent
+from core.fake_llm import FakeChatModel
+
+# 정렬 순서와 다른 입력 순서 (크기도 달라 응답이 끝나는 순서가 입력 순서와 다름)
+SHEET_NAMES = ["명부 7", "명부 2", "명부 9", "명부 0", "명부 5", "명부 3", "명부 8", "명부 1", "명부 6", "명부 4"]
+
+
+def _sheet_responder(prompt: str) -> str:
+    """프롬프트의 시트명을 그대로 담아 응답 (결과가 어느 시트 것인지 확인용)"""
+    sheet_name = re.search(r"시트명: '([^']+)'", prompt).group(1)
+    return f"{sheet_name} 검토 의견"
+
+
+def _sheets():
+    return {name: pd.DataFrame({"사원번호": range(5 + 7 * i), "값": range(5 + 7 * i)})
+            for i, name in enumerate(SHEET_NAMES)}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_async_audit_keeps_sheet_order_and_concurrency_limit(seed):
+    llm = FakeChatModel(latency=0.01, jitter=0.05, seed=seed, responder=_sheet_responder)
+    agent = AuditAgent("test", llm=llm, use_rules=False, max_concurrency=4)
+
+    results = agent.audit_data(_sheets())
+
+    assert [entry["sheet"] for entry in results["findings"]] == SHEET_NAMES
+    assert [entry["result"] for entry in results["findings"]] == [f"{name} 검토 의견" for name in SHEET_NAMES]
+    assert results["sheets_audited"] == SHEET_NAMES
+    assert llm.calls == len(SHEET_NAMES)
+    assert llm.max_active == 4
+
+
+def test_async_audit_with_chunked_sheets_respects_concurrency_limit():
+    llm = FakeChatModel(latency=0.01, jitter=0.05, seed=3, responder=_sheet_responder)
+    agent = AuditAgent("test", llm=llm, use_rules=False, max_concurrency=3, chunk_tokens=80)
+
+    results = agent.audit_data(_sheets())
+
+    assert llm.calls > len(SHEET_NAMES)
+    assert 1 < llm.max_active <= 3
+    assert [entry["sheet"] for entry in results["findings"]] == SHEET_NAMES
+    assert not [entry for entry in results["findings"] if entry.get("error")]
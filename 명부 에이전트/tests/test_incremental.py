@@ -0,0 +1,88 @@
+"""
+증분 검증에서 변경되지 않은 행의 AI 발견 사항이 실행 간 같은 행으로 이어지는지 검증
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from core.agent import AuditAgent
+from core.fake_llm import FakeChatModel
+from core.incremental import STATUS_UNCHANGED
+from core.rules import excel_row
+
+SHEET = "재직자 명부"
+FLAGGED_SALARY = -1
+
+
+def _roster(rows: int = 60) -> pd.DataFrame:
+    """기준급여가 음수인 행이 몇 개 섞인 명부"""
+    return pd.DataFrame({
+        "사원번호": [100001 + i for i in range(rows)],
+        "생년월일": [19700101 + (i % 28) for i in range(rows)],
+        "입사일자": [20100101 + (i % 28) for i in range(rows)],
+        "기준급여": [FLAGGED_SALARY if i % 17 == 5 else 3000000 + i * 1000 for i in range(rows)],
+    })
+
+
+def _echo_responder(prompt: str) -> str:
+    """
+    프롬프트 데이터에서 기준급여가 음수인 행을 찾아 그 행의 '엑셀 행' 값으로 발견 사항 응답
+
+    사원번호 없이 행 번호만 담아 실행 간 비교가 행 번호에 의존하게 합니다.
+    """
+    data = prompt.split("데이터:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    start = next(i for i, line in enumerate(data) if line.startswith("엑셀 행|"))
+    columns = data[start].split("|")
+    findings = []
+    for line in data[start + 1:]:
+        values = dict(zip(columns, line.split("|")))
+        if values.get("기준급여") == str(FLAGGED_SALARY):
+            findings.append({
+                "rule_id": "OTHER", "severity": "경미", "employee_id": None, "sheet": SHEET,
+                "row": int(values["엑셀 행"]), "message": "기준급여가 음수입니다."
+            })
+    return json.dumps({"findings": findings}, ensure_ascii=False)
+
+
+def _agent() -> AuditAgent:
+    # 시트 하나가 여러 조각으로 나뉘도록 조각 예산을 작게 잡음
+    return AuditAgent("test", llm=FakeChatModel(latency=0, responder=_echo_responder),
+                      use_rules=False, incremental=True, chunk_tokens=200)
+
+
+def _flagged_rows(df: pd.DataFrame):
+    return [excel_row(p) for p in range(len(df)) if df["기준급여"].iloc[p] == FLAGGED_SALARY]
+
+
+def test_full_audit_reports_excel_rows_in_every_chunk():
+    df = _roster()
+    agent = _agent()
+    results = agent.audit_data({SHEET: df})
+
+    assert len(agent.llm.prompts) > 2
+    assert sorted(f["row"] for f in results["structured_findings"]) == _flagged_rows(df)
+
+
+@pytest.mark.parametrize("edit", ["modify", "insert_top"])
+def test_unchanged_findings_keep_status(edit):
+    before = _roster()
+    first = _agent().audit_data({SHEET: before})
+
+    after = before.copy()
+    if edit == "modify":
+        after.loc[40, "입사일자"] = 20200101
+    else:
+        top = pd.DataFrame({"사원번호": [999999], "생년월일": [19800101],
+                            "입사일자": [20200101], "기준급여": [3500000]})
+        after = pd.concat([top, before], ignore_index=True)
+
+    agent = _agent()
+    second = agent.audit_data({SHEET: after}, baseline=first["audit_state"])
+
+    assert len(agent.llm.prompts) == 1
+    findings = second["structured_findings"]
+    assert sorted(f["row"] for f in findings) == _flagged_rows(after)
+    assert {f["status"] for f in findings} == {STATUS_UNCHANGED}
+    assert second["resolved_findings"] == []
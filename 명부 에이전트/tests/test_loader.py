@@ -0,0 +1,64 @@
+"""
+ExcelLoader 시트 메타데이터 검증 (dimension 기록을 믿을 수 없는 시트 포함)
+"""
+
+import re
+import zipfile
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from core import loader as loader_module
+from core.loader import ExcelLoader
+
+
+def _write_stale_dimension_workbook(path: Path) -> Path:
+    """구버전 엑셀 변환처럼 dimension이 시트 최대 크기로 기록된 워크북 생성"""
+    source = path.with_name("source.xlsx")
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "재직자 명부"
+    ws.append(["사원번호", "성명", "기준급여"])
+    for i in range(5):
+        ws.append([100001 + i, f"직원{i}", 3000000])
+    ws.cell(row=9, column=4, value="비고")
+    wb.save(source)
+
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:D1048576"', data)
+            dst.writestr(item, data)
+    return path
+
+
+@pytest.fixture
+def stale_workbook(tmp_path):
+    return _write_stale_dimension_workbook(tmp_path / "stale.xlsx")
+
+
+def test_metadata_counts_rows_when_dimension_is_stale(stale_workbook):
+    metadata = ExcelLoader(stale_workbook.parent).get_sheet_metadata(stale_workbook)
+
+    assert metadata["재직자 명부"] == {
+        "rows": 8, "columns": 4, "header": ["사원번호", "성명", "기준급여"], "counted": True
+    }
+
+
+def test_metadata_falls_back_to_row_iteration(stale_workbook, monkeypatch):
+    # 관계 파일에서 시트 XML 경로를 찾지 못해도 행을 읽어서 같은 결과
+    monkeypatch.setattr(loader_module, "read_sheet_paths", lambda archive: {})
+    metadata = ExcelLoader(stale_workbook.parent).get_sheet_metadata(stale_workbook)
+
+    assert metadata["재직자 명부"]["rows"] == 8
+    assert metadata["재직자 명부"]["columns"] == 4
+    assert metadata["재직자 명부"]["counted"] is True
+
+
+def test_sheet_info_matches_loaded_rows(stale_workbook):
+    excel_loader = ExcelLoader(stale_workbook.parent)
+    loaded = excel_loader.load_excel(stale_workbook)
+
+    assert excel_loader.get_sheet_info(stale_workbook) == {name: len(df) for name, df in loaded.items()}
@@ -0,0 +1,81 @@
+"""
+규칙 엔진의 명부 간 사원번호 검증(중복, 재직자/퇴직자 중복, 퇴직자 명부의 중간정산자) 검증
+"""
+
+import pandas as pd
+
+from core.rules import EmployeeIndex, RuleEngine
+
+ACTIVE = "재직자 명부"
+ACTIVE_EXTRA = "재직자 명부 (추가)"
+RETIREE = "퇴직자 명부"
+DC = "DC전환자 명부"
+
+
+def _roster(ids, interim=None) -> pd.DataFrame:
+    rows = len(ids)
+    return pd.DataFrame({
+        "사원번호": ids,
+        "생년월일": ["1980-01-01"] * rows,
+        "입사일자": ["2010-01-01"] * rows,
+        "중간정산일": interim if interim is not None else [None] * rows,
+    })
+
+
+def _workbook():
+    return {
+        ACTIVE: _roster([1001, 1002, 1003, 1002, 1004],
+                        interim=[None, None, "2018-05-01", None, None]),
+        # 정수 사원번호와 문자열 사원번호를 같은 사원으로 비교
+        ACTIVE_EXTRA: _roster(["1005", " 1006 ", "1003"]),
+        RETIREE: _roster([2001, 1001, 1003, 2002, 2001],
+                         interim=[None, None, None, "2019-01-01", None]),
+        DC: _roster([1001, 3001]),
+        "기타": pd.DataFrame({"항목": ["a", "b"]}),
+    }
+
+
+def _rows(findings, rule_id):
+    return sorted((f["sheet"], f["row"]) for f in findings if f["rule_id"] == rule_id)
+
+
+def test_duplicates_in_roster():
+    findings = RuleEngine().run(_workbook())
+
+    assert _rows(findings, "DUP_IN_ROSTER") == [(ACTIVE, 3), (ACTIVE, 5), (RETIREE, 2), (RETIREE, 6)]
+    message = next(f["message"] for f in findings if f["rule_id"] == "DUP_IN_ROSTER")
+    assert "2번" in message and "(행 3, 5)" in message
+
+
+def test_duplicates_across_rosters_reports_each_other_roster():
+    findings = RuleEngine().run(_workbook())
+
+    assert _rows(findings, "DUP_ACROSS_ROSTERS") == sorted([
+        (ACTIVE, 2), (ACTIVE, 2), (ACTIVE, 4),
+        (ACTIVE_EXTRA, 4),
+        (RETIREE, 3), (RETIREE, 4), (RETIREE, 4),
+        (DC, 2),
+    ])
+    messages = [f["message"] for f in findings if f["rule_id"] == "DUP_ACROSS_ROSTERS" and f["row"] == 2
+                and f["sheet"] == ACTIVE]
+    assert [RETIREE in m for m in messages] == [True, False]
+    assert [DC in m for m in messages] == [False, True]
+
+
+def test_interim_in_retirees():
+    findings = RuleEngine().run(_workbook())
+
+    # 퇴직자 행 자체의 중간정산 이력(2002)과 재직자 명부의 중간정산 이력(1003)
+    assert _rows(findings, "INTERIM_IN_RETIREES") == [(RETIREE, 4), (RETIREE, 5)]
+
+
+def test_findings_agree_with_employee_index():
+    findings, index = RuleEngine().run_indexed(_workbook())
+    summary = index.summary()
+
+    for rule_id, name in [("DUP_IN_ROSTER", "duplicated_in_roster"),
+                          ("DUP_ACROSS_ROSTERS", "across_rosters"),
+                          ("INTERIM_IN_RETIREES", "interim_in_retirees")]:
+        employees = {f["employee_id"] for f in findings if f["rule_id"] == rule_id}
+        assert len(employees) == summary[name]
+        assert all(index.classify(employee_id)[name] for employee_id in employees)
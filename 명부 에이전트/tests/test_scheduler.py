@@ -0,0 +1,133 @@
+"""
+RequestScheduler/RateLimiter 검증: 토큰 버킷 예산, Retry-After, 백오프 상한, 우선순위, 429 재시도
+"""
+
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+from core.agent import AuditAgent
+from core.fake_llm import FakeChatModel, FakeRateLimitError, FakeServerError
+from core.ratelimit import RateLimiter, TokenBucket
+from core.scheduler import RequestScheduler, RetryPolicy
+
+
+class StubCall:
+    """프롬프트별로 지정한 횟수만큼 오류를 낸 뒤 응답하는 스케줄러용 호출 함수 (호출 시각 기록)"""
+
+    def __init__(self, failures=None, latency: float = 0.0):
+        self.failures = dict(failures or {})
+        self.latency = latency
+        self.calls = []
+
+    async def __call__(self, prompt: str, **options):
+        self.calls.append((prompt, time.perf_counter()))
+        await asyncio.sleep(self.latency)
+        errors = self.failures.get(prompt)
+        if errors:
+            raise errors.pop(0)
+        return f"응답:{prompt}", 0.0
+
+    def times(self, prompt: str):
+        return [at for name, at in self.calls if name == prompt]
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(6000)  # 초당 100
+    assert bucket.wait_time(6000) == 0.0
+    bucket.consume(6000)
+    assert bucket.wait_time(50) == pytest.approx(0.5, abs=0.05)
+    # 용량보다 큰 요청은 용량만큼만 기다림
+    assert bucket.wait_time(10 ** 6) == pytest.approx(60.0, abs=0.1)
+
+
+def test_rate_limiter_delays_requests_over_token_budget():
+    async def scenario():
+        limiter = RateLimiter(tokens_per_minute=6000)
+        first = await limiter.acquire(6000)
+        second = await limiter.acquire(20)
+        return first, second
+
+    first, second = _run(scenario())
+    assert first == 0.0
+    assert 0.15 <= second < 0.5
+
+
+def test_retry_policy_caps_backoff():
+    policy = RetryPolicy(max_retries=3, base_delay=1.0, max_delay=5.0, seed=0)
+
+    assert 0.5 <= policy.delay(FakeServerError(), 0) <= 1.0
+    assert all(2.5 <= policy.delay(FakeServerError(), attempt) <= 5.0 for attempt in range(3, 10))
+    assert policy.delay(FakeRateLimitError(retry_after=2.0), 0) == 2.0
+    assert policy.delay(FakeRateLimitError(retry_after=120.0), 0) == 5.0
+
+    assert policy.should_retry(FakeRateLimitError(), 2)
+    assert not policy.should_retry(FakeRateLimitError(), 3)
+    assert not policy.should_retry(ValueError("잘못된 요청"), 0)
+
+
+def test_retry_after_pauses_every_request():
+    call = StubCall(failures={"limited": [FakeRateLimitError(retry_after=0.2)]}, latency=0.01)
+
+    async def scenario():
+        async with RequestScheduler(call, max_concurrency=4) as scheduler:
+            first = asyncio.ensure_future(scheduler.submit("limited", 10))
+            await asyncio.sleep(0.05)
+            # 429를 받은 뒤 제출한 요청도 Retry-After가 지날 때까지 보내지 않음
+            others = await asyncio.gather(*(scheduler.submit(f"other{i}", 10) for i in range(3)))
+            return await first, others
+
+    limited, others = _run(scenario())
+    failed_at, retried_at = call.times("limited")
+    resumed = failed_at + 0.01 + 0.2
+
+    assert limited.response == "응답:limited" and limited.retries == 1
+    assert retried_at >= resumed - 0.02
+    assert all(call.times(f"other{i}")[0] >= resumed - 0.02 for i in range(3))
+    assert all(request.error is None for request in others)
+
+
+def test_small_requests_are_dequeued_before_large_chunks():
+    call = StubCall()
+
+    async def scenario():
+        async with RequestScheduler(call, max_concurrency=1) as scheduler:
+            await asyncio.gather(*(scheduler.submit(f"p{i}", tokens)
+                                   for i, tokens in enumerate([5000, 10, 3000, 20])))
+            return scheduler.dispatched
+
+    assert _run(scenario()) == [1, 3, 2, 0]
+
+
+def test_retried_request_is_dequeued_before_new_requests():
+    call = StubCall(failures={"big": [FakeRateLimitError(retry_after=0.01)]}, latency=0.05)
+
+    async def scenario():
+        async with RequestScheduler(call, max_concurrency=1) as scheduler:
+            big = asyncio.ensure_future(scheduler.submit("big", 5000))
+            await asyncio.sleep(0.01)
+            small = [asyncio.ensure_future(scheduler.submit(f"small{i}", 10)) for i in range(2)]
+            await asyncio.gather(big, *small)
+
+    _run(scenario())
+    assert [prompt for prompt, _ in call.calls] == ["big", "big", "small0", "small1"]
+
+
+def test_rate_limited_sheets_succeed_within_max_retries():
+    sheets = {f"시트{i}": pd.DataFrame({"사원번호": range(i * 3 + 2), "값": range(i * 3 + 2)})
+              for i in range(12)}
+    llm = FakeChatModel(latency=0.02, rate_limit_every=3, retry_after=0.02)
+    agent = AuditAgent("test", llm=llm, use_rules=False, max_concurrency=4, max_retries=3)
+
+    results = agent.audit_data(sheets)
+
+    assert llm.rate_limited > 0
+    assert not [entry for entry in results["findings"] if entry.get("error")]
+    # 429 뒤에는 모든 요청이 멈췄다가 재시도 요청을 가장 먼저 보내므로 한 번의 재시도로 성공
+    assert max(call["retries"] for call in results["llm_calls"]) == 1
@@ -0,0 +1,116 @@
+"""
+native 엔진(XlsxReader)과 openpyxl 엔진(pd.read_excel)의 결과 일치 검증
+"""
+
+from datetime import date, datetime, time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from pandas.testing import assert_frame_equal
+
+from core.loader import ExcelLoader
+from core.xlsx_reader import XlsxReader
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DATA_FILES = sorted(DATA_DIR.glob("*.xlsx"))
+
+
+def _assert_sheets_match(file_path: Path) -> None:
+    """파일의 모든 시트에 대해 XlsxReader와 pd.read_excel 결과 비교"""
+    with XlsxReader(file_path) as reader:
+        assert reader.sheet_names == pd.ExcelFile(file_path, engine="openpyxl").sheet_names
+        for sheet_name in reader.sheet_names:
+            expected = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+            assert_frame_equal(reader.read_sheet(sheet_name), expected, obj=sheet_name)
+
+
+def _write_workbook(path: Path, rows, title: str = "명부") -> Path:
+    """행 목록으로 시트 하나짜리 워크북 생성"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = title
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+@pytest.mark.parametrize("file_path", DATA_FILES, ids=lambda p: p.name)
+def test_bundled_workbook_matches_openpyxl(file_path):
+    _assert_sheets_match(file_path)
+
+
+@pytest.mark.parametrize("file_path", DATA_FILES, ids=lambda p: p.name)
+def test_loader_engines_match_on_bundled_workbook(file_path):
+    expected = ExcelLoader(DATA_DIR, engine="openpyxl").load_excel(file_path)
+    actual = ExcelLoader(DATA_DIR, engine="native").load_excel(file_path)
+
+    assert list(actual) == list(expected)
+    for sheet_name, df in expected.items():
+        assert_frame_equal(actual[sheet_name], df, obj=sheet_name)
+
+
+def test_dates(tmp_path):
+    path = _write_workbook(tmp_path / "dates.xlsx", [
+        ["사원번호", "생년월일", "입사일", "기준시각"],
+        [1, datetime(1980, 1, 31), date(2010, 3, 1), time(9, 30)],
+        [2, datetime(1999, 12, 31, 23, 59), None, time(18, 0)],
+        [3, None, date(2024, 2, 29), None],
+    ])
+    _assert_sheets_match(path)
+
+
+def test_mixed_date_and_text_column(tmp_path):
+    path = _write_workbook(tmp_path / "mixed_dates.xlsx", [
+        ["사원번호", "입사일"],
+        [1, datetime(2015, 7, 1)],
+        [2, "20150701"],
+        [3, "미정"],
+        [4, 20150701],
+    ])
+    _assert_sheets_match(path)
+
+
+def test_booleans(tmp_path):
+    path = _write_workbook(tmp_path / "booleans.xlsx", [
+        ["사원번호", "임원여부", "중간정산"],
+        [1, True, False],
+        [2, False, None],
+        [3, None, True],
+    ])
+    _assert_sheets_match(path)
+
+
+def test_missing_values(tmp_path):
+    path = _write_workbook(tmp_path / "na.xlsx", [
+        ["사원번호", "성명", "기준급여", "비고"],
+        [1, "홍길동", 3000000, None],
+        [None, None, None, None],
+        [3, None, 2500000.5, ""],
+        [4, "김철수", None, "N/A"],
+    ])
+    _assert_sheets_match(path)
+
+
+def test_duplicate_and_blank_headers(tmp_path):
+    path = _write_workbook(tmp_path / "headers.xlsx", [
+        ["사원번호", "급여", "급여", None, "급여"],
+        [1, 100, 200, "x", 300],
+        [2, 110, 210, None, 310],
+    ])
+    _assert_sheets_match(path)
+
+
+def test_empty_and_multiple_sheets(tmp_path):
+    path = tmp_path / "sheets.xlsx"
+    wb = Workbook()
+    wb.active.title = "빈 시트"
+    ws = wb.create_sheet("재직자")
+    ws.append(["사원번호", "성명"])
+    ws.append([1, "홍길동"])
+    wb.create_sheet("헤더만").append(["사원번호", "성명"])
+    wb.save(path)
+
+    _assert_sheets_match(path)